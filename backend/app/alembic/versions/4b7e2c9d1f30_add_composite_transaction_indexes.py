@@ -0,0 +1,66 @@
+"""Add composite indexes for account-subtree and date-range filters
+
+Revision ID: 4b7e2c9d1f30
+Revises: 1a31ce608336
+Create Date: 2026-10-19 10:12:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b7e2c9d1f30'
+down_revision = '1a31ce608336'
+branch_labels = None
+depends_on = None
+
+
+# (table, index name, columns, postgresql_ops)
+INDEXES = [
+    ('expense', 'ix_expense_account_date', ['account', 'date'], {'account': 'text_pattern_ops'}),
+    ('expense', 'ix_expense_date_category_subcategory', ['date', 'category', 'subcategory'], {}),
+    ('income', 'ix_income_account_date', ['account', 'date'], {'account': 'text_pattern_ops'}),
+    ('income', 'ix_income_date_origin', ['date', 'origin'], {}),
+]
+
+# Superseded by the composite (account, date) indexes, which also serve
+# equality lookups on the account
+SUPERSEDED = [
+    ('expense', 'ix_expense_account', ['account']),
+    ('income', 'ix_income_account', ['account']),
+]
+
+
+def _existing_indexes(table):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {index['name'] for index in inspector.get_indexes(table)}
+
+
+def upgrade():
+    # The transaction tables are created by init_db() on first start-up, which
+    # already includes these indexes; only pre-existing tables need them.
+    for table, name, columns, ops in INDEXES:
+        existing = _existing_indexes(table)
+        if existing is None or name in existing:
+            continue
+        op.create_index(name, table, columns, unique=False, postgresql_ops=ops)
+
+    for table, name, _ in SUPERSEDED:
+        existing = _existing_indexes(table)
+        if existing and name in existing:
+            op.drop_index(name, table_name=table)
+
+
+def downgrade():
+    for table, name, columns in SUPERSEDED:
+        existing = _existing_indexes(table)
+        if existing is not None and name not in existing:
+            op.create_index(name, table, columns, unique=False)
+
+    for table, name, _, _ in reversed(INDEXES):
+        existing = _existing_indexes(table)
+        if existing and name in existing:
+            op.drop_index(name, table_name=table)
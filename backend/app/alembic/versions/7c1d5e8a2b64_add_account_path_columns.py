@@ -0,0 +1,65 @@
+"""Add a materialized account path column to the transaction tables
+
+Revision ID: 7c1d5e8a2b64
+Revises: 4b7e2c9d1f30
+Create Date: 2026-10-19 11:02:17.540318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c1d5e8a2b64'
+down_revision = '4b7e2c9d1f30'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ['expense', 'income']
+
+# Same expression as app.core.account_paths at the time of this revision
+ACCOUNT_PATH_SQL = "account || ':'"
+
+
+def _existing_columns(table):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {column['name'] for column in inspector.get_columns(table)}
+
+
+def upgrade():
+    # As in 4b7e2c9d1f30, tables created by init_db() already have the column
+    for table in TABLES:
+        existing = _existing_columns(table)
+        if existing is None or 'account_path' in existing:
+            continue
+        op.add_column(
+            table,
+            sa.Column('account_path', sa.Text(), sa.Computed(ACCOUNT_PATH_SQL, persisted=True), nullable=False),
+        )
+        op.drop_index(f'ix_{table}_account_date', table_name=table)
+        op.create_index(
+            f'ix_{table}_account_path_date',
+            table,
+            ['account_path', 'date'],
+            unique=False,
+            postgresql_ops={'account_path': 'text_pattern_ops'},
+        )
+
+
+def downgrade():
+    for table in TABLES:
+        existing = _existing_columns(table)
+        if existing is None or 'account_path' not in existing:
+            continue
+        op.drop_index(f'ix_{table}_account_path_date', table_name=table)
+        op.create_index(
+            f'ix_{table}_account_date',
+            table,
+            ['account', 'date'],
+            unique=False,
+            postgresql_ops={'account': 'text_pattern_ops'},
+        )
+        op.drop_column(table, 'account_path')
@@ -0,0 +1,84 @@
+"""Include the amounts in the date-range transaction indexes
+
+The single-column date indexes are dropped: the composite indexes lead with
+the date and serve the same range scans.
+
+Revision ID: b3f9a1c6d2e7
+Revises: 7c1d5e8a2b64
+Create Date: 2026-10-19 14:21:09.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f9a1c6d2e7'
+down_revision = '7c1d5e8a2b64'
+branch_labels = None
+depends_on = None
+
+
+# (table, index name, columns)
+INDEXES = [
+    ('expense', 'ix_expense_date_category_subcategory', ['date', 'category', 'subcategory']),
+    ('income', 'ix_income_date_origin', ['date', 'origin']),
+]
+
+AMOUNTS = ['amount_ars', 'amount_usd', 'amount_cars']
+
+# Superseded by the composite indexes above, which lead with the date
+SUPERSEDED = [
+    ('expense', 'ix_expense_date', ['date']),
+    ('income', 'ix_income_date', ['date']),
+]
+
+
+def _existing_indexes(table):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {index['name'] for index in inspector.get_indexes(table)}
+
+
+def _included_columns(table, name):
+    """Columns included in an index, or None when the table or index is missing."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    for index in inspector.get_indexes(table):
+        if index['name'] == name:
+            return index.get('include_columns', [])
+    return None
+
+
+def _recreate(table, name, columns, include):
+    op.drop_index(name, table_name=table)
+    op.create_index(name, table, columns, unique=False, postgresql_include=include)
+
+
+def upgrade():
+    # As in 4b7e2c9d1f30, tables created by init_db() already have these indexes
+    for table, name, columns in INDEXES:
+        included = _included_columns(table, name)
+        if included is None or included:
+            continue
+        _recreate(table, name, columns, AMOUNTS)
+
+    for table, name, _ in SUPERSEDED:
+        existing = _existing_indexes(table)
+        if existing and name in existing:
+            op.drop_index(name, table_name=table)
+
+
+def downgrade():
+    for table, name, columns in SUPERSEDED:
+        existing = _existing_indexes(table)
+        if existing is not None and name not in existing:
+            op.create_index(name, table, columns, unique=False)
+
+    for table, name, columns in INDEXES:
+        included = _included_columns(table, name)
+        if not included:
+            continue
+        _recreate(table, name, columns, [])
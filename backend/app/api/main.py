@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.routes import accounts, analytics, items, login, private, transactions, users, utils
+from app.api.routes import accounts, analytics, items, login, private, sync, transactions, users, utils
 from app.core.config import settings
 
 api_router = APIRouter()
@@ -12,6 +12,7 @@ api_router.include_router(transactions.expenses.router)
 api_router.include_router(transactions.income.router)
 api_router.include_router(accounts.router)
 api_router.include_router(analytics.router)
+api_router.include_router(sync.router)
 
 if settings.ENVIRONMENT == "local":
     api_router.include_router(private.router)
@@ -0,0 +1,15 @@
+"""ASGI middleware for the API."""
+
+from .compression import CompressionMiddleware
+from .etag import LedgerETagMiddleware
+from .metrics import RequestMetricsMiddleware
+from .profiling import ProfilingMiddleware
+from .server_timing import ServerTimingMiddleware
+
+__all__ = [
+    "CompressionMiddleware",
+    "LedgerETagMiddleware",
+    "ProfilingMiddleware",
+    "RequestMetricsMiddleware",
+    "ServerTimingMiddleware",
+]
@@ -0,0 +1,307 @@
+"""Response compression negotiated through `Accept-Encoding`.
+
+gzip is always available; brotli (`br`) and zstd are used when the `brotli`
+and `zstandard` packages are installed (the `compression` extra). The server
+prefers encodings in the configured order, among the ones the client accepts.
+
+Only textual responses are compressed: JSON, NDJSON, CSV and the uncompressed
+Arrow IPC stream. Already-compressed formats such as Parquet are sent as they
+are, and so are event streams, which must reach the client one event at a
+time. Complete responses smaller than the minimum size are not worth the CPU.
+Streamed responses are compressed chunk by chunk, each chunk flushed so that
+the client keeps receiving data as it's produced.
+"""
+
+import zlib
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from importlib.util import find_spec
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_COMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/json",
+        "application/x-ndjson",
+        "application/xml",
+        "application/javascript",
+        "application/vnd.apache.arrow.stream",
+    }
+)
+
+
+def is_compressible(content_type: str) -> bool:
+    """Whether a response of this content type benefits from compression."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes:
+        """Return everything compressed so far, keeping the stream open."""
+        ...
+
+    def finish(self) -> bytes:
+        """Return the end of the compressed stream."""
+        ...
+
+
+class _GzipCompressor:
+    def __init__(self, level: int) -> None:
+        # wbits=31 writes the gzip header and trailer around the deflate data
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, level: int) -> None:
+        import brotli
+
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.process(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._compressor.flush())
+
+    def finish(self) -> bytes:
+        return bytes(self._compressor.finish())
+
+
+class _ZstdCompressor:
+    def __init__(self, level: int) -> None:
+        import zstandard
+
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._compressor.compress(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._compressor.flush(self._flush_block))
+
+    def finish(self) -> bytes:
+        return bytes(self._compressor.flush())
+
+
+# Encodings, with the compressor and the package it needs (if any)
+_ENCODINGS: dict[str, tuple[Callable[[int], _Compressor], str | None]] = {
+    "gzip": (_GzipCompressor, None),
+    "br": (_BrotliCompressor, "brotli"),
+    "zstd": (_ZstdCompressor, "zstandard"),
+}
+
+DEFAULT_LEVELS = {"gzip": 6, "br": 4, "zstd": 3}
+
+
+def available_encodings(encodings: Iterable[str]) -> tuple[str, ...]:
+    """Keep the encodings whose package is installed, in the same order.
+
+    Raises:
+        ValueError: If an encoding is not supported
+    """
+    available = []
+    for encoding in encodings:
+        if encoding not in _ENCODINGS:
+            raise ValueError(f"Invalid compression encoding: {encoding}")
+        package = _ENCODINGS[encoding][1]
+        if package is None or find_spec(package) is not None:
+            available.append(encoding)
+    return tuple(available)
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> str | None:
+    """Pick the encoding to respond with.
+
+    The client's quality values rank the encodings first, then the server's
+    order breaks ties. `*` stands for any encoding not listed, and `q=0`
+    rules one out.
+
+    Args:
+        accept_encoding: The request's `Accept-Encoding` header
+        encodings: Encodings the server supports, in order of preference
+    """
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip():
+            qualities[name.strip().lower()] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best: str | None = None
+    best_quality = 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """Compress responses in the best encoding the client accepts.
+
+    Args:
+        app: The wrapped application
+        encodings: Supported encodings, in order of preference. The ones
+            whose package is not installed are skipped.
+        levels: Compression level of each encoding
+        minimum_size: Complete responses smaller than this are sent as is
+        route_levels: Levels overriding `levels` for the paths starting with
+            each prefix. The longest matching prefix wins.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Sequence[str] = ("gzip",),
+        levels: Mapping[str, int] | None = None,
+        minimum_size: int = 1024,
+        route_levels: Mapping[str, Mapping[str, int]] | None = None,
+    ) -> None:
+        self.app = app
+        self.encodings = available_encodings(encodings)
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.minimum_size = minimum_size
+        # Longest prefixes first, so the most specific one is found first
+        self.route_levels = sorted(
+            (route_levels or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def level_for(self, path: str, encoding: str) -> int:
+        """Compression level of an encoding for a path."""
+        for prefix, levels in self.route_levels:
+            if path.startswith(prefix) and encoding in levels:
+                return levels[encoding]
+        return self.levels[encoding]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept_encoding, self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            encoding, self.level_for(scope["path"], encoding), self.minimum_size
+        )
+        await self.app(scope, receive, responder.wrap(send))
+
+
+class _CompressionResponder:
+    """Compress the messages of a single response, as they're sent."""
+
+    def __init__(self, encoding: str, level: int, minimum_size: int) -> None:
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+        self.start_message: Message | None = None
+        self.compressor: _Compressor | None = None
+        self.passthrough = False
+
+    def should_compress(self, headers: Headers, body: bytes, more_body: bool) -> bool:
+        """Decide from the response's start and first body chunk."""
+        assert self.start_message is not None
+        status = self.start_message["status"]
+        if status < 200 or status in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        if not is_compressible(headers.get("content-type", "")):
+            return False
+
+        if not more_body:
+            return len(body) >= self.minimum_size
+        content_length = headers.get("content-length")
+        return content_length is None or int(content_length) >= self.minimum_size
+
+    def wrap(self, send: Send) -> Send:
+        async def send_compressed(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Held back until the first chunk tells whether to compress
+                self.start_message = message
+                return
+            if message["type"] != "http.response.body" or self.passthrough:
+                await send(message)
+                return
+
+            body: bytes = message.get("body", b"")
+            more_body: bool = message.get("more_body", False)
+            if self.compressor is None:
+                assert self.start_message is not None
+                if not self.should_compress(
+                    Headers(raw=self.start_message["headers"]), body, more_body
+                ):
+                    self.passthrough = True
+                    await send(self.start_message)
+                    await send(message)
+                    return
+                self.compressor = self.start_compressing()
+
+            data = self.compressor.compress(body)
+            data += self.compressor.flush() if more_body else self.compressor.finish()
+            if self.start_message is not None:
+                self.update_headers(self.start_message, None if more_body else data)
+                await send(self.start_message)
+                self.start_message = None
+            await send(
+                {"type": "http.response.body", "body": data, "more_body": more_body}
+            )
+
+        return send_compressed
+
+    def start_compressing(self) -> _Compressor:
+        factory = _ENCODINGS[self.encoding][0]
+        return factory(self.level)
+
+    def update_headers(self, message: Message, data: bytes | None) -> None:
+        """Describe the compressed body in the response's headers.
+
+        Args:
+            message: The response's start message
+            data: The whole compressed body, or None when it's streamed
+        """
+        headers = MutableHeaders(scope=message)
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if data is None:
+            del headers["content-length"]
+        else:
+            headers["content-length"] = str(len(data))
+        # The compressed bytes differ from the identity ones, so a strong
+        # ETag can't describe both; a weak one still validates either
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
@@ -0,0 +1,162 @@
+"""Profile a single request on demand, for superusers only.
+
+A request with `?profile=speedscope` (or `folded`), or the same value in an
+`X-Profile` header, runs under the sampling profiler of app/core/profiling.py.
+Conditional headers are dropped, so the route always runs. Its response is
+discarded and the profile is returned instead, with the status the route
+answered in `X-Profiled-Status`:
+
+    curl -H "Authorization: Bearer $TOKEN" \\
+        "$API/accounts/Expenses/balance?profile=speedscope" > balance.json
+
+Other requests only pay for looking up the flag.
+"""
+
+from collections.abc import Callable
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.deps import get_current_active_superuser, get_current_user
+from app.core.db import engine
+from app.core.profiling import SamplingProfiler
+
+PROFILE_FORMATS = ("speedscope", "folded")
+# Dropped from profiled requests, so the route runs instead of a 304
+_CONDITIONAL_HEADERS = (b"if-none-match", b"if-modified-since")
+# Flag values asking for the default format
+_DEFAULT_FORMAT_FLAGS = ("", "1", "true")
+
+
+def requested_format(scope: Scope) -> str | None:
+    """Profile format asked for by the request, None when not profiling.
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    value = Headers(scope=scope).get("x-profile")
+    if value is None:
+        if b"profile" not in scope["query_string"]:
+            return None
+        query = dict(
+            parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True)
+        )
+        value = query.get("profile")
+        if value is None:
+            return None
+
+    value = value.lower()
+    if value in _DEFAULT_FORMAT_FLAGS:
+        return PROFILE_FORMATS[0]
+    if value not in PROFILE_FORMATS:
+        raise ValueError(
+            f"Unknown profile format: {value}; use one of {', '.join(PROFILE_FORMATS)}"
+        )
+    return value
+
+
+def authorize_superuser(authorization: str | None) -> None:
+    """Check the bearer token is an active superuser's, like the API routes do.
+
+    Raises:
+        HTTPException: If it isn't
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=401,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    with Session(engine) as session:
+        get_current_active_superuser(get_current_user(session, token))
+
+
+class ProfilingMiddleware:
+    """Answer profiled requests with their profile instead of their response."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        interval: float = 0.005,
+        authorize: Callable[[str | None], None] = authorize_superuser,
+    ) -> None:
+        self.app = app
+        self.interval = interval
+        self.authorize = authorize
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            profile_format = requested_format(scope)
+        except ValueError as e:
+            await JSONResponse({"detail": str(e)}, status_code=400)(
+                scope, receive, send
+            )
+            return
+        if profile_format is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await run_in_threadpool(
+                self.authorize, Headers(scope=scope).get("authorization")
+            )
+        except HTTPException as e:
+            await JSONResponse(
+                {"detail": e.detail}, status_code=e.status_code, headers=e.headers
+            )(scope, receive, send)
+            return
+
+        status = 500
+
+        async def discard(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        scope = {
+            **scope,
+            "headers": [
+                (name, value)
+                for name, value in scope["headers"]
+                if name not in _CONDITIONAL_HEADERS
+            ],
+        }
+        profiler = SamplingProfiler(self.interval)
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+
+        response = self._profile_response(profiler, profile_format, scope)
+        response.headers["x-profiled-status"] = str(status)
+        await response(scope, receive, send)
+
+    @staticmethod
+    def _profile_response(
+        profiler: SamplingProfiler, profile_format: str, scope: Scope
+    ) -> Response:
+        name = f"{scope['method']} {scope['path']}"
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        # Never stored, so a later request can't be answered with a profile
+        headers = {"cache-control": "no-store"}
+        if profile_format == "folded":
+            headers["content-disposition"] = (
+                f'attachment; filename="profile-{stamp}.folded.txt"'
+            )
+            return PlainTextResponse(profiler.folded(), headers=headers)
+        headers["content-disposition"] = (
+            f'attachment; filename="profile-{stamp}.speedscope.json"'
+        )
+        return JSONResponse(profiler.speedscope(name), headers=headers)
@@ -0,0 +1,49 @@
+"""`Server-Timing` header with the request's database statements and time.
+
+Browsers show the header in their network panel, next to the request:
+
+    Server-Timing: db;dur=12.4;desc="3 statements", app;dur=20.1
+
+`db` is the time spent running statements, `app` the time until the
+response started. Statements run while a streaming response is sent come
+after the header and aren't part of it.
+"""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.query_metrics import QueryStats, track_queries
+
+
+def server_timing(stats: QueryStats, elapsed: float) -> str:
+    """Format the `Server-Timing` header value."""
+    return (
+        f'db;dur={stats.seconds * 1000:.1f};desc="{stats.statements} statements", '
+        f"app;dur={elapsed * 1000:.1f}"
+    )
+
+
+class ServerTimingMiddleware:
+    """Count the statements of each HTTP request and report them."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        with track_queries() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    elapsed = time.perf_counter() - start
+                    headers.append("server-timing", server_timing(stats, elapsed))
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
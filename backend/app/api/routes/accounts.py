@@ -3,23 +3,30 @@
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 
+from app.domains.accounts.domain.errors import AccountNotFoundError
 from app.domains.accounts.domain.models import (
     AccountBalancePublic,
+    AccountHierarchyPublic,
     AccountPublic,
     AccountsPublic,
     AccountTransactionsPublic,
+    AccountTreePublic,
 )
 from app.domains.accounts.domain.options import (
     SearchFilters,
     SearchOptions,
     SearchPagination,
     SearchSorting,
+    SortOrder,
 )
 from app.domains.accounts.service.account_service import provide as provide_account_service
 from app.domains.accounts.usecases import (
+    provide_account_ancestors_usecase,
     provide_account_balance_usecase,
+    provide_account_descendants_usecase,
+    provide_account_hierarchy_usecase,
     provide_account_transactions_usecase,
     provide_children_accounts_usecase,
     provide_parent_account_usecase,
@@ -38,7 +45,7 @@ def get_accounts(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
     sort_by: str = Query("name", description="Field to sort by"),
-    sort_order: str = Query("asc", description="Sort order (asc/desc)"),
+    sort_order: str = Query("asc", pattern="^(asc|desc)$", description="Sort order (asc/desc)"),
 ) -> AccountsPublic:
     """Get all accounts with filtering options."""
     # Build search options
@@ -50,11 +57,12 @@ def get_accounts(
         parent_id=UUID(parent_id) if parent_id else None,
     )
     pagination = SearchPagination(skip=skip, limit=limit)
-    sorting = SearchSorting(field=sort_by, order=sort_order)
-    options = SearchOptions(
-        filters=filters,
-        pagination=pagination,
-        sorting=sorting,
+    sorting = SearchSorting(field=sort_by, order=SortOrder(sort_order))
+    options = (
+        SearchOptions()
+        .with_filters(filters)
+        .with_pagination(pagination)
+        .with_sorting(sorting)
     )
     
     # Use account service to search accounts
@@ -62,13 +70,36 @@ def get_accounts(
     return service.search_accounts(options)
 
 
+@router.get("/tree", response_model=AccountHierarchyPublic)
+def get_account_tree(
+    root: str | None = Query(None, description="Only return the subtree of this account (e.g. Expenses:Food)"),
+    max_depth: int | None = Query(None, ge=1, description="Number of levels to return, counting the first one"),
+    with_balances: bool = Query(False, description="Include each account's balance and totals"),
+) -> AccountHierarchyPublic:
+    """Get the nested account hierarchy in one response.
+
+    Balances include the whole subtree of each account, from the default start
+    date up to the latest transaction.
+    """
+    usecase = provide_account_hierarchy_usecase()
+    try:
+        return usecase.execute(
+            root=root, max_depth=max_depth, with_balances=with_balances
+        )
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.get("/{account_id}/parent", response_model=AccountPublic | None)
 def get_parent_account(
     account_id: UUID,
 ) -> AccountPublic | None:
     """Get parent account of a given account."""
     usecase = provide_parent_account_usecase()
-    return usecase.execute(account_id=account_id)
+    try:
+        return usecase.execute(account_id=account_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.get("/{account_id}/children", response_model=AccountsPublic)
@@ -79,7 +110,32 @@ def get_children_accounts(
 ) -> AccountsPublic:
     """Get all children accounts of a given account."""
     usecase = provide_children_accounts_usecase()
-    return usecase.execute(parent_id=account_id, skip=skip, limit=limit)
+    return usecase.execute(parent_account_id=account_id, skip=skip, limit=limit)
+
+
+@router.get("/{account_id}/descendants", response_model=AccountTreePublic)
+def get_account_descendants(
+    account_id: UUID,
+    max_depth: int | None = Query(None, ge=1, description="Only include descendants up to this many levels below"),
+) -> AccountTreePublic:
+    """Get the whole subtree below an account, in tree order."""
+    usecase = provide_account_descendants_usecase()
+    try:
+        return usecase.execute(account_id=account_id, max_depth=max_depth)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/{account_id}/ancestors", response_model=AccountTreePublic)
+def get_account_ancestors(
+    account_id: UUID,
+) -> AccountTreePublic:
+    """Get the chain of ancestors of an account, root first."""
+    usecase = provide_account_ancestors_usecase()
+    try:
+        return usecase.execute(account_id=account_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
 
 @router.get("/{account_name}/transactions", response_model=AccountTransactionsPublic)
@@ -96,6 +152,7 @@ def get_account_transactions(
     - When providing an account name (e.g., "Assets:Cash"), the system will:
       - Match the exact account ("Assets:Cash")
       - Match all children ("Assets:Cash:Checking", "Assets:Cash:Savings", etc.)
+      - Not match siblings sharing a prefix ("Assets:CashBack")
     """
     usecase = provide_account_transactions_usecase()
     return usecase.execute(
@@ -111,6 +168,7 @@ def get_account_transactions(
 def get_account_balance(
     account_name: str,
     as_of_date: date | None = Query(None, description="Calculate balance as of this date (YYYY-MM-DD)"),
+    depth: int | None = Query(None, ge=1, description="Break the balance down by sub-accounts this many levels below the account"),
 ) -> AccountBalancePublic:
     """Get balance for an account and its children.
     
@@ -118,10 +176,13 @@ def get_account_balance(
     - When providing an account name (e.g., "Assets:Cash"), the system will:
       - Match the exact account ("Assets:Cash")
       - Match all children ("Assets:Cash:Checking", "Assets:Cash:Savings", etc.)
+      - Not match siblings sharing a prefix ("Assets:CashBack")
     - Balance calculation includes all transactions from the beginning of time up to the as_of_date
+    - With `depth`, the balance is also broken down per sub-account at that level
     """
     usecase = provide_account_balance_usecase()
     return usecase.execute(
         account_name=account_name,
         as_of_date=as_of_date,
+        depth=depth,
     )
@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Header
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+from app.api.deps import SessionDep
+from app.core.config import settings
+from app.core.ledger_events import ledger_events
+from app.core.ledger_state import ledger_state
+from app.services.beancount.status import (
+    SyncStatusSnapshot,
+    stored_status,
+    sync_status,
+)
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+def version_event(version: str) -> str:
+    """Format a `version` server-sent event; its id is the version itself."""
+    timestamp = ledger_state.published_at
+    published_at = (
+        datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp else None
+    )
+    data = {"version": version, "published_at": published_at}
+    return f"id: {version}\nevent: version\ndata: {to_json(data).decode()}\n\n"
+
+
+async def version_events(
+    last_event_id: str | None, heartbeat: float
+) -> AsyncGenerator[str, None]:
+    """Stream the current version, unless the client has it, then every new one."""
+    with ledger_events.subscribe() as queue:
+        # Subscribed first, so no version is missed between the two
+        version = ledger_state.version
+        if version is not None and version != last_event_id:
+            yield version_event(version)
+        while True:
+            try:
+                version = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+            yield version_event(version)
+
+
+@router.get("/status")
+def get_sync_status(session: SessionDep) -> SyncStatusSnapshot:
+    """
+    Synced ledger version and the progress of the running sync, if any.
+
+    Cheap enough to poll for freshness: a single row is read, stored by
+    whichever process syncs.
+    """
+    return stored_status(session) or sync_status.snapshot()
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def sync_events(
+    last_event_id: str | None = Header(None),
+) -> StreamingResponse:
+    """
+    Server-sent events announcing every newly synced ledger version.
+
+    A `version` event with the current version is sent on connect, then one
+    per completed sync in any worker. Browsers send the last version back in
+    `Last-Event-ID` when reconnecting, which skips the first event if it is
+    still current. Clients can refetch on each event instead of polling.
+    """
+    return StreamingResponse(
+        version_events(last_event_id, settings.SYNC_EVENTS_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        # Proxies like nginx would otherwise buffer the events
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
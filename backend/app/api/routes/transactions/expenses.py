@@ -2,7 +2,8 @@
 
 from datetime import date
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 
 from app.domains.expenses_transactions.domain.models import (
     ExpensesPublic,
@@ -10,6 +11,7 @@ from app.domains.expenses_transactions.domain.models import (
 )
 from app.domains.expenses_transactions.usecases import (
     provide_expense_summary_usecase,
+    provide_export_expenses_usecase,
     provide_get_expenses_usecase,
 )
 
@@ -23,17 +25,26 @@ def get_expenses(
     category: str | None = Query(None, description="Filter by category"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
-) -> ExpensesPublic:
+    fields: str | None = Query(
+        None,
+        description="Comma-separated fields to return, e.g. 'date,amount_usd' (defaults to all)",
+    ),
+) -> Response:
     """Retrieve expenses with filtering and pagination."""
-    # Delegate to the usecase
+    # The usecase serializes the rows itself; response_model documents the shape
     usecase = provide_get_expenses_usecase()
-    return usecase.execute(
-        from_date=from_date,
-        to_date=to_date,
-        category=category,
-        skip=skip,
-        limit=limit,
-    )
+    try:
+        content = usecase.execute_json(
+            from_date=from_date,
+            to_date=to_date,
+            category=category,
+            skip=skip,
+            limit=limit,
+            fields=fields,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content, media_type="application/json")
 
 
 @router.get("/summary")
@@ -52,3 +63,39 @@ def get_expense_summary(
         to_date=to_date,
         group_by=group_by,
     )
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_expenses(
+    from_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
+    to_date: date | None = Query(None, description="End date (YYYY-MM-DD)"),
+    category: str | None = Query(None, description="Filter by category"),
+    subcategory: str | None = Query(None, description="Filter by subcategory"),
+    account: str | None = Query(
+        None, description="Filter by account, including its sub-accounts"
+    ),
+    export_format: str = Query(
+        "csv",
+        alias="format",
+        description="Export format: 'csv', 'ndjson', 'arrow' (IPC stream) or 'parquet'",
+    ),
+) -> StreamingResponse:
+    """Export every matching expense, oldest first, as a streamed file."""
+    usecase = provide_export_expenses_usecase()
+    try:
+        export = usecase.execute(
+            from_date=from_date,
+            to_date=to_date,
+            category=category,
+            subcategory=subcategory,
+            account=account,
+            export_format=export_format,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        export.chunks,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+    )
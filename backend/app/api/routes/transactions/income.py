@@ -2,10 +2,12 @@
 
 from datetime import date
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 
 from app.domains.income_transactions.domain.models import Incomes, IncomeSummaryResponse
 from app.domains.income_transactions.usecases import (
+    provide_export_incomes_usecase,
     provide_get_income_summary_use_case,
     provide_get_incomes_usecase,
 )
@@ -20,17 +22,26 @@ def get_incomes(
     origin: str | None = Query(None, description="Filter by origin"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
-) -> Incomes:
+    fields: str | None = Query(
+        None,
+        description="Comma-separated fields to return, e.g. 'date,amount_usd' (defaults to all)",
+    ),
+) -> Response:
     """Retrieve income entries with filtering and pagination."""
-    # Delegate to the usecase
+    # The usecase serializes the rows itself; response_model documents the shape
     usecase = provide_get_incomes_usecase()
-    return usecase.execute(
-        from_date=from_date,
-        to_date=to_date,
-        origin=origin,
-        skip=skip,
-        limit=limit,
-    )
+    try:
+        content = usecase.execute_json(
+            from_date=from_date,
+            to_date=to_date,
+            origin=origin,
+            skip=skip,
+            limit=limit,
+            fields=fields,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content, media_type="application/json")
 
 
 @router.get("/summary", response_model=IncomeSummaryResponse)
@@ -47,3 +58,37 @@ def get_income_summary(
         to_date=to_date,
         group_by=group_by,
     )
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_incomes(
+    from_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
+    to_date: date | None = Query(None, description="End date (YYYY-MM-DD)"),
+    origin: str | None = Query(None, description="Filter by origin"),
+    account: str | None = Query(
+        None, description="Filter by account, including its sub-accounts"
+    ),
+    export_format: str = Query(
+        "csv",
+        alias="format",
+        description="Export format: 'csv', 'ndjson', 'arrow' (IPC stream) or 'parquet'",
+    ),
+) -> StreamingResponse:
+    """Export every matching income entry, oldest first, as a streamed file."""
+    usecase = provide_export_incomes_usecase()
+    try:
+        export = usecase.execute(
+            from_date=from_date,
+            to_date=to_date,
+            origin=origin,
+            account=account,
+            export_format=export_format,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        export.chunks,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+    )
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 from pydantic.networks import EmailStr
 
 from app.api.deps import get_current_active_superuser
+from app.core.cache import CacheStats, result_cache
+from app.core.memory import MemoryReport, memory_report
 from app.models import Message
 from app.utils import generate_test_email, send_email
 
@@ -26,6 +28,35 @@ def test_email(email_to: EmailStr) -> Message:
     return Message(message="Test email sent")
 
 
+@router.get(
+    "/cache-stats/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def cache_stats() -> CacheStats:
+    """
+    Hit ratio and approximate memory of the result cache.
+    """
+    return result_cache.stats()
+
+
+@router.get(
+    "/memory/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def memory(
+    request: Request,
+    top: int = Query(10, ge=1, le=100, description="Allocation sites listed"),
+) -> MemoryReport:
+    """
+    Memory of this worker: RSS, the ledger's structures, the caches and, with
+    `TRACEMALLOC_FRAMES`, the allocation sites holding and gaining the most.
+
+    Walks the whole ledger, so it can take seconds on large ones.
+    """
+    sync_service = getattr(request.app.state, "sync_service", None)
+    return memory_report(sync_service.ledger if sync_service else None, top)
+
+
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
@@ -0,0 +1 @@
+"""Benchmarks, run as modules (`python -m app.benchmarks.<name>`)."""
@@ -0,0 +1,327 @@
+"""API latency under load, against a local Postgres.
+
+A ledger is generated (see `ledger_generator`) and the app is booted on it
+with uvicorn, which syncs it into the configured database at startup. The
+hot endpoints are then driven one at a time, by `concurrency` clients each
+sending requests back to back for `duration` seconds. Requests cycle through
+a month-by-month range of parameters, so they don't all hit the same cached
+result.
+
+For every endpoint and concurrency, the latency percentiles, requests per
+second and errors are reported, along with the SQL statements the endpoint
+runs. Statements are counted in-process on uncached requests, so they are
+what a request costs when the result cache misses.
+
+Settings are passed to the server as environment variables, so worker and
+pool sizes can be compared run by run:
+
+    python -m app.benchmarks.api --postings 100000 --workers 4 \\
+        --concurrency 1 8 32 --setting DATABASE_POOL_SIZE=10
+
+The app's startup sync replaces the synced tables, like any restart; run it
+against a scratch database (`--setting POSTGRES_DB=...`) to keep yours.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, NamedTuple, TypedDict
+
+import httpx
+
+from app.benchmarks.ledger_generator import LedgerSpec, generate_ledger
+from app.benchmarks.report import load_results, save_report
+
+API = "/api/v1"
+
+
+class Endpoint(NamedTuple):
+    name: str
+    path: str
+    # Query parameters of each request, used in turn
+    params: list[dict[str, Any]]
+
+
+class EndpointResult(TypedDict):
+    endpoint: str
+    concurrency: int
+    requests: int
+    errors: int
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    statements: int
+
+
+def _months(spec: LedgerSpec) -> list[tuple[date, date]]:
+    """First and last day of every month of the generated ledger."""
+    months = []
+    start = spec.start.replace(day=1)
+    for _ in range(spec.years * 12):
+        end = (start + timedelta(days=32)).replace(day=1)
+        months.append((start, end - timedelta(days=1)))
+        start = end
+    return months
+
+
+def hot_endpoints(spec: LedgerSpec) -> list[Endpoint]:
+    """The endpoints driven, with parameters spanning the ledger's months."""
+    months = _months(spec)
+    ranges = [{"from_date": str(start), "to_date": str(end)} for start, end in months]
+    # Year-long windows ending on each month, as dashboards request them
+    years = [
+        {"from_date": str(months[max(i - 11, 0)][0]), "to_date": str(end)}
+        for i, (_, end) in enumerate(months)
+    ]
+    return [
+        Endpoint("expenses", f"{API}/expenses/", [{**r, "limit": 100} for r in ranges]),
+        Endpoint("expenses_summary", f"{API}/expenses/summary", years),
+        Endpoint("income_summary", f"{API}/income/summary", years),
+        Endpoint(
+            "account_balance",
+            f"{API}/accounts/Expenses/balance",
+            [{"as_of_date": str(end), "depth": 2} for _, end in months],
+        ),
+        Endpoint(
+            "analytics_combined",
+            f"{API}/analytics/combined",
+            [{**r, "currencies": ["USD", "ARS"]} for r in years],
+        ),
+    ]
+
+
+def percentile(latencies: list[float], q: int) -> float:
+    """The q-th percentile of the latencies, in milliseconds."""
+    if len(latencies) < 2:
+        return latencies[0] * 1000 if latencies else 0.0
+    return statistics.quantiles(latencies, n=100, method="inclusive")[q - 1] * 1000
+
+
+async def drive(
+    base_url: str, endpoint: Endpoint, concurrency: int, duration: float
+) -> tuple[list[float], int, float]:
+    """Send requests from `concurrency` clients for `duration` seconds.
+
+    Returns:
+        The latency of each request in seconds, the errors and the elapsed
+        time
+    """
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        start = time.perf_counter()
+        deadline = start + duration
+
+        async def client_loop(offset: int) -> None:
+            nonlocal errors
+            i = offset
+            while time.perf_counter() < deadline:
+                params = endpoint.params[i % len(endpoint.params)]
+                sent = time.perf_counter()
+                try:
+                    response = await client.get(endpoint.path, params=params)
+                except httpx.HTTPError:
+                    # A timeout or dropped connection counts as an error
+                    # instead of ending the run
+                    failed = True
+                else:
+                    failed = response.status_code != 200
+                latencies.append(time.perf_counter() - sent)
+                if failed:
+                    errors += 1
+                i += concurrency
+
+        await asyncio.gather(*(client_loop(n) for n in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed
+
+
+def count_statements(endpoints: list[Endpoint]) -> dict[str, int]:
+    """SQL statements run by an uncached request to each endpoint.
+
+    The app is run in-process without its startup sync, against the data the
+    server synced. The result cache is cleared before every request.
+    """
+    from fastapi.testclient import TestClient
+    from sqlalchemy import Engine, event
+
+    from app.core.cache import result_cache
+    from app.main import app
+
+    statements = 0
+
+    def count(*_args: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    counts = {}
+    client = TestClient(app)
+    event.listen(Engine, "before_cursor_execute", count)
+    try:
+        for endpoint in endpoints:
+            result_cache.clear()
+            statements = 0
+            response = client.get(endpoint.path, params=endpoint.params[-1])
+            response.raise_for_status()
+            counts[endpoint.name] = statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", count)
+    return counts
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+@contextmanager
+def serve(
+    ledger_path: Path, workers: int, env: dict[str, str], startup_timeout: float
+) -> Iterator[str]:
+    """Run the app with uvicorn on a ledger until the block exits."""
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        env={**os.environ, **env, "LEDGER_PATH": str(ledger_path)},
+    )
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if server.poll() is not None:
+                raise RuntimeError("The server exited during startup")
+            try:
+                httpx.get(f"{base_url}{API}/utils/health-check/").raise_for_status()
+                break
+            except httpx.HTTPError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("The server did not start in time")
+                time.sleep(0.5)
+        yield base_url
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def print_result(result: EndpointResult) -> None:
+    print(
+        f"{result['endpoint']:<20} {result['concurrency']:>5} "
+        f"{result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} {result['p99_ms']:>9.1f} "
+        f"{result['requests_per_second']:>9.1f} {result['errors']:>7} "
+        f"{result['statements']:>6}"
+    )
+
+
+def compare(previous: list[EndpointResult], current: list[EndpointResult]) -> None:
+    """Print the change of p95 latency and throughput against a previous run."""
+    before = {(r["endpoint"], r["concurrency"]): r for r in previous}
+    print(f"\n{'endpoint':<20} {'conc':>5} {'p95':>9} {'req/s':>9}")
+    for result in current:
+        old = before.get((result["endpoint"], result["concurrency"]))
+        if old is None or not old["p95_ms"] or not old["requests_per_second"]:
+            continue
+        print(
+            f"{result['endpoint']:<20} {result['concurrency']:>5} "
+            f"{result['p95_ms'] / old['p95_ms'] - 1:>+9.1%} "
+            f"{result['requests_per_second'] / old['requests_per_second'] - 1:>+9.1%}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="API latency under load, against a local Postgres."
+    )
+    parser.add_argument("--postings", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds")
+    parser.add_argument(
+        "--setting",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Setting passed to the app, e.g. DATABASE_POOL_SIZE=10",
+    )
+    parser.add_argument("--startup-timeout", type=float, default=600.0)
+    parser.add_argument("--output", type=Path, default=Path("api-benchmark.json"))
+    parser.add_argument("--compare", type=Path, help="A previous run's JSON file")
+    args = parser.parse_args()
+
+    env = dict(setting.split("=", 1) for setting in args.setting)
+    spec = LedgerSpec(postings=args.postings, seed=args.seed)
+    endpoints = hot_endpoints(spec)
+    results: list[EndpointResult] = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        generate_ledger(Path(directory), spec)
+        with serve(Path(directory), args.workers, env, args.startup_timeout) as url:
+            # The in-process app reads the same settings as the server
+            os.environ.update(env)
+            statements = count_statements(endpoints)
+
+            print(
+                f"{'endpoint':<20} {'conc':>5} {'p50 ms':>9} {'p95 ms':>9} "
+                f"{'p99 ms':>9} {'req/s':>9} {'errors':>7} {'stmts':>6}"
+            )
+            for endpoint in endpoints:
+                for concurrency in args.concurrency:
+                    latencies, errors, elapsed = asyncio.run(
+                        drive(url, endpoint, concurrency, args.duration)
+                    )
+                    result: EndpointResult = {
+                        "endpoint": endpoint.name,
+                        "concurrency": concurrency,
+                        "requests": len(latencies),
+                        "errors": errors,
+                        "requests_per_second": round(len(latencies) / elapsed, 1),
+                        "p50_ms": round(percentile(latencies, 50), 2),
+                        "p95_ms": round(percentile(latencies, 95), 2),
+                        "p99_ms": round(percentile(latencies, 99), 2),
+                        "statements": statements[endpoint.name],
+                    }
+                    print_result(result)
+                    results.append(result)
+
+    save_report(
+        args.output,
+        results,
+        postings=args.postings,
+        seed=args.seed,
+        workers=args.workers,
+        duration=args.duration,
+        settings=env,
+    )
+    if args.compare:
+        compare(load_results(args.compare), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""Generate synthetic beancount ledgers for scale testing.
+
+The ledger is split like a real one: `main.bean` holds the options and
+includes `accounts.bean`, `prices.bean` and one file of transactions per
+year. It has a deep expense account tree, hundreds of payees, tags, and
+expenses paid in USD or ARS. Some of them are paid in USD at the day's
+exchange rate (`@@`), and some are split across several accounts. Daily
+prices convert between USD, ARS and CARS, with the peso losing value over
+time.
+
+The same spec and seed always write the same files, so timings taken on a
+generated ledger can be reproduced.
+
+    python -m app.benchmarks.ledger_generator /tmp/ledger-100k --postings 100000
+"""
+
+import argparse
+import math
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import NamedTuple
+
+CATEGORIES = {
+    "Food": ["Groceries", "Restaurants", "Delivery", "Coffee"],
+    "Home": ["Rent", "Utilities", "Maintenance", "Furniture"],
+    "Transport": ["Fuel", "Public", "Taxi", "Parking"],
+    "Health": ["Insurance", "Pharmacy", "Doctor", "Gym"],
+    "Leisure": ["Movies", "Books", "Games", "Music"],
+    "Shopping": ["Clothing", "Electronics", "Gifts", "Household"],
+    "Services": ["Phone", "Internet", "Streaming", "Banking"],
+    "Education": ["Courses", "Languages", "Supplies", "Tuition"],
+    "Travel": ["Flights", "Lodging", "Tours", "Insurance"],
+    "Taxes": ["Income", "Property", "Stamp", "Fees"],
+}
+# Names of the generated accounts below the subcategories
+LEAF_WORDS = ["North", "South", "East", "West", "Main", "Extra", "Misc", "Other"]
+PAYEE_WORDS = (
+    ["Super", "Casa", "Don", "El", "La", "Gran", "Nuevo", "Centro"],
+    ["Norte", "Sur", "Pampa", "Plata", "Sol", "Rio", "Andes", "Delta", "Luna"],
+)
+TAGS = ["work", "family", "trip", "gift", "shared", "reimbursable", "recurring"]
+# Typical expense, in USD, of each category
+TYPICAL_AMOUNTS = {
+    "Food": 15,
+    "Home": 120,
+    "Transport": 10,
+    "Health": 40,
+    "Leisure": 20,
+    "Shopping": 50,
+    "Services": 25,
+    "Education": 60,
+    "Travel": 200,
+    "Taxes": 80,
+}
+
+FUNDING_ACCOUNTS = {
+    "USD": ["Assets:Bank:Checking", "Liabilities:CreditCard:Visa"],
+    "ARS": ["Assets:Bank:Pesos", "Assets:Cash:Pesos", "Liabilities:CreditCard:Visa"],
+}
+INCOME_ACCOUNTS = [
+    "Income:Salary:Acme",
+    "Income:Freelance:Studio",
+    "Income:Freelance:Agency",
+    "Income:Interest:Bank",
+]
+
+
+@dataclass(frozen=True)
+class LedgerSpec:
+    """Size and shape of a generated ledger.
+
+    Args:
+        postings: Postings to generate, at least; transactions have 2 to 4
+        years: Years of history, one transactions file each
+        start: Date of the first day
+        depth: Levels of the expense tree below `Expenses`, at least 2
+            (category and subcategory)
+        fanout: Children of each account below the subcategories
+        categories: Top-level expense categories, up to 10
+        payees: Distinct payees
+        seed: Seed of the random generator
+    """
+
+    postings: int = 10_000
+    years: int = 3
+    start: date = date(2020, 1, 1)
+    depth: int = 4
+    fanout: int = 3
+    categories: int = 10
+    payees: int = 200
+    seed: int = 0
+
+
+class GeneratedLedger(NamedTuple):
+    """Files and size of a generated ledger."""
+
+    main: Path
+    files: list[Path]
+    transactions: int
+    postings: int
+
+
+def _expense_accounts(spec: LedgerSpec) -> list[str]:
+    """Build the leaves of the expense tree, category by category."""
+    leaves = []
+    for category in list(CATEGORIES)[: spec.categories]:
+        for subcategory in CATEGORIES[category]:
+            level = [f"Expenses:{category}:{subcategory}"]
+            for _ in range(spec.depth - 2):
+                level = [
+                    f"{parent}:{word}"
+                    for parent in level
+                    for word in LEAF_WORDS[: spec.fanout]
+                ]
+            leaves.extend(level)
+    return leaves
+
+
+def _payees(spec: LedgerSpec, rng: random.Random) -> list[str]:
+    first, second = PAYEE_WORDS
+    names = [f"{a} {b}" for a in first for b in second]
+    rng.shuffle(names)
+    # Numbered branches once the word combinations run out
+    return [
+        names[i % len(names)] + (f" {i // len(names) + 1}" if i >= len(names) else "")
+        for i in range(spec.payees)
+    ]
+
+
+def _exchange_rates(days: int, rng: random.Random) -> list[float]:
+    """ARS per USD on each day: a noisy, steadily rising rate."""
+    rates = []
+    rate = 60.0
+    for _ in range(days):
+        rate *= 1 + rng.gauss(0.0015, 0.004)
+        rates.append(rate)
+    return rates
+
+
+def _inflation_index(days: int) -> list[float]:
+    """ARS per constant peso (CARS) on each day."""
+    return [math.exp(0.0012 * day) for day in range(days)]
+
+
+def _write_prices(
+    path: Path, start: date, rates: list[float], index: list[float]
+) -> None:
+    with path.open("w") as f:
+        for day, (rate, inflation) in enumerate(zip(rates, index, strict=True)):
+            on = start + timedelta(days=day)
+            f.write(f"{on} price USD {rate:.4f} ARS\n")
+            f.write(f"{on} price USD {rate / inflation:.4f} CARS\n")
+            f.write(f"{on} price ARS {1 / rate:.8f} USD\n")
+            f.write(f"{on} price ARS {1 / inflation:.8f} CARS\n")
+
+
+def _write_accounts(path: Path, start: date, expense_accounts: list[str]) -> None:
+    accounts = [
+        *sorted(
+            {account for accounts in FUNDING_ACCOUNTS.values() for account in accounts}
+        ),
+        *INCOME_ACCOUNTS,
+        *expense_accounts,
+    ]
+    with path.open("w") as f:
+        for currency in ("USD", "ARS", "CARS"):
+            f.write(f"{start} commodity {currency}\n")
+        for account in accounts:
+            f.write(f"{start} open {account}\n")
+
+
+def _expense(
+    rng: random.Random,
+    on: date,
+    rate: float,
+    payee: str,
+    accounts: list[str],
+) -> tuple[str, int]:
+    """Write an expense transaction, returning it and its posting count."""
+    category = accounts[0].split(":")[1]
+    tags = "".join(f" #{tag}" for tag in rng.sample(TAGS, rng.choice((0, 0, 0, 1, 2))))
+    lines = [f'{on} * "{payee}" "{category} purchase"{tags}']
+
+    currency = rng.choices(("ARS", "USD", "USD@"), weights=(6, 3, 1))[0]
+    total = 0.0
+    for account in accounts:
+        typical = TYPICAL_AMOUNTS[account.split(":")[1]]
+        usd = round(rng.lognormvariate(math.log(typical), 0.6), 2)
+        amount = usd if currency == "USD" else round(usd * rate, 2)
+        total += amount
+        unit = "USD" if currency == "USD" else "ARS"
+        lines.append(f"  {account}  {amount:.2f} {unit}")
+
+    if currency == "USD@":
+        # Paid in dollars at the day's rate, e.g. by a card billed in USD
+        usd_total = round(total / rate, 2)
+        lines.append(f"  Assets:Bank:Checking  {-usd_total:.2f} USD @@ {total:.2f} ARS")
+    else:
+        funding = rng.choice(FUNDING_ACCOUNTS["USD" if currency == "USD" else "ARS"])
+        lines.append(f"  {funding}")
+    return "\n".join(lines) + "\n", len(accounts) + 1
+
+
+def _income(on: date, account: str, amount: float, payee: str) -> str:
+    return (
+        f'{on} * "{payee}" "{account.split(":")[1]} income"\n'
+        f"  {account}  {-amount:.2f} USD\n"
+        f"  Assets:Bank:Checking\n"
+    )
+
+
+def generate_ledger(
+    directory: Path, spec: LedgerSpec = LedgerSpec()
+) -> GeneratedLedger:
+    """Write a ledger of the given spec into a directory.
+
+    Args:
+        directory: Directory to write into, created if needed
+        spec: Size and shape of the ledger
+
+    Returns:
+        The main file, every written file and the ledger's size
+    """
+    if spec.depth < 2:
+        raise ValueError("The expense tree needs at least 2 levels")
+    if not 1 <= spec.fanout <= len(LEAF_WORDS):
+        raise ValueError(f"The fanout must be between 1 and {len(LEAF_WORDS)}")
+
+    rng = random.Random(spec.seed)
+    directory.mkdir(parents=True, exist_ok=True)
+    end = date(spec.start.year + spec.years, spec.start.month, spec.start.day)
+    days = (end - spec.start).days
+
+    expense_accounts = _expense_accounts(spec)
+    # A few accounts get most of the postings, as in real ledgers
+    weights = [1 / (rank + 1) ** 0.7 for rank in range(len(expense_accounts))]
+    rng.shuffle(expense_accounts)
+    payees = _payees(spec, rng)
+    rates = _exchange_rates(days, rng)
+
+    accounts_path = directory / "accounts.bean"
+    prices_path = directory / "prices.bean"
+    _write_accounts(accounts_path, spec.start, sorted(expense_accounts))
+    _write_prices(prices_path, spec.start, rates, _inflation_index(days))
+
+    transactions: list[tuple[date, str]] = []
+    postings = 0
+    # Monthly salary, the rest of the income comes at random
+    month = spec.start.replace(day=1)
+    while month < end:
+        transactions.append((month, _income(month, INCOME_ACCOUNTS[0], 3000, "Acme")))
+        postings += 2
+        month = (month + timedelta(days=32)).replace(day=1)
+
+    while postings < spec.postings:
+        day = rng.randrange(days)
+        on = spec.start + timedelta(days=day)
+        if rng.random() < 0.02:
+            account = rng.choice(INCOME_ACCOUNTS[1:])
+            amount = round(rng.uniform(50, 1500), 2)
+            transactions.append((on, _income(on, account, amount, rng.choice(payees))))
+            postings += 2
+            continue
+
+        splits = rng.choices((1, 2, 3), weights=(85, 12, 3))[0]
+        accounts = rng.choices(expense_accounts, weights=weights, k=splits)
+        text, count = _expense(rng, on, rates[day], rng.choice(payees), accounts)
+        transactions.append((on, text))
+        postings += count
+
+    # Stable sort: same-day transactions keep the order they were drawn in
+    transactions.sort(key=lambda transaction: transaction[0])
+    files = [accounts_path, prices_path]
+    for year in range(spec.start.year, end.year + 1):
+        in_year = [text for on, text in transactions if on.year == year]
+        if not in_year:
+            continue
+        path = directory / f"transactions-{year}.bean"
+        path.write_text("\n".join(in_year))
+        files.append(path)
+
+    main = directory / "main.bean"
+    includes = "".join(f'include "{path.name}"\n' for path in files)
+    main.write_text(f'option "operating_currency" "USD"\n\n{includes}')
+    return GeneratedLedger(main, [main, *files], len(transactions), postings)
+
+
+def main() -> None:
+    defaults = LedgerSpec()
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic beancount ledger for scale testing."
+    )
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--postings", type=int, default=defaults.postings)
+    parser.add_argument("--years", type=int, default=defaults.years)
+    parser.add_argument("--depth", type=int, default=defaults.depth)
+    parser.add_argument("--fanout", type=int, default=defaults.fanout)
+    parser.add_argument("--categories", type=int, default=defaults.categories)
+    parser.add_argument("--payees", type=int, default=defaults.payees)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    spec = LedgerSpec(
+        postings=args.postings,
+        years=args.years,
+        depth=args.depth,
+        fanout=args.fanout,
+        categories=args.categories,
+        payees=args.payees,
+        seed=args.seed,
+    )
+    ledger = generate_ledger(args.directory, spec)
+    print(f"main file:    {ledger.main}")
+    print(f"files:        {len(ledger.files)}")
+    print(f"transactions: {ledger.transactions}")
+    print(f"postings:     {ledger.postings}")
+
+
+if __name__ == "__main__":
+    main()
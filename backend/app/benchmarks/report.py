@@ -0,0 +1,40 @@
+"""Save benchmark results as JSON, to compare them between commits."""
+
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+def git_commit() -> str | None:
+    """Commit the benchmark ran on, if it ran in a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_report(path: Path, results: list[Any], **parameters: Any) -> None:
+    """Write the results with the commit, time and parameters of the run."""
+    report = {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        **parameters,
+        "results": results,
+    }
+    path.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nSaved to {path}")
+
+
+def load_results(path: Path) -> list[Any]:
+    """Read the results of a report saved by `save_report`."""
+    results: list[Any] = json.loads(path.read_text())["results"]
+    return results
@@ -0,0 +1,173 @@
+"""Ledger load and sync throughput across ledger sizes.
+
+For each size, a ledger is generated (see `ledger_generator`) and timed
+stage by stage:
+
+- `load`: `Ledger(...)`, parsing, booking and validating the files
+- `query`: `Ledger.run_query` of the expenses sync query
+- `map`: mapping the query's rows to `Expense` instances
+- `sync_table`: the whole expenses `sync_table`, query and insert included
+
+`sync_table` runs against the configured database inside a transaction that
+is rolled back, so the synced data is left untouched.
+
+Each size runs in a fresh process, so its peak RSS isn't inflated by the
+sizes before it. The peak reported for a stage is the process's peak once the
+stage is done. Results are saved as JSON; pass a previous run to `--compare`
+to see the change of every stage.
+
+    python -m app.benchmarks.sync --postings 10000 100000 --output sync.json
+    python -m app.benchmarks.sync --compare sync.json --output sync-new.json
+"""
+
+import argparse
+import logging
+import multiprocessing
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypedDict
+
+from sqlmodel import Session
+
+from app.benchmarks.ledger_generator import LedgerSpec, generate_ledger
+from app.benchmarks.report import load_results, save_report
+from app.core.db import engine
+from app.core.memory import peak_rss_bytes
+from app.domains.expenses_transactions.domain.models import (
+    Expense,
+    ExpenseMonthlyRollup,
+)
+from app.ledger import Ledger
+from app.services.beancount.sync import EXPENSES_QUERY, BeancountSyncService
+
+
+class StageResult(TypedDict):
+    postings: int
+    stage: str
+    seconds: float
+    rows: int
+    rows_per_second: float
+    peak_rss_mb: float
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MiB."""
+    return peak_rss_bytes() / (1024 * 1024)
+
+
+def best_time(run: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    """Run `repeat` times, returning the best wall time and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _sync_expenses(ledger: Ledger) -> None:
+    """Sync the expenses inside a transaction, rolled back afterwards."""
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        # Commits in sync_table only release a savepoint
+        with Session(connection, join_transaction_mode="create_savepoint") as db:
+            service = BeancountSyncService(ledger, db)
+            service.sync_table(EXPENSES_QUERY, Expense, ExpenseMonthlyRollup)
+        transaction.rollback()
+
+
+def benchmark_size(postings: int, seed: int, repeat: int) -> list[StageResult]:
+    """Time every stage on a generated ledger of `postings` postings."""
+    results: list[StageResult] = []
+
+    def record(stage: str, seconds: float, rows: int) -> None:
+        results.append(
+            {
+                "postings": postings,
+                "stage": stage,
+                "seconds": round(seconds, 4),
+                "rows": rows,
+                "rows_per_second": round(rows / seconds, 1),
+                "peak_rss_mb": round(peak_rss_mb(), 1),
+            }
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        generated = generate_ledger(
+            Path(directory), LedgerSpec(postings=postings, seed=seed)
+        )
+        seconds, ledger = best_time(lambda: Ledger(str(generated.main)), repeat)
+        record("load", seconds, generated.postings)
+
+    seconds, (types, rows) = best_time(lambda: ledger.run_query(EXPENSES_QUERY), repeat)
+    record("query", seconds, len(rows))
+
+    seconds, _ = best_time(
+        lambda: BeancountSyncService._map_rows(types, rows, Expense), repeat
+    )
+    record("map", seconds, len(rows))
+
+    seconds, _ = best_time(lambda: _sync_expenses(ledger), repeat)
+    record("sync_table", seconds, len(rows))
+    return results
+
+
+def _run_size(postings: int, seed: int, repeat: int) -> list[StageResult]:
+    # Keep the sync's per-table logging out of the report
+    logging.disable(logging.INFO)
+    return benchmark_size(postings, seed, repeat)
+
+
+def compare(previous: list[StageResult], current: list[StageResult]) -> None:
+    """Print the change of each stage's wall time against a previous run."""
+    before = {(r["postings"], r["stage"]): r["seconds"] for r in previous}
+    print(
+        f"\n{'postings':>10} {'stage':<12} {'before':>10} {'after':>10} {'change':>8}"
+    )
+    for result in current:
+        key = (result["postings"], result["stage"])
+        if key not in before:
+            continue
+        change = result["seconds"] / before[key] - 1
+        print(
+            f"{result['postings']:>10} {result['stage']:<12} "
+            f"{before[key]:>9.3f}s {result['seconds']:>9.3f}s {change:>+8.1%}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Ledger load and sync throughput across ledger sizes."
+    )
+    parser.add_argument("--postings", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=Path("sync-benchmark.json"))
+    parser.add_argument("--compare", type=Path, help="A previous run's JSON file")
+    args = parser.parse_args()
+
+    results: list[StageResult] = []
+    context = multiprocessing.get_context("spawn")
+    print(
+        f"{'postings':>10} {'stage':<12} {'seconds':>9} {'rows/s':>12} {'peak RSS':>10}"
+    )
+    for postings in args.postings:
+        with context.Pool(1) as pool:
+            size_results = pool.apply(_run_size, (postings, args.seed, args.repeat))
+        for r in size_results:
+            print(
+                f"{r['postings']:>10} {r['stage']:<12} {r['seconds']:>9.3f} "
+                f"{r['rows_per_second']:>12,.0f} {r['peak_rss_mb']:>7.1f} MiB"
+            )
+        results.extend(size_results)
+
+    save_report(args.output, results, seed=args.seed, repeat=args.repeat)
+    if args.compare:
+        compare(load_results(args.compare), results)
+
+
+if __name__ == "__main__":
+    main()
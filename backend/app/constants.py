@@ -2,3 +2,4 @@ from datetime import date
 
 DEFAULT_PAGINATION_LIMIT = 50
 DEFAULT_START_DATE = date(2023, 1, 1)
+SUPPORTED_CURRENCIES = ("ARS", "USD", "CARS")
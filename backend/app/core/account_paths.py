@@ -0,0 +1,54 @@
+"""Materialized account paths.
+
+Ledger accounts are colon-separated names (`Expenses:Food:Groceries`). The
+transaction tables store them twice: as written, and as a materialized path
+with a trailing separator (`Expenses:Food:Groceries:`). Prefix-matching the
+path of an account then selects exactly that account and its descendants, so
+`Expenses:Food` no longer matches `Expenses:FoodTruck`, and the match can use
+a `text_pattern_ops` index.
+"""
+
+from typing import Any
+
+from sqlalchemy import ARRAY, Text, func
+
+ACCOUNT_SEPARATOR = ":"
+
+# Expression for the generated path column
+ACCOUNT_PATH_SQL = f"account || '{ACCOUNT_SEPARATOR}'"
+
+
+def normalize_account(account: str) -> str:
+    """Strip surrounding whitespace and separators from an account name."""
+    return account.strip().strip(ACCOUNT_SEPARATOR)
+
+
+def account_depth(account: str) -> int:
+    """Return the number of segments of an account name."""
+    return len(normalize_account(account).split(ACCOUNT_SEPARATOR))
+
+
+def subtree_pattern(account: str) -> str:
+    """Build the `LIKE` pattern matching the path of an account and its descendants.
+
+    The pattern uses `\\` as escape character, which is the Postgres default.
+    """
+    escaped = (
+        normalize_account(account)
+        .replace("\\", "\\\\")
+        .replace("%", "\\%")
+        .replace("_", "\\_")
+    )
+    return f"{escaped}{ACCOUNT_SEPARATOR}%"
+
+
+def ancestor_at_depth(account_column: Any, depth: int) -> Any:
+    """Build an SQL expression for the ancestor of an account at `depth`.
+
+    Accounts shallower than `depth` are returned unchanged, so grouping by this
+    expression gives an exact per-level breakdown.
+    """
+    segments = func.string_to_array(
+        account_column, ACCOUNT_SEPARATOR, type_=ARRAY(Text)
+    )
+    return func.array_to_string(segments[1:depth], ACCOUNT_SEPARATOR)
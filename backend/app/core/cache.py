@@ -0,0 +1,165 @@
+"""Result cache for read usecases, keyed on the synced ledger version.
+
+Results only change when the sync publishes a new ledger version, so a
+usecase result can be reused for identical arguments until then. Entries are
+evicted least-recently-used once the cache is full, expire after a TTL, and
+are dropped wholesale when a new version is published.
+
+Cached results are shared between requests and must not be mutated.
+"""
+
+import functools
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple, TypedDict, TypeVar
+
+from app.core.config import settings
+from app.core.ledger_state import ledger_state
+
+_T = TypeVar("_T")
+
+
+class CacheStats(TypedDict):
+    """Counters and size of the result cache."""
+
+    version: str | None
+    entries: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    approx_bytes: int
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float
+    size: int
+
+
+def _approx_size(value: Any) -> int:
+    """Approximate the memory held by a cached value by its pickled size."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+class ResultCache:
+    """Size-bounded LRU cache with TTL expiry, keyed by ledger version."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple[Hashable, ...], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_compute(
+        self, namespace: str, arguments: Hashable, compute: Callable[[], _T]
+    ) -> _T:
+        """Return the cached result for the arguments, computing it on a miss.
+
+        Nothing is cached before the first ledger version is published.
+        """
+        version = ledger_state.version
+        if version is None or self.max_entries <= 0:
+            return compute()
+
+        key = (version, namespace, arguments)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.value  # type: ignore[no-any-return]
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+
+        # Computed outside the lock; concurrent misses may compute twice
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def put(self, key: tuple[Hashable, ...], value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        entry = _Entry(value, self._clock() + self.ttl_seconds, _approx_size(value))
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def clear(self, keep_version: str | None = None) -> None:
+        """Drop every entry, except those of `keep_version` if given."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] != keep_version]:
+                self._remove(key)
+
+    def stats(self) -> CacheStats:
+        """Return the cache counters and its approximate size."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return CacheStats(
+                version=ledger_state.version,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+                ttl_seconds=self.ttl_seconds,
+                hits=self._hits,
+                misses=self._misses,
+                hit_ratio=self._hits / lookups if lookups else 0.0,
+                evictions=self._evictions,
+                approx_bytes=self._bytes,
+            )
+
+    def _remove(self, key: tuple[Hashable, ...]) -> None:
+        """Remove an entry; the lock must be held."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+result_cache = ResultCache(
+    settings.RESULT_CACHE_MAX_ENTRIES, settings.RESULT_CACHE_TTL_SECONDS
+)
+# A new version makes every older result stale
+ledger_state.subscribe(lambda version: result_cache.clear(keep_version=version))
+
+
+def cached(namespace: str) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """Cache a usecase method's results in the result cache.
+
+    The method's arguments (excluding `self`) form the key, so they must be
+    hashable and already normalized: pass effective dates rather than None
+    meaning "today", tuples rather than lists.
+    """
+
+    def decorator(method: Callable[..., _T]) -> Callable[..., _T]:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Hashable, **kwargs: Hashable) -> _T:
+            arguments = (args, tuple(sorted(kwargs.items())))
+            return result_cache.get_or_compute(
+                namespace, arguments, lambda: method(self, *args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
@@ -26,6 +26,13 @@ def parse_cors(v: Any) -> list[str] | str:
 
 class Settings(BaseSettings):
     LEDGER_PATH: str = ""  # Path to your Beancount ledger directory
+    # Parse, sync and watch the ledger in a dedicated process rather than in
+    # every API worker, see app/services/beancount/worker.py
+    LEDGER_WORKER: bool = False
+    # Time an API worker waits for a first synced version when none is stored
+    LEDGER_WORKER_STARTUP_TIMEOUT: float = 600
+    # Port the ledger worker serves its sync metrics on, None to not serve them
+    LEDGER_WORKER_METRICS_PORT: int | None = None
     model_config = SettingsConfigDict(
         # Use top level .env file (one level above ./backend/)
         env_file="../.env",
@@ -39,6 +46,45 @@ class Settings(BaseSettings):
     FRONTEND_HOST: str = "http://localhost:5173"
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
 
+    # Results of read endpoints, cached per synced ledger version
+    RESULT_CACHE_MAX_ENTRIES: int = 512  # 0 disables the cache
+    RESULT_CACHE_TTL_SECONDS: int = 60 * 60
+    # Rows fetched from the database at a time while streaming an export
+    EXPORT_BATCH_SIZE: int = 1000
+    # Arrow and Parquet encode a whole batch at once and favour larger ones
+    EXPORT_COLUMNAR_BATCH_SIZE: int = 10000
+    # Queries precomputed after every sync, see app/services/beancount/precompute.py
+    PRECOMPUTE_QUERIES: list[str] = [
+        "current_month",
+        "last_12_months",
+        "year_to_date",
+        "top_level_balances",
+    ]
+
+    # Response encodings in order of preference; br and zstd are skipped
+    # unless the `compression` extra is installed, an empty list disables it
+    COMPRESSION_ENCODINGS: list[str] = ["zstd", "br", "gzip"]
+    COMPRESSION_LEVELS: dict[str, int] = {"gzip": 6, "br": 4, "zstd": 3}
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # Bytes
+
+    # Report each request's statements and database time in `Server-Timing`
+    SERVER_TIMING: bool = True
+    # Statements slower than this are logged, 0 disables the log
+    SLOW_QUERY_MS: int = 500
+    # Also log the plan of slow statements; ORM selects run a second time
+    SLOW_QUERY_EXPLAIN: bool = False
+    # Let superusers profile a request with `?profile=`, see
+    # app/api/middleware/profiling.py
+    REQUEST_PROFILING: bool = True
+    REQUEST_PROFILING_INTERVAL_MS: float = 5
+    # Trace allocations from startup, keeping this many frames each, for
+    # /utils/memory/; tracing slows the app down, 0 disables it
+    TRACEMALLOC_FRAMES: int = 0
+
+    # Comment sent on idle `/sync/events` streams, keeping proxies from
+    # closing them and noticing clients that left
+    SYNC_EVENTS_HEARTBEAT_SECONDS: float = 15
+
     BACKEND_CORS_ORIGINS: Annotated[
         list[AnyUrl] | str, BeforeValidator(parse_cors)
     ] = []
@@ -57,6 +103,10 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    # Connections of the request engine kept open per process, and the extra
+    # ones opened under load
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -1,3 +1,4 @@
+from sqlalchemy import text
 from sqlmodel import Session, SQLModel, create_engine, select
 
 from app import crud
@@ -8,6 +9,9 @@ from app.models import User, UserCreate
 database_url = settings.SQLALCHEMY_DATABASE_URI
 engine = create_engine(database_url.unicode_string())
 
+# Key of the advisory lock held while initializing the database
+INIT_LOCK_KEY = 7_315_601_026
+
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
 # otherwise, SQLModel might fail to initialize relationships properly
@@ -20,16 +24,27 @@ def init_db(session: Session) -> None:
     # the tables un-commenting the next lines
     # from sqlmodel import SQLModel
 
-    # This works because the models are already imported and registered from app.models
-    SQLModel.metadata.create_all(engine)
-
-    user = session.exec(
-        select(User).where(User.email == settings.FIRST_SUPERUSER)
-    ).first()
-    if not user:
-        user_in = UserCreate(
-            email=settings.FIRST_SUPERUSER,
-            password=settings.FIRST_SUPERUSER_PASSWORD,
-            is_superuser=True,
+    # Worker processes start together; one at a time creates the tables and
+    # the first superuser, on a connection of its own
+    with engine.connect() as connection:
+        connection.execute(
+            text("SELECT pg_advisory_lock(:key)"), {"key": INIT_LOCK_KEY}
         )
-        user = crud.create_user(session=session, user_create=user_in)
+        try:
+            # This works because the models are already imported and registered from app.models
+            SQLModel.metadata.create_all(engine)
+
+            user = session.exec(
+                select(User).where(User.email == settings.FIRST_SUPERUSER)
+            ).first()
+            if not user:
+                user_in = UserCreate(
+                    email=settings.FIRST_SUPERUSER,
+                    password=settings.FIRST_SUPERUSER_PASSWORD,
+                    is_superuser=True,
+                )
+                user = crud.create_user(session=session, user_create=user_in)
+        finally:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": INIT_LOCK_KEY}
+            )
@@ -0,0 +1,31 @@
+"""Sparse fieldsets for list responses.
+
+List routes take a `fields` parameter naming the fields each item should
+have (`fields=date,amount_usd`). Only those columns are selected, which
+shrinks the payload and lets narrow queries be answered from an index.
+"""
+
+from collections.abc import Sequence
+
+
+def parse_fields(fields: str | None, available: Sequence[str]) -> tuple[str, ...]:
+    """Parse a comma-separated list of fields into the columns to select.
+
+    Args:
+        fields: Requested fields; all of `available` when empty or None
+        available: Fields of a full item, in response order
+
+    Returns:
+        The requested fields, without duplicates and in response order
+
+    Raises:
+        ValueError: If a field is unknown
+    """
+    if not fields or not fields.strip():
+        return tuple(available)
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested.difference(available)
+    if unknown:
+        raise ValueError(f"Invalid fields: {', '.join(sorted(unknown))}")
+    return tuple(field for field in available if field in requested)
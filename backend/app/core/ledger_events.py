@@ -0,0 +1,64 @@
+"""Fan-out of newly published ledger versions to the open event streams.
+
+Every stream gets a queue on its event loop; versions are put on them from
+whichever thread published, the sync's or the one listening for other
+processes' syncs (see app/services/beancount/notifications.py).
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from app.core.ledger_state import ledger_state
+
+logger = logging.getLogger(__name__)
+
+
+class LedgerEvents:
+    """Queues of the open event streams, fed with every published version."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: set[tuple[asyncio.AbstractEventLoop, asyncio.Queue[str]]] = (
+            set()
+        )
+
+    @property
+    def subscribers(self) -> int:
+        """Streams currently open."""
+        return len(self._subscribers)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue[str]]:
+        """Receive the versions published while the block runs.
+
+        Must be entered from the event loop that reads the queue.
+        """
+        subscriber: tuple[asyncio.AbstractEventLoop, asyncio.Queue[str]] = (
+            asyncio.get_running_loop(),
+            asyncio.Queue(),
+        )
+        with self._lock:
+            self._subscribers.add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+
+    def publish(self, version: str) -> None:
+        """Put `version` on every stream's queue. Safe to call from any thread."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, version)
+            except RuntimeError:
+                # The stream's loop closed without leaving the block
+                logger.debug("Skipped a ledger event stream of a closed loop")
+
+
+ledger_events = LedgerEvents()
+ledger_state.subscribe(ledger_events.publish)
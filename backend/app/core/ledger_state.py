@@ -0,0 +1,84 @@
+"""Version of the ledger data currently synced to the database.
+
+The database only changes when the ledger sync runs, so everything derived
+from it (in-memory indexes, cached responses) can be keyed on the version the
+sync publishes once it has committed.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger(__name__)
+
+
+class LedgerState:
+    """Holds the synced ledger version and notifies subscribers when it changes."""
+
+    def __init__(self) -> None:
+        self._version: str | None = None
+        self._published_at: float | None = None
+        self._lock = threading.Lock()
+        self._subscribers: list[Callable[[str], None]] = []
+        self._staged: ContextVar[str | None] = ContextVar("staged", default=None)
+
+    @property
+    def version(self) -> str | None:
+        """Version of the last completed sync, None before the first one.
+
+        Inside `staged`, the staged version is returned instead.
+        """
+        return self._staged.get() or self._version
+
+    @property
+    def is_staged(self) -> bool:
+        """Whether `version` is a staged one in this context."""
+        return self._staged.get() is not None
+
+    @property
+    def published_at(self) -> float | None:
+        """Unix time the current version was published, None before that."""
+        return self._published_at
+
+    @contextmanager
+    def staged(self, version: str) -> Iterator[None]:
+        """Read `version` as the current one in this context only.
+
+        Lets the sync prepare results for a committed version before
+        publishing it, while other threads keep reading the published one.
+        """
+        token = self._staged.set(version)
+        try:
+            yield
+        finally:
+            self._staged.reset(token)
+
+    def publish(self, version: str) -> None:
+        """Make `version` the current one and notify the subscribers.
+
+        Must only be called once the data of that version is committed.
+        """
+        with self._lock:
+            if version == self._version:
+                return
+            self._version = version
+            self._published_at = time.time()
+            subscribers = list(self._subscribers)
+
+        logger.info(f"Ledger version {version[:12]} published")
+        for subscriber in subscribers:
+            try:
+                subscriber(version)
+            except Exception as e:
+                logger.error(f"Ledger version subscriber failed: {str(e)}")
+
+    def subscribe(self, subscriber: Callable[[str], None]) -> None:
+        """Call `subscriber` with every newly published version."""
+        with self._lock:
+            self._subscribers.append(subscriber)
+
+
+ledger_state = LedgerState()
@@ -0,0 +1,213 @@
+"""Memory held by the process: its RSS, the ledger, the caches and tracemalloc.
+
+Structures are sized by walking every object they reach, each counted once
+(`deep_sizeof`), which takes a while on large ledgers: it's meant for an
+admin asking, not for every scrape. Objects shared between structures, like
+interned account names, count towards each of them.
+
+No price map is held between queries: beanquery builds one from the `Price`
+directives whenever a query converts amounts. Those directives show under
+`Price` in the ledger's entries by type.
+
+With `TRACEMALLOC_FRAMES`, allocations are traced from startup. Each report
+then lists the lines holding the most memory, and the lines that grew the
+most since the previous report; reports taken before and after a few reloads
+point at what a leak keeps.
+"""
+
+import resource
+import sys
+import threading
+import tracemalloc
+from collections.abc import Iterable
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, TypedDict
+
+from app.ledger import Ledger
+
+# Objects not owned by any structure, never walked into
+_SKIPPED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+class StructureSize(TypedDict):
+    count: int
+    bytes: int
+
+
+class LedgerMemory(TypedDict):
+    version: str
+    entries: StructureSize
+    entries_by_type: dict[str, StructureSize]
+    errors: StructureSize
+    options_bytes: int
+
+
+class AllocationSite(TypedDict):
+    location: str
+    bytes: int
+    count: int
+
+
+class TracemallocReport(TypedDict):
+    traced_bytes: int
+    peak_traced_bytes: int
+    top: list[AllocationSite]
+    # Change of each site since the previous report, the largest growth first
+    growth: list[AllocationSite]
+
+
+class MemoryReport(TypedDict):
+    rss_bytes: int | None
+    peak_rss_bytes: int
+    ledger: LedgerMemory | None
+    result_cache_bytes: int
+    account_tree_bytes: int
+    tracemalloc: TracemallocReport | None
+
+
+def _referents(obj: Any) -> Iterable[Any]:
+    if isinstance(obj, dict):
+        yield from obj.keys()
+        yield from obj.values()
+    elif isinstance(obj, list | tuple | set | frozenset):
+        yield from obj
+    else:
+        attributes = getattr(obj, "__dict__", None)
+        if attributes is not None:
+            yield attributes
+        for slot in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot):
+                yield getattr(obj, slot)
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """Bytes of `obj` and every object it reaches, counting each once.
+
+    Pass the same `seen` set to size several structures without counting
+    their shared objects twice.
+    """
+    seen = set() if seen is None else seen
+    size = 0
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, _SKIPPED_TYPES):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        pending.extend(_referents(current))
+    return size
+
+
+def rss_bytes() -> int | None:
+    """Resident set size of this process, None where /proc isn't available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except OSError:
+        return None
+    return pages * resource.getpagesize()
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def ledger_memory(ledger: Ledger) -> LedgerMemory:
+    """Size of the ledger's entries, by directive type, errors and options."""
+    seen: set[int] = set()
+    by_type: dict[str, StructureSize] = {}
+    for entry in ledger.entries:
+        size = by_type.setdefault(type(entry).__name__, {"count": 0, "bytes": 0})
+        size["count"] += 1
+        size["bytes"] += deep_sizeof(entry, seen)
+    # The list itself, its entries already counted
+    entries_bytes = sys.getsizeof(ledger.entries) + sum(
+        size["bytes"] for size in by_type.values()
+    )
+    return LedgerMemory(
+        version=ledger.version,
+        entries=StructureSize(count=len(ledger.entries), bytes=entries_bytes),
+        entries_by_type=dict(
+            sorted(by_type.items(), key=lambda item: item[1]["bytes"], reverse=True)
+        ),
+        errors=StructureSize(
+            count=len(ledger.errors), bytes=deep_sizeof(ledger.errors)
+        ),
+        options_bytes=deep_sizeof(ledger.options),
+    )
+
+
+class TracemallocSnapshots:
+    """Snapshots of the traced allocations, diffed against the previous one."""
+
+    _FILTERS = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._previous: tracemalloc.Snapshot | None = None
+
+    def report(self, top: int) -> TracemallocReport | None:
+        """The `top` sites holding the most memory and growing the most."""
+        if not tracemalloc.is_tracing():
+            return None
+        snapshot = tracemalloc.take_snapshot().filter_traces(self._FILTERS)
+        with self._lock:
+            previous, self._previous = self._previous, snapshot
+
+        traced, peak = tracemalloc.get_traced_memory()
+        growth = []
+        if previous is not None:
+            differences = sorted(
+                snapshot.compare_to(previous, "lineno"),
+                key=lambda stat: stat.size_diff,
+                reverse=True,
+            )
+            growth = [
+                AllocationSite(
+                    location=str(stat.traceback),
+                    bytes=stat.size_diff,
+                    count=stat.count_diff,
+                )
+                for stat in differences[:top]
+                if stat.size_diff > 0
+            ]
+        return TracemallocReport(
+            traced_bytes=traced,
+            peak_traced_bytes=peak,
+            top=[
+                AllocationSite(
+                    location=str(stat.traceback), bytes=stat.size, count=stat.count
+                )
+                for stat in snapshot.statistics("lineno")[:top]
+            ],
+            growth=growth,
+        )
+
+
+tracemalloc_snapshots = TracemallocSnapshots()
+
+
+def memory_report(ledger: Ledger | None, top: int = 10) -> MemoryReport:
+    """Report the process's memory, by structure and by allocation site."""
+    from app.core.cache import result_cache
+    from app.domains.accounts.service.account_tree_service import (
+        provide as provide_account_tree_service,
+    )
+
+    return MemoryReport(
+        rss_bytes=rss_bytes(),
+        peak_rss_bytes=peak_rss_bytes(),
+        ledger=ledger_memory(ledger) if ledger is not None else None,
+        # Pickled sizes, as the cache tracks them
+        result_cache_bytes=result_cache.stats()["approx_bytes"],
+        account_tree_bytes=deep_sizeof(provide_account_tree_service().index),
+        tracemalloc=tracemalloc_snapshots.report(top),
+    )
@@ -0,0 +1,142 @@
+"""Prometheus metrics of the API and the ledger sync, served at `/metrics`.
+
+Durations and counts are recorded where they happen. The state of the result
+cache, the database pool and the synced ledger is read when scraped.
+
+Each worker process keeps its own metrics, so with several workers every
+scrape reports the process that answered it.
+
+A sync falling behind shows as watcher events more recent than the published
+version:
+
+    findash_watcher_last_event_timestamp_seconds
+      > findash_ledger_published_timestamp_seconds + 60
+"""
+
+import time
+from collections.abc import Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+# Ledgers take from under a second to minutes to parse and sync
+_SYNC_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+REQUEST_DURATION = Histogram(
+    "findash_http_request_duration_seconds",
+    "Time to answer an HTTP request, until its last byte was sent",
+    ["method", "route", "status"],
+)
+LEDGER_PARSE_DURATION = Histogram(
+    "findash_ledger_parse_duration_seconds",
+    "Time to load the ledger files: parsing, booking and validation",
+    buckets=_SYNC_BUCKETS,
+)
+SYNC_DURATION = Histogram(
+    "findash_sync_duration_seconds",
+    "Time of a whole sync, every table and the precomputed queries included",
+    buckets=_SYNC_BUCKETS,
+)
+SYNC_TABLE_DURATION = Histogram(
+    "findash_sync_table_duration_seconds",
+    "Time to replace a synced table, its query included",
+    ["table"],
+    buckets=_SYNC_BUCKETS,
+)
+SYNC_ROWS = Counter("findash_sync_rows", "Rows written to the synced tables", ["table"])
+SYNCS = Counter("findash_syncs", "Syncs executed")
+SYNC_ERRORS = Counter("findash_sync_errors", "Syncs that failed")
+WATCHER_EVENTS = Counter(
+    "findash_watcher_events", "Ledger file changes received by the watcher"
+)
+WATCHER_LAST_EVENT = Gauge(
+    "findash_watcher_last_event_timestamp_seconds",
+    "Unix time of the last ledger file change received by the watcher",
+)
+
+
+class _StateCollector(Collector):
+    """Read the cache, pool and ledger state at scrape time."""
+
+    def collect(self) -> Iterator[GaugeMetricFamily | CounterMetricFamily]:
+        from app.core.cache import result_cache
+        from app.core.ledger_events import ledger_events
+        from app.core.ledger_state import ledger_state
+        from app.pkgs.database.provider import engine
+
+        stats = result_cache.stats()
+        hits = CounterMetricFamily(
+            "findash_result_cache_lookups", "Result cache lookups", labels=["result"]
+        )
+        hits.add_metric(["hit"], stats["hits"])
+        hits.add_metric(["miss"], stats["misses"])
+        yield hits
+        yield GaugeMetricFamily(
+            "findash_result_cache_hit_ratio",
+            "Share of result cache lookups that hit",
+            value=stats["hit_ratio"],
+        )
+        yield GaugeMetricFamily(
+            "findash_result_cache_entries",
+            "Results in the cache",
+            value=stats["entries"],
+        )
+
+        pool = engine.pool
+        connections = GaugeMetricFamily(
+            "findash_db_pool_connections",
+            "Connections of the request engine's pool",
+            labels=["state"],
+        )
+        connections.add_metric(["checked_out"], pool.checkedout())  # type: ignore[attr-defined]
+        connections.add_metric(["idle"], pool.checkedin())  # type: ignore[attr-defined]
+        connections.add_metric(["overflow"], max(pool.overflow(), 0))  # type: ignore[attr-defined]
+        yield connections
+        yield GaugeMetricFamily(
+            "findash_db_pool_size",
+            "Connections the pool keeps open",
+            value=pool.size(),  # type: ignore[attr-defined]
+        )
+
+        yield GaugeMetricFamily(
+            "findash_sync_event_streams",
+            "Open /sync/events streams",
+            value=ledger_events.subscribers,
+        )
+
+        version = GaugeMetricFamily(
+            "findash_ledger_version_info",
+            "Version of the synced ledger",
+            labels=["version"],
+        )
+        if ledger_state.version is not None:
+            version.add_metric([ledger_state.version[:12]], 1)
+        yield version
+        published_at = ledger_state.published_at
+        if published_at is not None:
+            yield GaugeMetricFamily(
+                "findash_ledger_published_timestamp_seconds",
+                "Unix time the synced ledger version was published",
+                value=published_at,
+            )
+            yield GaugeMetricFamily(
+                "findash_ledger_age_seconds",
+                "Seconds since the synced ledger version was published",
+                value=time.time() - published_at,
+            )
+
+
+REGISTRY.register(_StateCollector())
+
+
+def render() -> tuple[bytes, str]:
+    """Return the metrics in the Prometheus text format, and its content type."""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
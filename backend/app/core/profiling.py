@@ -0,0 +1,134 @@
+"""Sampling profiler for a single request, with flamegraph-ready output.
+
+A background thread samples the stacks of the event loop's thread and of the
+threadpool running sync routes, every `interval` seconds. Threads waiting for
+work (their innermost frame is in `threading`, `queue` or `selectors`) are
+skipped, so the profile only shows the time spent doing something.
+
+Threads are picked by role rather than by request: requests served by the
+same process at the same time show up in the profile too. Profile on a quiet
+worker, or read the stacks under the profiled route only.
+
+Profiles are exported in two formats:
+
+- `speedscope`: the JSON format of https://www.speedscope.app
+- `folded`: one `outer;inner count` line per stack, as read by
+  `flamegraph.pl`, inferno and speedscope
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+# Name of the threads running sync routes and dependencies
+WORKER_THREAD_NAME = "AnyIO worker thread"
+
+_IDLE_MODULES = ("threading.py", "queue.py", "selectors.py")
+
+Frame = tuple[str, str, int]
+
+
+def _stack(frame: FrameType | None) -> tuple[Frame, ...]:
+    """Frames from the outermost to `frame`, as (function, file, line)."""
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append((code.co_name, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    return tuple(reversed(frames))
+
+
+class SamplingProfiler:
+    """Samples the request threads' stacks between `start` and `stop`."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.samples: Counter[tuple[Frame, ...]] = Counter()
+        self.duration = 0.0
+        self._started = 0.0
+        self._loop_thread = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling; call from the event loop's thread."""
+        self._loop_thread = threading.get_ident()
+        self._stop.clear()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.duration = time.perf_counter() - self._started
+
+    def _threads(self) -> set[int]:
+        workers = {
+            thread.ident
+            for thread in threading.enumerate()
+            if thread.name == WORKER_THREAD_NAME and thread.ident is not None
+        }
+        return workers | {self._loop_thread}
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            threads = self._threads()
+            for ident, frame in sys._current_frames().items():
+                if ident not in threads:
+                    continue
+                if frame.f_code.co_filename.endswith(_IDLE_MODULES):
+                    continue
+                self.samples[_stack(frame)] += 1
+
+    def folded(self) -> str:
+        """Stacks in the folded format, one `outer;inner count` line each."""
+        lines = []
+        for stack, count in self.samples.most_common():
+            names = ";".join(
+                f"{name} ({Path(file).name}:{line})" for name, file, line in stack
+            )
+            lines.append(f"{names} {count}")
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name: str) -> dict[str, Any]:
+        """A speedscope file with the samples, weighted by the interval."""
+        frames: dict[Frame, int] = {}
+        samples = []
+        weights = []
+        for stack, count in self.samples.items():
+            samples.append([frames.setdefault(frame, len(frames)) for frame in stack])
+            weights.append(count * self.interval)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "activeProfileIndex": 0,
+            "exporter": "findash",
+            "shared": {
+                "frames": [
+                    {"name": name, "file": file, "line": line}
+                    for name, file, line in frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
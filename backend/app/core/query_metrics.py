@@ -0,0 +1,140 @@
+"""SQL statement counts and timings, hooked into SQLAlchemy's engine events.
+
+Every statement run through any engine is timed. Inside `track_queries`, the
+statements and their total time are added up, which the `ServerTimingMiddleware`
+does for each request. Statements slower than `SLOW_QUERY_MS` are logged with
+their parameters and, with `SLOW_QUERY_EXPLAIN`, their plan.
+
+`EXPLAIN (ANALYZE, BUFFERS)` runs the statement a second time, so it is only
+used for ORM `select()`s reading tables without locking rows: a slow
+`SELECT pg_advisory_lock(...)` run again would take the lock once more, for
+the session, and a slow `pg_notify` would be sent twice. Other statements get
+a plain `EXPLAIN`, which only plans them. Either way it's meant for debugging
+rather than production.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine, Select, event
+from sqlalchemy.engine import ExecutionContext
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    """Statements run and their total time."""
+
+    statements: int = 0
+    seconds: float = 0.0
+
+
+_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Add up the statements run in this context, threads it starts included.
+
+    Threads started with a copy of the context (like FastAPI's threadpool for
+    sync routes) add to the same stats.
+    """
+    stats = QueryStats()
+    token = _stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _stats.reset(token)
+
+
+# Statements Postgres can plan without running them
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+def _can_analyze(context: ExecutionContext | None) -> bool:
+    """Whether running the statement again is harmless.
+
+    Only ORM `select()`s from tables, without FOR UPDATE: `text()` and
+    FROM-less selects of functions may lock, notify or write.
+    """
+    compiled = context.compiled if context is not None else None
+    construct = compiled.statement if compiled is not None else None
+    return (
+        isinstance(construct, Select)
+        and construct._for_update_arg is None
+        and bool(construct.get_final_froms())
+    )
+
+
+def _explain(cursor: Any, statement: str, parameters: Any, analyze: bool) -> str:
+    """Plan the statement, running it again under ANALYZE if `analyze`.
+
+    A savepoint keeps a failing EXPLAIN from aborting the transaction.
+    """
+    options = "(ANALYZE, BUFFERS) " if analyze else ""
+    with cursor.connection.cursor() as explain:
+        explain.execute("SAVEPOINT explain_slow_query")
+        try:
+            explain.execute(f"EXPLAIN {options}{statement}", parameters)
+            plan = "\n".join(row[0] for row in explain.fetchall())
+        except Exception:
+            explain.execute("ROLLBACK TO SAVEPOINT explain_slow_query")
+            raise
+        explain.execute("RELEASE SAVEPOINT explain_slow_query")
+    return plan
+
+
+def _before_cursor_execute(
+    conn: Any, _cursor: Any, _statement: str, _parameters: Any, *_args: Any
+) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = _stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += elapsed
+
+    if not settings.SLOW_QUERY_MS or elapsed * 1000 < settings.SLOW_QUERY_MS:
+        return
+    logger.warning(
+        f"Slow query ({elapsed * 1000:.1f} ms): {statement} parameters={parameters!r}"
+    )
+    if (
+        settings.SLOW_QUERY_EXPLAIN
+        and not executemany
+        and statement.lstrip().upper().startswith(_EXPLAINABLE)
+    ):
+        analyze = _can_analyze(context)
+        try:
+            plan = _explain(cursor, statement, parameters, analyze)
+            logger.warning(f"Plan of the slow query:\n{plan}")
+        except Exception as e:
+            logger.error(f"Explaining the slow query failed: {str(e)}")
+
+
+def instrument_queries() -> None:
+    """Time the statements of every engine. Safe to call more than once."""
+    for name, listener in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+    ):
+        if not event.contains(Engine, name, listener):
+            event.listen(Engine, name, listener)
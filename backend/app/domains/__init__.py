@@ -15,6 +15,10 @@ Users should import directly from the specific domain modules they need:
 - app.domains.accounts.repository: Account repository
 - app.domains.accounts.service: Account service
 
+- app.domains.analytics.domain: Analytics models and bucket options
+- app.domains.analytics.repository: Cross-domain aggregation repository
+- app.domains.analytics.service: Analytics service
+
 Each repository and service module provides a `Provide()` function that returns
 an idempotent instance with all dependencies resolved.
 """
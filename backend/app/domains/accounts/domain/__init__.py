@@ -1,14 +1,30 @@
 """Accounts domain models and types."""
 
 from .errors import AccountNotFoundError, InvalidAccountDataError
-from .models import Account, AccountBase, AccountCreate, AccountPublic, AccountsPublic
+from .models import (
+    Account,
+    AccountBase,
+    AccountClosure,
+    AccountCreate,
+    AccountHierarchyNodePublic,
+    AccountHierarchyPublic,
+    AccountPublic,
+    AccountsPublic,
+    AccountTreeNodePublic,
+    AccountTreePublic,
+)
 
 __all__ = [
     "AccountBase",
     "AccountCreate",
     "Account",
+    "AccountClosure",
+    "AccountHierarchyNodePublic",
+    "AccountHierarchyPublic",
     "AccountPublic",
     "AccountsPublic",
+    "AccountTreeNodePublic",
+    "AccountTreePublic",
     "AccountNotFoundError",
     "InvalidAccountDataError",
 ]
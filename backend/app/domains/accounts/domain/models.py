@@ -1,8 +1,10 @@
 """Account domain models."""
 
 import uuid
-from typing import Optional
+from typing import Annotated, Optional
 
+from pydantic import WithJsonSchema
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.domains.expenses_transactions.domain.models import ExpensePublic
@@ -40,12 +42,36 @@ class Account(AccountBase, table=True):
     children: list["Account"] = Relationship(back_populates="parent")
 
 
+class AccountClosure(SQLModel, table=True):
+    """Ancestor/descendant pairs of the account tree, maintained by the ledger sync.
+
+    Every account is paired with itself (depth 0) and with each of its
+    ancestors, so a whole subtree or ancestor chain is a single indexed lookup.
+    """
+
+    __tablename__ = "account_closure"
+    __table_args__ = (
+        # Ancestor chains; subtrees are served by the primary key
+        Index("ix_account_closure_descendant_id_depth", "descendant_id", "depth"),
+    )
+
+    ancestor_id: uuid.UUID = Field(foreign_key="account.id", primary_key=True)
+    descendant_id: uuid.UUID = Field(foreign_key="account.id", primary_key=True)
+    depth: int
+
+
 class AccountPublic(AccountBase):
     """Public model for accounts."""
 
     id: uuid.UUID
 
 
+class AccountTreeNodePublic(AccountPublic):
+    """Public model for an account within a subtree or ancestor chain."""
+
+    depth: int
+
+
 class AccountsPublic(SQLModel):
     """Response model for paginated accounts."""
 
@@ -54,6 +80,14 @@ class AccountsPublic(SQLModel):
     pagination: dict[str, int] | None = None
 
 
+class AccountTreePublic(SQLModel):
+    """Response model for the descendants or ancestors of an account."""
+
+    account: AccountPublic
+    data: list[AccountTreeNodePublic]
+    count: int
+
+
 class AccountTransactionSummary(SQLModel):
     """Summary of account transactions."""
 
@@ -92,6 +126,15 @@ class AccountBalanceDetails(SQLModel):
     expenses: AccountTransactionSummary
 
 
+class AccountBalanceBreakdown(SQLModel):
+    """Balance of a sub-account within an account balance."""
+
+    account_name: str
+    balance: AccountBalanceSummary
+    totals: AccountBalanceDetails
+    transaction_count: int
+
+
 class AccountBalancePublic(SQLModel):
     """Response model for account balance."""
 
@@ -100,4 +143,34 @@ class AccountBalancePublic(SQLModel):
     balance: AccountBalanceSummary
     totals: AccountBalanceDetails
     transaction_count: int
+    breakdown: list[AccountBalanceBreakdown] | None = None
     pagination: dict[str, int] | None = None
+
+
+class AccountHierarchyNodePublic(SQLModel):
+    """An account and its nested sub-accounts in the account hierarchy."""
+
+    name: str
+    depth: int
+    account: AccountPublic | None = None
+    balance: AccountBalanceSummary | None = None
+    totals: AccountBalanceDetails | None = None
+    # Documented as plain objects: the MCP server inlines every schema reference
+    # and cannot handle a self-referencing one
+    children: Annotated[
+        list["AccountHierarchyNodePublic"],
+        WithJsonSchema(
+            {
+                "type": "array",
+                "items": {"type": "object"},
+                "description": "Sub-accounts, with the same fields as their parent",
+            }
+        ),
+    ] = []
+
+
+class AccountHierarchyPublic(SQLModel):
+    """Response model for the nested account hierarchy."""
+
+    data: list[AccountHierarchyNodePublic]
+    count: int
@@ -0,0 +1,181 @@
+"""In-memory account tree with pre-summed subtree totals."""
+
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+from app.core.account_paths import ACCOUNT_SEPARATOR, normalize_account
+from app.domains.accounts.domain.models import (
+    Account,
+    AccountPublic,
+    AccountTransactionSummary,
+)
+
+
+def empty_summary() -> AccountTransactionSummary:
+    """Return a summary with no transactions."""
+    return AccountTransactionSummary(
+        amount_ars=0.0, amount_usd=0.0, amount_cars=0.0, count=0
+    )
+
+
+def add_summaries(*summaries: AccountTransactionSummary) -> AccountTransactionSummary:
+    """Add transaction summaries together into a new one."""
+    total = empty_summary()
+    for summary in summaries:
+        total.amount_ars += summary.amount_ars
+        total.amount_usd += summary.amount_usd
+        total.amount_cars += summary.amount_cars
+        total.count += summary.count
+    return total
+
+
+@dataclass
+class AccountTreeNode:
+    """An account in the tree, with its own and its subtree's totals.
+
+    Nodes are shared between requests and must be treated as read-only.
+    """
+
+    name: str
+    depth: int
+    account: AccountPublic | None = None
+    children: list["AccountTreeNode"] = field(default_factory=list)
+    own_income: AccountTransactionSummary = field(default_factory=empty_summary)
+    own_expenses: AccountTransactionSummary = field(default_factory=empty_summary)
+    income: AccountTransactionSummary = field(default_factory=empty_summary)
+    expenses: AccountTransactionSummary = field(default_factory=empty_summary)
+
+    def walk(self, max_depth: int | None = None) -> Iterator["AccountTreeNode"]:
+        """Yield the node and its descendants in tree order.
+
+        Args:
+            max_depth: Stop this many levels below the node
+        """
+        yield self
+        if max_depth is None or max_depth > 0:
+            for child in self.children:
+                yield from child.walk(None if max_depth is None else max_depth - 1)
+
+
+class AccountTreeIndex:
+    """The account tree of one ledger version, with totals summed bottom-up.
+
+    The totals cover the transactions dated from `since` on. The index is
+    immutable once built; a new one is built for every ledger version.
+    """
+
+    def __init__(
+        self,
+        version: str | None,
+        since: date,
+        nodes: dict[str, AccountTreeNode],
+        last_date: date | None,
+    ) -> None:
+        self.version = version
+        self.since = since
+        self.last_date = last_date
+        self._nodes = nodes
+        self._by_id = {node.account.id: node for node in nodes.values() if node.account}
+        self.roots = sorted(
+            (node for node in nodes.values() if node.depth == 1),
+            key=lambda node: node.name,
+        )
+
+    @classmethod
+    def build(
+        cls,
+        version: str | None,
+        since: date,
+        accounts: Iterable[Account],
+        income_rows: Iterable[tuple[Any, ...]],
+        expense_rows: Iterable[tuple[Any, ...]],
+    ) -> "AccountTreeIndex":
+        """Build the index from the accounts and their per-account totals.
+
+        Args:
+            version: Ledger version the data belongs to
+            since: Date the totals start from
+            accounts: Accounts synced from the ledger
+            income_rows: Income totals per account (excluding descendants)
+            expense_rows: Expense totals per account (excluding descendants)
+        """
+        nodes: dict[str, AccountTreeNode] = {}
+
+        def node_for(name: str) -> AccountTreeNode:
+            """Get the node of an account, creating it and its ancestors."""
+            node = nodes.get(name)
+            if node is None:
+                segments = name.split(ACCOUNT_SEPARATOR)
+                node = nodes[name] = AccountTreeNode(name=name, depth=len(segments))
+                if len(segments) > 1:
+                    parent = node_for(ACCOUNT_SEPARATOR.join(segments[:-1]))
+                    parent.children.append(node)
+            return node
+
+        for account in accounts:
+            node_for(account.name).account = AccountPublic.model_validate(account)
+
+        last_dates = []
+        for rows, attribute in (
+            (income_rows, "own_income"),
+            (expense_rows, "own_expenses"),
+        ):
+            for name, amount_ars, amount_usd, amount_cars, count, last in rows:
+                summary = AccountTransactionSummary(
+                    amount_ars=amount_ars,
+                    amount_usd=amount_usd,
+                    amount_cars=amount_cars,
+                    count=count,
+                )
+                setattr(node_for(name), attribute, summary)
+                last_dates.append(last)
+
+        # Deepest first, so every child is summed before its parent
+        for node in sorted(nodes.values(), key=lambda node: -node.depth):
+            node.children.sort(key=lambda child: child.name)
+            node.income = add_summaries(
+                node.own_income, *(child.income for child in node.children)
+            )
+            node.expenses = add_summaries(
+                node.own_expenses, *(child.expenses for child in node.children)
+            )
+
+        return cls(version, since, nodes, max(last_dates, default=None))
+
+    def get(self, name: str) -> AccountTreeNode | None:
+        """Get the node of an account by name."""
+        return self._nodes.get(normalize_account(name))
+
+    def get_by_id(self, account_id: uuid.UUID) -> AccountTreeNode | None:
+        """Get the node of an account by ID."""
+        return self._by_id.get(account_id)
+
+    def covers(self, from_date: date, to_date: date) -> bool:
+        """Whether the totals equal those of the `[from_date, to_date)` range."""
+        return from_date == self.since and (
+            self.last_date is None or to_date > self.last_date
+        )
+
+    def breakdown(
+        self, node: AccountTreeNode, depth: int
+    ) -> list[tuple[str, AccountTransactionSummary, AccountTransactionSummary]]:
+        """Split a node's totals among its sub-accounts `depth` levels below.
+
+        Nodes above that level contribute their own transactions under their
+        own name, matching a `GROUP BY` on the ancestor at that depth.
+
+        Returns:
+            `(account, income, expenses)` tuples ordered by account name
+        """
+        parts = []
+        for descendant in node.walk(depth):
+            if descendant.depth - node.depth == depth:
+                income, expenses = descendant.income, descendant.expenses
+            else:
+                income, expenses = descendant.own_income, descendant.own_expenses
+            if income.count or expenses.count:
+                parts.append((descendant.name, income, expenses))
+        return sorted(parts, key=lambda part: part[0])
@@ -6,11 +6,15 @@ from collections.abc import Generator
 from functools import lru_cache
 from typing import Any
 
-from sqlmodel import Session, func, select
+from sqlmodel import Session, col, func, select
 from sqlmodel.sql.expression import SelectOfScalar
 
 from app.domains.accounts.domain.errors import AccountNotFoundError
-from app.domains.accounts.domain.models import Account, AccountCreate
+from app.domains.accounts.domain.models import (
+    Account,
+    AccountClosure,
+    AccountCreate,
+)
 from app.domains.accounts.domain.options import SearchOptions
 from app.domains.accounts.repository.builders.search import build_options
 from app.pkgs.database import get_db_session
@@ -52,6 +56,11 @@ class AccountRepository:
         result = self.db_session.exec(query.offset(skip).limit(limit))
         return list(result)
 
+    def list_all(self) -> builtins.list[Account]:
+        """List every account, ordered by name."""
+        result = self.db_session.exec(select(Account).order_by(Account.name))
+        return list(result)
+
     def count(self, options: SearchOptions | None = None) -> int:
         """Count accounts with optional filtering."""
         query: SelectOfScalar[Account] = select(Account)
@@ -106,6 +115,51 @@ class AccountRepository:
 
         return accounts, count
 
+    def descendants(
+        self, account_id: uuid.UUID, max_depth: int | None = None
+    ) -> builtins.list[tuple[Account, int]]:
+        """List the descendants of an account in a single closure-table query.
+
+        Args:
+            account_id: ID of the subtree's root account
+            max_depth: Only include descendants up to this many levels below
+
+        Returns:
+            The descendants and their depth below the account, in tree order
+        """
+        query = (
+            select(Account, AccountClosure.depth)
+            .join(AccountClosure, col(AccountClosure.descendant_id) == Account.id)
+            .where(AccountClosure.ancestor_id == account_id, AccountClosure.depth > 0)
+        )
+        if max_depth is not None:
+            query = query.where(AccountClosure.depth <= max_depth)
+
+        # By path segment, so every subtree comes before the siblings sharing
+        # its prefix, like "Expenses:Food-Delivery" after "Expenses:Food:..."
+        path = func.string_to_array(Account.name, ":")
+        result = self.db_session.exec(query.order_by(path))
+        return list(result)
+
+    def ancestors(self, account_id: uuid.UUID) -> builtins.list[tuple[Account, int]]:
+        """List the ancestors of an account in a single closure-table query.
+
+        Args:
+            account_id: ID of the account
+
+        Returns:
+            The ancestors and their depth above the account, root first
+        """
+        query = (
+            select(Account, AccountClosure.depth)
+            .join(AccountClosure, col(AccountClosure.ancestor_id) == Account.id)
+            .where(AccountClosure.descendant_id == account_id, AccountClosure.depth > 0)
+            .order_by(col(AccountClosure.depth).desc())
+        )
+
+        result = self.db_session.exec(query)
+        return list(result)
+
 
 @lru_cache
 def provide() -> AccountRepository:
@@ -1,5 +1,12 @@
 """Account service."""
 
 from .account_service import AccountService, provide
+from .account_tree_service import AccountTreeService
+from .account_tree_service import provide as provide_account_tree_service
 
-__all__ = ["AccountService", "provide"]
+__all__ = [
+    "AccountService",
+    "AccountTreeService",
+    "provide",
+    "provide_account_tree_service",
+]
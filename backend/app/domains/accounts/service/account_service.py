@@ -8,6 +8,8 @@ from app.domains.accounts.domain.models import (
     AccountCreate,
     AccountPublic,
     AccountsPublic,
+    AccountTreeNodePublic,
+    AccountTreePublic,
 )
 from app.domains.accounts.domain.options import SearchOptions
 from app.domains.accounts.repository import provide_account_repository
@@ -79,6 +81,44 @@ class AccountService:
             },
         )
 
+    def get_descendants(
+        self, account_id: uuid.UUID, max_depth: int | None = None
+    ) -> AccountTreePublic:
+        """Get the subtree below an account.
+
+        Args:
+            account_id: ID of the subtree's root account
+            max_depth: Only include descendants up to this many levels below
+
+        Returns:
+            AccountTreePublic: The account and its descendants, in tree order
+        """
+        account = self.get_account(account_id)
+        descendants = self.account_repository.descendants(account_id, max_depth)
+        return _tree(account, descendants)
+
+    def get_ancestors(self, account_id: uuid.UUID) -> AccountTreePublic:
+        """Get the chain of ancestors of an account.
+
+        Args:
+            account_id: ID of the account
+
+        Returns:
+            AccountTreePublic: The account and its ancestors, root first
+        """
+        account = self.get_account(account_id)
+        ancestors = self.account_repository.ancestors(account_id)
+        return _tree(account, ancestors)
+
+
+def _tree(account: AccountPublic, nodes: list[tuple[Any, int]]) -> AccountTreePublic:
+    """Build a tree response from `(account, depth)` rows."""
+    data = [
+        AccountTreeNodePublic.model_validate(node, update={"depth": depth})
+        for node, depth in nodes
+    ]
+    return AccountTreePublic(account=account, data=data, count=len(data))
+
 
 @lru_cache
 def provide() -> AccountService:
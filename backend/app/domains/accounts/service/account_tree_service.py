@@ -0,0 +1,116 @@
+"""Account tree service implementation."""
+
+import threading
+from functools import lru_cache
+
+from app.constants import DEFAULT_START_DATE
+from app.core.ledger_state import ledger_state
+from app.domains.accounts.domain.tree import AccountTreeIndex
+from app.domains.accounts.repository import provide_account_repository
+from app.domains.accounts.repository.account_repository import (
+    AccountRepository,
+)
+from app.domains.expenses_transactions.domain import options as expense_opts
+from app.domains.expenses_transactions.service import (
+    ExpenseService,
+    provide_expense_service,
+)
+from app.domains.income_transactions.domain import options as income_opts
+from app.domains.income_transactions.service import (
+    IncomeService,
+    provide_income_service,
+)
+
+
+class AccountTreeService:
+    """Service keeping an in-memory account tree for the current ledger version.
+
+    The tree is built on first use and rebuilt once per ledger version. A new
+    index replaces the old one in a single assignment, so readers always see a
+    complete tree.
+
+    A tree built for a staged version (while the sync precomputes results) is
+    kept aside and only replaces the current one once that version is
+    published, so requests still reading the published version keep theirs.
+    """
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        expense_service: ExpenseService,
+        income_service: IncomeService,
+    ) -> None:
+        """Initialize the service with the repositories the tree is built from."""
+        self.account_repository = account_repository
+        self.expense_service = expense_service
+        self.income_service = income_service
+        self._index: AccountTreeIndex | None = None
+        self._staged_index: AccountTreeIndex | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> AccountTreeIndex | None:
+        """The tree built last, None until first use or once invalidated."""
+        return self._index
+
+    def get_index(self) -> AccountTreeIndex:
+        """Get the account tree of the current ledger version."""
+        version = ledger_state.version
+        staged = ledger_state.is_staged
+        index = self._staged_index if staged else self._index
+        if index is not None and index.version == version:
+            return index
+
+        with self._lock:
+            index = self._staged_index if staged else self._index
+            if index is None or index.version != version:
+                index = self._build(version)
+                if staged:
+                    self._staged_index = index
+                else:
+                    self._index = index
+        return index
+
+    def invalidate(self, version: str | None = None) -> None:
+        """Drop the current tree unless it was already built for `version`.
+
+        A tree staged for `version` becomes the current one instead. The next
+        call to `get_index` rebuilds a dropped tree.
+        """
+        with self._lock:
+            staged, self._staged_index = self._staged_index, None
+            if staged is not None and version is not None and staged.version == version:
+                self._index = staged
+                return
+        index = self._index
+        if index is None or version is None or index.version != version:
+            self._index = None
+
+    def _build(self, version: str | None) -> AccountTreeIndex:
+        """Load the accounts and their totals and build a new index."""
+        accounts = self.account_repository.list_all()
+        income_rows = self.income_service.get_totals_by_account(
+            income_opts.SearchFilters(from_date=DEFAULT_START_DATE)
+        )
+        expense_rows = self.expense_service.get_totals_by_account(
+            expense_opts.SearchFilters(from_date=DEFAULT_START_DATE)
+        )
+        return AccountTreeIndex.build(
+            version, DEFAULT_START_DATE, accounts, income_rows, expense_rows
+        )
+
+
+@lru_cache
+def provide() -> AccountTreeService:
+    """Provide the AccountTreeService shared by all requests.
+
+    Returns:
+        AccountTreeService: The instance holding the account tree.
+    """
+    service = AccountTreeService(
+        provide_account_repository(),
+        provide_expense_service(),
+        provide_income_service(),
+    )
+    ledger_state.subscribe(service.invalidate)
+    return service
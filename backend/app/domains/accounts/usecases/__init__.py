@@ -1,8 +1,17 @@
 """Usecases for accounts."""
 
+from app.domains.accounts.usecases.get_account_ancestors import (
+    provide as provide_account_ancestors_usecase,
+)
 from app.domains.accounts.usecases.get_account_balance import (
     provide as provide_account_balance_usecase,
 )
+from app.domains.accounts.usecases.get_account_descendants import (
+    provide as provide_account_descendants_usecase,
+)
+from app.domains.accounts.usecases.get_account_hierarchy import (
+    provide as provide_account_hierarchy_usecase,
+)
 from app.domains.accounts.usecases.get_account_transactions import (
     provide as provide_account_transactions_usecase,
 )
@@ -14,7 +23,10 @@ from app.domains.accounts.usecases.get_parent_account import (
 )
 
 __all__ = [
+    "provide_account_ancestors_usecase",
     "provide_account_balance_usecase",
+    "provide_account_descendants_usecase",
+    "provide_account_hierarchy_usecase",
     "provide_account_transactions_usecase",
     "provide_children_accounts_usecase",
     "provide_parent_account_usecase",
@@ -0,0 +1,8 @@
+"""Get account ancestors usecase."""
+
+from .usecase import GetAccountAncestorsUseCase, provide
+
+__all__ = [
+    "GetAccountAncestorsUseCase",
+    "provide",
+]
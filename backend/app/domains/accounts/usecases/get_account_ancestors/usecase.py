@@ -0,0 +1,39 @@
+"""Usecase for retrieving the ancestor chain of an account."""
+
+import uuid
+
+from app.domains.accounts.domain.models import AccountTreePublic
+from app.domains.accounts.service import AccountService
+from app.domains.accounts.service import provide as provide_account_service
+
+
+class GetAccountAncestorsUseCase:
+    """Usecase for retrieving the ancestor chain of an account."""
+
+    def __init__(self, account_service: AccountService) -> None:
+        """Initialize the usecase with an account service.
+
+        Args:
+            account_service: Service for handling account operations
+        """
+        self.account_service = account_service
+
+    def execute(self, account_id: uuid.UUID) -> AccountTreePublic:
+        """Execute the usecase to retrieve the ancestors of an account.
+
+        Args:
+            account_id: ID of the account
+
+        Returns:
+            AccountTreePublic: The account and its ancestors, root first
+        """
+        return self.account_service.get_ancestors(account_id)
+
+
+def provide() -> GetAccountAncestorsUseCase:
+    """Provide an instance of GetAccountAncestorsUseCase.
+
+    Returns:
+        GetAccountAncestorsUseCase: A new instance with the account service
+    """
+    return GetAccountAncestorsUseCase(provide_account_service())
@@ -1,14 +1,27 @@
 """Usecase for calculating account balance."""
 
 from datetime import date, datetime
+from typing import Any
 
 from app.constants import DEFAULT_START_DATE
+from app.core.account_paths import account_depth
+from app.core.cache import cached
 from app.domains.accounts.domain.models import (
+    AccountBalanceBreakdown,
     AccountBalanceDetails,
     AccountBalancePublic,
     AccountBalanceSummary,
     AccountTransactionSummary,
 )
+from app.domains.accounts.domain.tree import (
+    AccountTreeIndex,
+    add_summaries,
+    empty_summary,
+)
+from app.domains.accounts.service import (
+    AccountTreeService,
+    provide_account_tree_service,
+)
 from app.domains.expenses_transactions.domain import options as expense_opts
 from app.domains.expenses_transactions.service import (
     ExpenseService,
@@ -20,6 +33,9 @@ from app.domains.income_transactions.service import (
     provide_income_service,
 )
 
+Totals = tuple[AccountTransactionSummary, AccountTransactionSummary]
+Breakdown = list[tuple[str, AccountTransactionSummary, AccountTransactionSummary]]
+
 
 class GetAccountBalanceUseCase:
     """Usecase for calculating account balance."""
@@ -28,26 +44,35 @@ class GetAccountBalanceUseCase:
         self,
         expense_service: ExpenseService,
         income_service: IncomeService,
+        account_tree_service: AccountTreeService,
     ) -> None:
-        """Initialize the usecase with expense and income services.
+        """Initialize the usecase with expense, income and account tree services.
 
         Args:
             expense_service: Service for handling expense transactions
             income_service: Service for handling income transactions
+            account_tree_service: Service holding the in-memory account tree
         """
         self.expense_service = expense_service
         self.income_service = income_service
+        self.account_tree_service = account_tree_service
 
     def execute(
         self,
         account_name: str,
         as_of_date: date | None = None,
+        depth: int | None = None,
     ) -> AccountBalancePublic:
         """Execute the usecase to calculate account balance.
 
+        Balances that include every transaction of the ledger are read from
+        the in-memory account tree; earlier dates are summed in the database.
+
         Args:
             account_name: Name of the account to calculate balance for
             as_of_date: Date to calculate balance as of (defaults to current date)
+            depth: Also break the balance down by the sub-accounts this many
+                levels below the account
 
         Returns:
             AccountBalancePublic: Account balance information
@@ -55,89 +80,135 @@ class GetAccountBalanceUseCase:
         # Determine effective date
         effective_date: date = as_of_date or datetime.now().date()
 
-        # Create search options for expenses with account filter
-        expense_filters = expense_opts.SearchFilters(
-            from_date=DEFAULT_START_DATE,
-            to_date=effective_date,
-            account=account_name,  # Filter by account at database level
-        )
-        expense_options = (
-            expense_opts.SearchOptions()
-            .with_filters(expense_filters)
-            .with_pagination(expense_opts.SearchPagination(skip=0, limit=10000))
-        )
+        return self._balance_as_of(account_name, effective_date, depth)
 
-        # Get filtered expenses directly from database
-        expenses = self.expense_service.search_expenses(expense_options)
+    @cached("accounts.balance")
+    def _balance_as_of(
+        self, account_name: str, effective_date: date, depth: int | None
+    ) -> AccountBalancePublic:
+        """Compute the balance of an account as of a resolved date.
 
-        expense_total_ars = sum(expense.amount_ars for expense in expenses.data)
-        expense_total_usd = sum(expense.amount_usd for expense in expenses.data)
-        expense_total_cars = sum(expense.amount_cars for expense in expenses.data)
+        Results are cached per ledger version.
+        """
+        index = self.account_tree_service.get_index()
+        if index.covers(DEFAULT_START_DATE, effective_date):
+            (income, expenses), parts = _from_tree(index, account_name, depth)
+        else:
+            (income, expenses), parts = self._from_database(
+                account_name, effective_date, depth
+            )
+
+        breakdown = None
+        if depth:
+            breakdown = [
+                AccountBalanceBreakdown(account_name=name, **_balance(income, expenses))
+                for name, income, expenses in parts
+            ]
 
-        # Create search options for incomes with account filter
-        income_filters = income_opts.SearchFilters(
-            from_date=DEFAULT_START_DATE,
-            to_date=effective_date,
-            account=account_name,  # Filter by account at database level
-        )
-        income_options = (
-            income_opts.SearchOptions()
-            .with_filters(income_filters)
-            .with_pagination(income_opts.SearchPagination(skip=0, limit=10000))
+        return AccountBalancePublic(
+            account_name=account_name,
+            as_of_date=effective_date.isoformat(),
+            breakdown=breakdown,
+            **_balance(income, expenses),
         )
 
-        # Get filtered incomes directly from database
-        incomes = self.income_service.search_incomes(income_options)
-
-        income_total_ars = sum(income.amount_ars for income in incomes.data)
-        income_total_usd = sum(income.amount_usd for income in incomes.data)
-        income_total_cars = sum(income.amount_cars for income in incomes.data)
+    def _from_database(
+        self, account_name: str, to_date: date, depth: int | None
+    ) -> tuple[Totals, Breakdown]:
+        """Sum the account subtree in the database.
 
-        # Calculate balance (Income - Expenses)
-        balance_ars = income_total_ars - expense_total_ars
-        balance_usd = income_total_usd - expense_total_usd
-        balance_cars = income_total_cars - expense_total_cars
+        Returns one row per sub-account when a breakdown is requested.
+        """
+        level = account_depth(account_name) + depth if depth else None
 
-        # Create summary objects
-        balance_summary = AccountBalanceSummary(
-            amount_ars=balance_ars,
-            amount_usd=balance_usd,
-            amount_cars=balance_cars,
+        expense_filters = expense_opts.SearchFilters(
+            from_date=DEFAULT_START_DATE,
+            to_date=to_date,
+            account=account_name,
         )
+        expense_rows = self.expense_service.get_account_totals(expense_filters, level)
 
-        income_summary = AccountTransactionSummary(
-            amount_ars=income_total_ars,
-            amount_usd=income_total_usd,
-            amount_cars=income_total_cars,
-            count=incomes.count,
+        income_filters = income_opts.SearchFilters(
+            from_date=DEFAULT_START_DATE,
+            to_date=to_date,
+            account=account_name,
         )
-
-        expense_summary = AccountTransactionSummary(
-            amount_ars=expense_total_ars,
-            amount_usd=expense_total_usd,
-            amount_cars=expense_total_cars,
-            count=expenses.count,
+        income_rows = self.income_service.get_account_totals(income_filters, level)
+
+        totals = _merge_totals(income_rows, expense_rows)
+        parts = [
+            (name, income, expenses)
+            for name, (income, expenses) in sorted(totals.items())
+        ]
+        overall = (
+            add_summaries(*(income for income, _ in totals.values())),
+            add_summaries(*(expenses for _, expenses in totals.values())),
         )
-
-        balance_details = AccountBalanceDetails(
-            income=income_summary,
-            expenses=expense_summary,
+        return overall, parts
+
+
+def _from_tree(
+    index: AccountTreeIndex, account_name: str, depth: int | None
+) -> tuple[Totals, Breakdown]:
+    """Read the pre-summed totals of the account subtree from the tree."""
+    node = index.get(account_name)
+    if node is None:
+        return (empty_summary(), empty_summary()), []
+
+    parts = index.breakdown(node, depth) if depth else []
+    return (node.income, node.expenses), parts
+
+
+def _summary(row: tuple[Any, ...]) -> AccountTransactionSummary:
+    """Build a transaction summary from an account totals row."""
+    _, amount_ars, amount_usd, amount_cars, count, _ = row
+    return AccountTransactionSummary(
+        amount_ars=amount_ars,
+        amount_usd=amount_usd,
+        amount_cars=amount_cars,
+        count=count,
+    )
+
+
+def _merge_totals(
+    income_rows: list[tuple[Any, ...]], expense_rows: list[tuple[Any, ...]]
+) -> dict[str, tuple[AccountTransactionSummary, AccountTransactionSummary]]:
+    """Pair the income and expense totals of each account."""
+    income = {row[0]: _summary(row) for row in income_rows}
+    expenses = {row[0]: _summary(row) for row in expense_rows}
+    return {
+        account: (
+            income.get(account, empty_summary()),
+            expenses.get(account, empty_summary()),
         )
+        for account in income.keys() | expenses.keys()
+    }
 
-        # Return proper model
-        return AccountBalancePublic(
-            account_name=account_name,
-            as_of_date=effective_date.isoformat(),
-            balance=balance_summary,
-            totals=balance_details,
-            transaction_count=incomes.count + expenses.count,
-        )
+
+def _balance(
+    income: AccountTransactionSummary, expenses: AccountTransactionSummary
+) -> dict[str, Any]:
+    """Compute the balance fields (income - expenses) shared by the response models."""
+    return {
+        "balance": AccountBalanceSummary(
+            amount_ars=income.amount_ars - expenses.amount_ars,
+            amount_usd=income.amount_usd - expenses.amount_usd,
+            amount_cars=income.amount_cars - expenses.amount_cars,
+        ),
+        "totals": AccountBalanceDetails(income=income, expenses=expenses),
+        "transaction_count": income.count + expenses.count,
+    }
 
 
 def provide() -> GetAccountBalanceUseCase:
     """Provide an instance of GetAccountBalanceUseCase.
 
     Returns:
-        GetAccountBalanceUseCase: A new instance with the expense and income services
+        GetAccountBalanceUseCase: A new instance with the expense, income and
+            account tree services
     """
-    return GetAccountBalanceUseCase(provide_expense_service(), provide_income_service())
+    return GetAccountBalanceUseCase(
+        provide_expense_service(),
+        provide_income_service(),
+        provide_account_tree_service(),
+    )
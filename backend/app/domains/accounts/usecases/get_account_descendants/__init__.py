@@ -0,0 +1,8 @@
+"""Get account descendants usecase."""
+
+from .usecase import GetAccountDescendantsUseCase, provide
+
+__all__ = [
+    "GetAccountDescendantsUseCase",
+    "provide",
+]
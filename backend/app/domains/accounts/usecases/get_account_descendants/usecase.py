@@ -0,0 +1,46 @@
+"""Usecase for retrieving the subtree below an account."""
+
+import uuid
+
+from app.domains.accounts.domain.models import AccountTreePublic
+from app.domains.accounts.service import AccountService
+from app.domains.accounts.service import provide as provide_account_service
+
+
+class GetAccountDescendantsUseCase:
+    """Usecase for retrieving the subtree below an account."""
+
+    def __init__(self, account_service: AccountService) -> None:
+        """Initialize the usecase with an account service.
+
+        Args:
+            account_service: Service for handling account operations
+        """
+        self.account_service = account_service
+
+    def execute(
+        self, account_id: uuid.UUID, max_depth: int | None = None
+    ) -> AccountTreePublic:
+        """Execute the usecase to retrieve the descendants of an account.
+
+        Args:
+            account_id: ID of the subtree's root account
+            max_depth: Only include descendants up to this many levels below
+                (the whole subtree when None)
+
+        Returns:
+            AccountTreePublic: The account and its descendants, in tree order
+        """
+        if max_depth is not None and max_depth < 1:
+            raise ValueError("max_depth must be at least 1")
+
+        return self.account_service.get_descendants(account_id, max_depth)
+
+
+def provide() -> GetAccountDescendantsUseCase:
+    """Provide an instance of GetAccountDescendantsUseCase.
+
+    Returns:
+        GetAccountDescendantsUseCase: A new instance with the account service
+    """
+    return GetAccountDescendantsUseCase(provide_account_service())
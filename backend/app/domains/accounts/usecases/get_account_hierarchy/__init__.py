@@ -0,0 +1,8 @@
+"""Get account hierarchy usecase."""
+
+from .usecase import GetAccountHierarchyUseCase, provide
+
+__all__ = [
+    "GetAccountHierarchyUseCase",
+    "provide",
+]
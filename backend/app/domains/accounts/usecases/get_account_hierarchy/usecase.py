@@ -0,0 +1,104 @@
+"""Usecase for retrieving the nested account hierarchy."""
+
+from app.domains.accounts.domain.errors import AccountNotFoundError
+from app.domains.accounts.domain.models import (
+    AccountBalanceDetails,
+    AccountBalanceSummary,
+    AccountHierarchyNodePublic,
+    AccountHierarchyPublic,
+)
+from app.domains.accounts.domain.tree import AccountTreeNode
+from app.domains.accounts.service import (
+    AccountTreeService,
+    provide_account_tree_service,
+)
+
+
+class GetAccountHierarchyUseCase:
+    """Usecase for retrieving the nested account hierarchy in one response."""
+
+    def __init__(self, account_tree_service: AccountTreeService) -> None:
+        """Initialize the usecase with the account tree service.
+
+        Args:
+            account_tree_service: Service holding the in-memory account tree
+        """
+        self.account_tree_service = account_tree_service
+
+    def execute(
+        self,
+        root: str | None = None,
+        max_depth: int | None = None,
+        with_balances: bool = False,
+    ) -> AccountHierarchyPublic:
+        """Execute the usecase to retrieve the account hierarchy.
+
+        The hierarchy is read from the in-memory account tree, so it costs no
+        database query once the tree of the current ledger version is built.
+
+        Args:
+            root: Only return the subtree of this account (all top-level
+                accounts when None)
+            max_depth: Number of levels to return, counting the first one
+                (the whole hierarchy when None)
+            with_balances: Include each account's subtree balance and totals
+
+        Returns:
+            AccountHierarchyPublic: The nested hierarchy
+        """
+        if max_depth is not None and max_depth < 1:
+            raise ValueError("max_depth must be at least 1")
+
+        index = self.account_tree_service.get_index()
+        if root is None:
+            top = index.roots
+        else:
+            node = index.get(root)
+            if node is None:
+                raise AccountNotFoundError(f"Account {root} not found")
+            top = [node]
+
+        levels = None if max_depth is None else max_depth - 1
+        data = [_branch(node, levels, with_balances) for node in top]
+
+        return AccountHierarchyPublic(data=data, count=sum(map(_count, data)))
+
+
+def _branch(
+    node: AccountTreeNode, levels: int | None, with_balances: bool
+) -> AccountHierarchyNodePublic:
+    """Convert a tree node and `levels` levels of its descendants."""
+    children = []
+    if levels is None or levels > 0:
+        children = [
+            _branch(child, None if levels is None else levels - 1, with_balances)
+            for child in node.children
+        ]
+
+    branch = AccountHierarchyNodePublic(
+        name=node.name, depth=node.depth, account=node.account, children=children
+    )
+    if with_balances:
+        branch.balance = AccountBalanceSummary(
+            amount_ars=node.income.amount_ars - node.expenses.amount_ars,
+            amount_usd=node.income.amount_usd - node.expenses.amount_usd,
+            amount_cars=node.income.amount_cars - node.expenses.amount_cars,
+        )
+        branch.totals = AccountBalanceDetails(
+            income=node.income, expenses=node.expenses
+        )
+    return branch
+
+
+def _count(branch: AccountHierarchyNodePublic) -> int:
+    """Count the nodes of a branch."""
+    return 1 + sum(map(_count, branch.children))
+
+
+def provide() -> GetAccountHierarchyUseCase:
+    """Provide an instance of GetAccountHierarchyUseCase.
+
+    Returns:
+        GetAccountHierarchyUseCase: A new instance with the account tree service
+    """
+    return GetAccountHierarchyUseCase(provide_account_tree_service())
@@ -0,0 +1,19 @@
+"""Analytics domain models and types."""
+
+from .models import (
+    BucketTotals,
+    CombinedMetricsPublic,
+    TimeseriesPoint,
+    TimeseriesPublic,
+    Totals,
+)
+from .options import Bucket
+
+__all__ = [
+    "Bucket",
+    "BucketTotals",
+    "CombinedMetricsPublic",
+    "TimeseriesPoint",
+    "TimeseriesPublic",
+    "Totals",
+]
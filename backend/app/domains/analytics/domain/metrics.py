@@ -0,0 +1,40 @@
+"""Metric calculations shared by the analytics usecases."""
+
+from app.constants import SUPPORTED_CURRENCIES
+from app.domains.analytics.domain.models import Totals
+
+
+def normalize_currencies(currencies: list[str] | None) -> list[str]:
+    """Upper-case the requested currencies, defaulting to USD.
+
+    Raises:
+        ValueError: If a currency is not supported
+    """
+    normalized = [curr.upper() for curr in currencies or ["USD"]]
+    for curr in normalized:
+        if curr not in SUPPORTED_CURRENCIES:
+            raise ValueError(f"Invalid currency: {curr}")
+    return normalized
+
+
+def compute_metrics(totals: Totals, currencies: list[str]) -> dict[str, float]:
+    """Compute income, expenses and balance per currency, plus the ratio.
+
+    The expense/income ratio is computed on the first currency.
+    """
+    metrics: dict[str, float] = {}
+    for curr in currencies:
+        curr_lower = curr.lower()
+        income = float(totals[f"income_{curr_lower}"] or 0)  # type: ignore[literal-required]
+        expenses = float(totals[f"expenses_{curr_lower}"] or 0)  # type: ignore[literal-required]
+
+        metrics[f"income_{curr_lower}"] = income
+        metrics[f"expenses_{curr_lower}"] = expenses
+        metrics[f"balance_{curr_lower}"] = income - expenses
+
+    base_curr = currencies[0].lower()
+    base_income = metrics[f"income_{base_curr}"]
+    metrics["ratio"] = (
+        metrics[f"expenses_{base_curr}"] / base_income if base_income else 0
+    )
+    return metrics
@@ -0,0 +1,46 @@
+"""Analytics domain models."""
+
+from datetime import date
+from typing import TypedDict
+
+from sqlmodel import SQLModel
+
+
+class Totals(TypedDict):
+    """Income and expense totals per currency."""
+
+    income_ars: float
+    income_usd: float
+    income_cars: float
+    expenses_ars: float
+    expenses_usd: float
+    expenses_cars: float
+
+
+class BucketTotals(Totals):
+    """Income and expense totals for a single time bucket."""
+
+    bucket: date
+
+
+class CombinedMetricsPublic(TypedDict):
+    """Type definition for the combined metrics response."""
+
+    metrics: dict[str, float]
+    period: dict[str, str]
+
+
+class TimeseriesPoint(SQLModel):
+    """Metrics for a single time bucket."""
+
+    bucket: str
+    metrics: dict[str, float]
+
+
+class TimeseriesPublic(SQLModel):
+    """Response model for bucketed income/expense metrics."""
+
+    data: list[TimeseriesPoint]
+    bucket: str
+    currencies: list[str]
+    period: dict[str, str]
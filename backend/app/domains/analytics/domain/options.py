@@ -0,0 +1,53 @@
+"""Options for the analytics domain."""
+
+from datetime import date, timedelta
+from enum import Enum
+
+
+class Bucket(Enum):
+    """Time bucket sizes, named after the Postgres `date_trunc` fields."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    QUARTER = "quarter"
+    YEAR = "year"
+
+    def truncate(self, value: date) -> date:
+        """Return the start of the bucket containing `value`.
+
+        Mirrors `date_trunc` in Postgres, where weeks start on Monday.
+        """
+        if self == Bucket.DAY:
+            return value
+        if self == Bucket.WEEK:
+            return value - timedelta(days=value.weekday())
+        if self == Bucket.MONTH:
+            return value.replace(day=1)
+        if self == Bucket.QUARTER:
+            return value.replace(month=3 * ((value.month - 1) // 3) + 1, day=1)
+        return value.replace(month=1, day=1)
+
+    def next(self, start: date) -> date:
+        """Return the start of the bucket following the one starting at `start`."""
+        if self == Bucket.DAY:
+            return start + timedelta(days=1)
+        if self == Bucket.WEEK:
+            return start + timedelta(weeks=1)
+        if self == Bucket.YEAR:
+            return start.replace(year=start.year + 1)
+
+        months = 3 if self == Bucket.QUARTER else 1
+        month_index = start.month - 1 + months
+        return start.replace(
+            year=start.year + month_index // 12, month=month_index % 12 + 1
+        )
+
+    def starts(self, from_date: date, to_date: date) -> list[date]:
+        """List every bucket start overlapping the half-open range [from, to)."""
+        starts: list[date] = []
+        current = self.truncate(from_date)
+        while current < to_date:
+            starts.append(current)
+            current = self.next(current)
+        return starts
@@ -0,0 +1,6 @@
+"""Analytics repository."""
+
+from .analytics_repository import AnalyticsRepository
+from .analytics_repository import provide as provide_analytics_repository
+
+__all__ = ["AnalyticsRepository", "provide_analytics_repository"]
@@ -0,0 +1,131 @@
+"""Analytics repository implementation."""
+
+from datetime import date
+from functools import lru_cache
+
+from sqlalchemy import TIMESTAMP, Date, Float, Subquery, cast, literal, union_all
+from sqlmodel import Session, func, select
+
+from app.domains.analytics.domain.models import BucketTotals, Totals
+from app.domains.analytics.domain.options import Bucket
+from app.domains.expenses_transactions.domain.models import (
+    Expense,
+    ExpenseMonthlyRollup,
+)
+from app.domains.income_transactions.domain.models import (
+    Income,
+    IncomeMonthlyRollup,
+)
+from app.pkgs.database import get_db_session
+
+AMOUNT_SUFFIXES = ("ars", "usd", "cars")
+
+
+class AnalyticsRepository:
+    """Repository for cross-domain income/expense aggregations."""
+
+    def __init__(self, db_session: Session):
+        """Initialize the repository with a database session."""
+        self.db_session = db_session
+
+    def totals(self, from_date: date, to_date: date, monthly: bool = False) -> Totals:
+        """Sum income and expenses over a period in a single query.
+
+        Args:
+            from_date: Start date (inclusive)
+            to_date: End date (exclusive)
+            monthly: Read the monthly rollups instead of the raw rows; both
+                dates must then be the first day of a month
+
+        Returns:
+            Income and expense totals per currency
+        """
+        rows = self._transactions(from_date, to_date, monthly)
+        query = select(*self._sums(rows))
+
+        totals: Totals = self.db_session.exec(query).one()._asdict()
+        return totals
+
+    def bucket_totals(
+        self, from_date: date, to_date: date, bucket: Bucket, monthly: bool = False
+    ) -> list[BucketTotals]:
+        """Sum income and expenses per time bucket in a single query.
+
+        Both tables are scanned once through a `UNION ALL` and grouped by
+        `date_trunc`, so the cost does not grow with the number of buckets.
+        Buckets without transactions are not returned.
+
+        Args:
+            from_date: Start date (inclusive)
+            to_date: End date (exclusive)
+            bucket: Size of the time buckets
+            monthly: Read the monthly rollups instead of the raw rows; both
+                dates must then be the first day of a month and the bucket at
+                least a month long
+
+        Returns:
+            Totals per bucket, ordered by bucket start
+        """
+        rows = self._transactions(from_date, to_date, monthly)
+        bucket_start = cast(
+            func.date_trunc(bucket.value, cast(rows.c.date, TIMESTAMP)), Date
+        ).label("bucket")
+        query = (
+            select(bucket_start, *self._sums(rows))
+            .group_by(bucket_start)
+            .order_by(bucket_start)
+        )
+
+        return [
+            BucketTotals(**row._asdict())  # type: ignore[typeddict-item]
+            for row in self.db_session.exec(query)
+        ]
+
+    def _transactions(self, from_date: date, to_date: date, monthly: bool) -> Subquery:
+        """Union income and expense amounts into a single `date`-keyed relation."""
+        income_cls: type = IncomeMonthlyRollup if monthly else Income
+        expense_cls: type = ExpenseMonthlyRollup if monthly else Expense
+        date_column = "month" if monthly else "date"
+
+        zero = cast(literal(0), Float)
+        income_date = getattr(income_cls, date_column)
+        incomes = select(
+            income_date.label("date"),
+            *(
+                getattr(income_cls, f"amount_{suffix}").label(f"income_{suffix}")
+                for suffix in AMOUNT_SUFFIXES
+            ),
+            *(zero.label(f"expenses_{suffix}") for suffix in AMOUNT_SUFFIXES),
+        ).where(income_date >= from_date, income_date < to_date)
+
+        expense_date = getattr(expense_cls, date_column)
+        expenses = select(
+            expense_date.label("date"),
+            *(zero.label(f"income_{suffix}") for suffix in AMOUNT_SUFFIXES),
+            *(
+                getattr(expense_cls, f"amount_{suffix}").label(f"expenses_{suffix}")
+                for suffix in AMOUNT_SUFFIXES
+            ),
+        ).where(expense_date >= from_date, expense_date < to_date)
+
+        return union_all(incomes, expenses).subquery()
+
+    def _sums(self, rows: Subquery) -> list:  # type: ignore[type-arg]
+        """Build the labelled income/expense sums over a transactions relation."""
+        return [
+            func.coalesce(func.sum(rows.c[column]), 0.0).label(column)
+            for column in (
+                *(f"income_{suffix}" for suffix in AMOUNT_SUFFIXES),
+                *(f"expenses_{suffix}" for suffix in AMOUNT_SUFFIXES),
+            )
+        ]
+
+
+@lru_cache
+def provide() -> AnalyticsRepository:
+    """Provide an instance of AnalyticsRepository.
+
+    Returns:
+        AnalyticsRepository: An instance of AnalyticsRepository with a database session.
+    """
+    return AnalyticsRepository(get_db_session())
@@ -0,0 +1,6 @@
+"""Analytics service."""
+
+from .analytics_service import AnalyticsService
+from .analytics_service import provide as provide_analytics_service
+
+__all__ = ["AnalyticsService", "provide_analytics_service"]
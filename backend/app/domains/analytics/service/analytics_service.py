@@ -0,0 +1,91 @@
+"""Analytics service implementation."""
+
+from datetime import date
+from functools import lru_cache
+
+from app.domains.analytics.domain.models import BucketTotals, Totals
+from app.domains.analytics.domain.options import Bucket
+from app.domains.analytics.repository import provide_analytics_repository
+from app.domains.analytics.repository.analytics_repository import (
+    AnalyticsRepository,
+)
+
+# Buckets that can be built by adding up whole months
+MONTHLY_BUCKETS = (Bucket.MONTH, Bucket.QUARTER, Bucket.YEAR)
+
+
+def _spans_whole_months(from_date: date, to_date: date) -> bool:
+    """Whether [from_date, to_date) starts and ends on month boundaries."""
+    return from_date.day == 1 and to_date.day == 1
+
+
+class AnalyticsService:
+    """Service for income/expense analytics."""
+
+    def __init__(self, analytics_repository: AnalyticsRepository):
+        """Initialize the service with a repository."""
+        self.analytics_repository = analytics_repository
+
+    def get_totals(self, from_date: date, to_date: date) -> Totals:
+        """Get income and expense totals for a period.
+
+        Ranges made of whole months are read from the monthly rollups.
+
+        Args:
+            from_date: Start date (inclusive)
+            to_date: End date (exclusive)
+
+        Returns:
+            Income and expense totals per currency
+        """
+        return self.analytics_repository.totals(
+            from_date, to_date, monthly=_spans_whole_months(from_date, to_date)
+        )
+
+    def get_bucket_totals(
+        self, from_date: date, to_date: date, bucket: Bucket
+    ) -> list[BucketTotals]:
+        """Get income and expense totals per bucket, gaps filled with zeros.
+
+        Ranges made of whole months, bucketed by month or longer, are read
+        from the monthly rollups.
+
+        Args:
+            from_date: Start date (inclusive)
+            to_date: End date (exclusive)
+            bucket: Size of the time buckets
+
+        Returns:
+            One entry for every bucket overlapping the range, in order
+        """
+        monthly = bucket in MONTHLY_BUCKETS and _spans_whole_months(from_date, to_date)
+        totals = {
+            row["bucket"]: row
+            for row in self.analytics_repository.bucket_totals(
+                from_date, to_date, bucket, monthly=monthly
+            )
+        }
+
+        return [
+            totals.get(start)
+            or BucketTotals(
+                bucket=start,
+                income_ars=0.0,
+                income_usd=0.0,
+                income_cars=0.0,
+                expenses_ars=0.0,
+                expenses_usd=0.0,
+                expenses_cars=0.0,
+            )
+            for start in bucket.starts(from_date, to_date)
+        ]
+
+
+@lru_cache
+def provide() -> AnalyticsService:
+    """Provide an instance of AnalyticsService.
+
+    Returns:
+        AnalyticsService: An instance of AnalyticsService with a repository.
+    """
+    return AnalyticsService(provide_analytics_repository())
@@ -0,0 +1,13 @@
+"""Usecases for analytics."""
+
+from app.domains.analytics.usecases.get_combined_metrics import (
+    provide_combined_metrics_usecase,
+)
+from app.domains.analytics.usecases.get_timeseries import (
+    provide_timeseries_usecase,
+)
+
+__all__ = [
+    "provide_combined_metrics_usecase",
+    "provide_timeseries_usecase",
+]
@@ -0,0 +1,10 @@
+"""Get combined metrics usecase."""
+
+from app.domains.analytics.usecases.get_combined_metrics.usecase import (
+    GetCombinedMetricsUseCase,
+)
+from app.domains.analytics.usecases.get_combined_metrics.usecase import (
+    provide as provide_combined_metrics_usecase,
+)
+
+__all__ = ["GetCombinedMetricsUseCase", "provide_combined_metrics_usecase"]
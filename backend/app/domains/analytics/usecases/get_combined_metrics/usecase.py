@@ -0,0 +1,84 @@
+"""Usecase for retrieving combined income/expense metrics for a period."""
+
+from datetime import date, datetime
+
+from app.core.cache import cached
+from app.domains.analytics.domain.metrics import (
+    compute_metrics,
+    normalize_currencies,
+)
+from app.domains.analytics.domain.models import CombinedMetricsPublic
+from app.domains.analytics.service import (
+    AnalyticsService,
+    provide_analytics_service,
+)
+
+
+class GetCombinedMetricsUseCase:
+    """Usecase for retrieving income, expenses, balance and ratio for a period."""
+
+    def __init__(self, analytics_service: AnalyticsService) -> None:
+        """Initialize the usecase with an analytics service.
+
+        Args:
+            analytics_service: Service for income/expense aggregations
+        """
+        self.analytics_service = analytics_service
+
+    def execute(
+        self,
+        from_date: date,
+        to_date: date | None = None,
+        currencies: list[str] | None = None,
+    ) -> CombinedMetricsPublic:
+        """Execute the usecase to get combined metrics for a period.
+
+        Args:
+            from_date: Start date for filtering
+            to_date: End date for filtering (defaults to current date if None)
+            currencies: Currencies to include in the metrics (defaults to USD)
+
+        Returns:
+            CombinedMetricsPublic: Metrics and period information
+
+        Raises:
+            ValueError: If a currency is invalid
+        """
+        normalized_currencies = normalize_currencies(currencies)
+
+        # Determine effective end date
+        effective_to_date: date = to_date or datetime.now().date()
+
+        return self._combined_metrics(
+            from_date, effective_to_date, tuple(normalized_currencies)
+        )
+
+    @cached("analytics.combined")
+    def _combined_metrics(
+        self,
+        from_date: date,
+        effective_to_date: date,
+        normalized_currencies: tuple[str, ...],
+    ) -> CombinedMetricsPublic:
+        """Compute the metrics of a normalized period and currencies.
+
+        Results are cached per ledger version.
+        """
+        totals = self.analytics_service.get_totals(from_date, effective_to_date)
+
+        return {
+            "metrics": compute_metrics(totals, list(normalized_currencies)),
+            "period": {
+                "from": from_date.isoformat(),
+                "to": effective_to_date.isoformat(),
+            },
+        }
+
+
+def provide() -> GetCombinedMetricsUseCase:
+    """Provide an instance of GetCombinedMetricsUseCase.
+
+    Returns:
+        GetCombinedMetricsUseCase: A new instance with the analytics service
+    """
+    return GetCombinedMetricsUseCase(provide_analytics_service())
@@ -0,0 +1,10 @@
+"""Get timeseries usecase."""
+
+from app.domains.analytics.usecases.get_timeseries.usecase import (
+    GetTimeseriesUseCase,
+)
+from app.domains.analytics.usecases.get_timeseries.usecase import (
+    provide as provide_timeseries_usecase,
+)
+
+__all__ = ["GetTimeseriesUseCase", "provide_timeseries_usecase"]
@@ -0,0 +1,111 @@
+"""Usecase for retrieving bucketed income/expense metrics."""
+
+from datetime import date, datetime
+
+from app.core.cache import cached
+from app.domains.analytics.domain.metrics import (
+    compute_metrics,
+    normalize_currencies,
+)
+from app.domains.analytics.domain.models import TimeseriesPoint, TimeseriesPublic
+from app.domains.analytics.domain.options import Bucket
+from app.domains.analytics.service import (
+    AnalyticsService,
+    provide_analytics_service,
+)
+
+
+class GetTimeseriesUseCase:
+    """Usecase for retrieving income, expenses, balance and ratio per bucket."""
+
+    def __init__(self, analytics_service: AnalyticsService) -> None:
+        """Initialize the usecase with an analytics service.
+
+        Args:
+            analytics_service: Service for income/expense aggregations
+        """
+        self.analytics_service = analytics_service
+
+    def execute(
+        self,
+        from_date: date,
+        to_date: date | None = None,
+        bucket: str | Bucket = Bucket.MONTH,
+        currencies: list[str] | None = None,
+    ) -> TimeseriesPublic:
+        """Execute the usecase to get metrics for every bucket in a period.
+
+        Args:
+            from_date: Start date for filtering
+            to_date: End date for filtering (defaults to current date if None)
+            bucket: Bucket size ('day', 'week', 'month', 'quarter' or 'year')
+            currencies: Currencies to include in the metrics (defaults to USD)
+
+        Returns:
+            TimeseriesPublic: Metrics per bucket, including empty buckets
+
+        Raises:
+            ValueError: If the bucket or a currency is invalid
+        """
+        # Normalize bucket parameter
+        normalized_bucket: Bucket
+        if isinstance(bucket, str):
+            bucket_str = bucket.upper()
+            if bucket_str not in Bucket.__members__:
+                raise ValueError(f"Invalid bucket value: {bucket}")
+            normalized_bucket = Bucket[bucket_str]
+        else:
+            normalized_bucket = bucket
+
+        normalized_currencies = normalize_currencies(currencies)
+
+        # Determine effective end date
+        effective_to_date: date = to_date or datetime.now().date()
+
+        return self._timeseries(
+            from_date,
+            effective_to_date,
+            normalized_bucket,
+            tuple(normalized_currencies),
+        )
+
+    @cached("analytics.timeseries")
+    def _timeseries(
+        self,
+        from_date: date,
+        effective_to_date: date,
+        normalized_bucket: Bucket,
+        normalized_currencies: tuple[str, ...],
+    ) -> TimeseriesPublic:
+        """Compute the metrics of a normalized period, bucket and currencies.
+
+        Results are cached per ledger version.
+        """
+        totals = self.analytics_service.get_bucket_totals(
+            from_date, effective_to_date, normalized_bucket
+        )
+
+        return TimeseriesPublic(
+            data=[
+                TimeseriesPoint(
+                    bucket=row["bucket"].isoformat(),
+                    metrics=compute_metrics(row, list(normalized_currencies)),
+                )
+                for row in totals
+            ],
+            bucket=normalized_bucket.value,
+            currencies=list(normalized_currencies),
+            period={
+                "from": from_date.isoformat(),
+                "to": effective_to_date.isoformat(),
+            },
+        )
+
+
+def provide() -> GetTimeseriesUseCase:
+    """Provide an instance of GetTimeseriesUseCase.
+
+    Returns:
+        GetTimeseriesUseCase: A new instance with the analytics service
+    """
+    return GetTimeseriesUseCase(provide_analytics_service())
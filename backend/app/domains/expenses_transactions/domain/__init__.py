@@ -5,6 +5,7 @@ from .models import (
     Expense,
     ExpenseBase,
     ExpenseCreate,
+    ExpenseMonthlyRollup,
     ExpensePublic,
     ExpensesPublic,
     TransactionBase,
@@ -13,6 +14,7 @@ from .models import (
 __all__ = [
     "ExpenseBase",
     "ExpenseCreate",
+    "ExpenseMonthlyRollup",
     "Expense",
     "ExpensePublic",
     "ExpensesPublic",
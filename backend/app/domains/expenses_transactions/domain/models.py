@@ -2,17 +2,22 @@
 
 import uuid
 from datetime import date as date_type
-from typing import TypedDict
+from typing import ClassVar, TypedDict
 
+from sqlalchemy import Column, Computed, Index, Text
 from sqlmodel import Field, SQLModel
 
+from app.core.account_paths import ACCOUNT_PATH_SQL
+
 
 # Base Transaction model
 class TransactionBase(SQLModel):
     """Base model for all financial transactions."""
 
-    date: date_type = Field(index=True)
-    account: str = Field(index=True)
+    # Indexed through the composite date indexes, see the table's __table_args__
+    date: date_type
+    # Indexed through the account path, see the table's __table_args__
+    account: str
     payee: str | None = None
     narration: str
     amount_ars: float
@@ -38,8 +43,55 @@ class ExpenseCreate(ExpenseBase):
 class Expense(ExpenseBase, table=True):
     """Database model for expense transactions."""
 
+    __table_args__ = (
+        # Account-subtree filters (`LIKE 'path%'`) combined with a date range;
+        # text_pattern_ops keeps prefix matching indexable under any collation
+        Index(
+            "ix_expense_account_path_date",
+            "account_path",
+            "date",
+            postgresql_ops={"account_path": "text_pattern_ops"},
+        ),
+        # Date-range filters narrowed by category and subcategory; the amounts
+        # are included so chart queries (`fields=date,amount_usd`) and raw
+        # summaries can be answered by an index-only scan
+        Index(
+            "ix_expense_date_category_subcategory",
+            "date",
+            "category",
+            "subcategory",
+            postgresql_include=["amount_ars", "amount_usd", "amount_cars"],
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
+    # Generated by Postgres from the account on every write, see app.core.account_paths
+    account_path: str | None = Field(
+        default=None,
+        sa_column=Column(
+            Text, Computed(ACCOUNT_PATH_SQL, persisted=True), nullable=False
+        ),
+    )
+
+
+class ExpenseMonthlyRollup(SQLModel, table=True):
+    """Monthly expense totals per account, maintained by the ledger sync."""
+
+    __tablename__ = "expense_monthly_rollup"
+
+    # Columns copied from the expenses grouped into a cell
+    dimensions: ClassVar[tuple[str, ...]] = ("category", "subcategory")
+
+    month: date_type = Field(primary_key=True)
+    account: str = Field(primary_key=True)
+    category: str = Field(index=True)
+    subcategory: str
+    amount_ars: float
+    amount_usd: float
+    amount_cars: float
+    count: int
+
 
 class ExpensePublic(ExpenseBase):
     """Public model for expense transactions."""
@@ -47,6 +99,13 @@ class ExpensePublic(ExpenseBase):
     id: uuid.UUID
 
 
+# Columns of an export, in order
+EXPORT_COLUMNS: tuple[str, ...] = ("id", *ExpenseBase.model_fields)
+
+# Fields of each item of `ExpensesPublic`, in serialization order
+PUBLIC_COLUMNS: tuple[str, ...] = tuple(ExpensePublic.model_fields)
+
+
 class ExpensesPublic(SQLModel):
     """Response model for paginated expense transactions."""
 
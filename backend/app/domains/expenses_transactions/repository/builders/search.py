@@ -1,7 +1,9 @@
 from typing import TypeVar
 
+from sqlmodel import col
 from sqlmodel.sql.expression import SelectOfScalar
 
+from app.core.account_paths import subtree_pattern
 from app.domains.expenses_transactions.domain import options as opts
 from app.domains.expenses_transactions.domain.models import (
     Expense,
@@ -45,10 +47,10 @@ def build_filtered_search(
         query = query.where(Expense.tags == search_filters.tags)
 
     if search_filters.account:
-        # Use regex to match the account and all its children
-        # Pattern: account name + any child accounts (account:child1:child2, etc.)
-        account_pattern = f"{search_filters.account}%"
-        query = query.where(Expense.account.like(account_pattern))
+        # Match the account and all its children through the materialized path
+        # ("Expenses:Food:%" matches "Expenses:Food:Groceries", not "Expenses:FoodTruck")
+        account_pattern = subtree_pattern(search_filters.account)
+        query = query.where(col(Expense.account_path).like(account_pattern))
 
     return query
 
@@ -1,5 +1,8 @@
 """Usecases for expense transactions."""
 
+from app.domains.expenses_transactions.usecases.export_expenses import (
+    provide_export_expenses_usecase,
+)
 from app.domains.expenses_transactions.usecases.get_expense_summary import (
     provide_expense_summary_usecase,
 )
@@ -8,6 +11,7 @@ from app.domains.expenses_transactions.usecases.get_expenses import (
 )
 
 __all__ = [
+    "provide_export_expenses_usecase",
     "provide_expense_summary_usecase",
     "provide_get_expenses_usecase",
 ]
@@ -0,0 +1,10 @@
+"""Export expenses usecase."""
+
+from app.domains.expenses_transactions.usecases.export_expenses.usecase import (
+    ExportExpensesUseCase,
+)
+from app.domains.expenses_transactions.usecases.export_expenses.usecase import (
+    provide as provide_export_expenses_usecase,
+)
+
+__all__ = ["ExportExpensesUseCase", "provide_export_expenses_usecase"]
@@ -0,0 +1,90 @@
+"""Usecase for exporting expenses as a stream of CSV, NDJSON, Arrow or Parquet."""
+
+from datetime import date, datetime
+
+from app.core.config import settings
+from app.domains.expenses_transactions.domain import options as opts
+from app.domains.expenses_transactions.domain.models import EXPORT_COLUMNS, Expense
+from app.domains.expenses_transactions.service import (
+    ExpenseService,
+    provide_expense_service,
+)
+from app.pkgs.export import ExportFormat, ExportStream, parse_format, stream_export
+
+
+class ExportExpensesUseCase:
+    """Usecase for exporting every expense matching a set of filters."""
+
+    def __init__(self, expense_service: ExpenseService) -> None:
+        """Initialize the usecase with an expense service.
+
+        Args:
+            expense_service: Service for handling expense transactions
+        """
+        self.expense_service = expense_service
+
+    def execute(
+        self,
+        from_date: date,
+        to_date: date | None = None,
+        category: str | None = None,
+        subcategory: str | None = None,
+        account: str | None = None,
+        export_format: str | ExportFormat = ExportFormat.CSV,
+    ) -> ExportStream:
+        """
+        Execute the usecase to stream the matching expenses, oldest first.
+
+        The rows are read from the database as the stream is consumed.
+
+        Args:
+            from_date: Start date for filtering
+            to_date: End date for filtering (defaults to current date if None)
+            category: Optional category filter
+            subcategory: Optional subcategory filter
+            account: Optional account filter, including its sub-accounts
+            export_format: Format of the export ('csv', 'ndjson', 'arrow' for
+                an Arrow IPC stream, or 'parquet')
+
+        Returns:
+            ExportStream: The encoded chunks, their media type and a file name
+
+        Raises:
+            ValueError: If the export format is invalid
+        """
+        normalized_format = parse_format(export_format)
+
+        # Determine effective end date
+        effective_to_date: date = to_date or datetime.now().date()
+
+        search_filters = opts.SearchFilters(
+            from_date=from_date,
+            to_date=effective_to_date,
+            category=category,
+            subcategory=subcategory,
+            account=account,
+        )
+
+        batches = self.expense_service.stream_expenses(
+            search_filters,
+            settings.EXPORT_COLUMNAR_BATCH_SIZE
+            if normalized_format.is_columnar
+            else settings.EXPORT_BATCH_SIZE,
+        )
+        return ExportStream(
+            chunks=stream_export(batches, Expense, EXPORT_COLUMNS, normalized_format),
+            media_type=normalized_format.media_type,
+            filename=(
+                f"expenses-{from_date.isoformat()}-{effective_to_date.isoformat()}"
+                f".{normalized_format.value}"
+            ),
+        )
+
+
+def provide() -> ExportExpensesUseCase:
+    """Provide an instance of ExportExpensesUseCase.
+
+    Returns:
+        ExportExpensesUseCase: A new instance with the expense service
+    """
+    return ExportExpensesUseCase(provide_expense_service())
@@ -4,6 +4,7 @@ from collections import defaultdict
 from datetime import date, datetime
 from enum import Enum
 
+from app.core.cache import cached
 from app.domains.expenses_transactions.domain import options as opts
 from app.domains.expenses_transactions.domain.models import (
     ExpensePublic,
@@ -69,6 +70,29 @@ class GetExpenseSummaryUseCase:
         # Determine effective end date
         effective_to_date: date = to_date or datetime.now().date()
 
+        return self._summarize(from_date, effective_to_date, normalized_group_by)
+
+    @cached("expenses.summary")
+    def _summarize(
+        self,
+        from_date: date,
+        effective_to_date: date,
+        normalized_group_by: GroupBy,
+    ) -> ExpenseSummaryPublic:
+        """Summarize the expenses of a normalized date range and grouping.
+
+        Results are cached per ledger version.
+        """
+        # Whole-month ranges are served from the monthly rollup
+        if from_date.day == 1 and effective_to_date.day == 1:
+            return {
+                "data": self._summarize_rollup(
+                    from_date, effective_to_date, normalized_group_by
+                ),
+                "from_date": from_date.isoformat(),
+                "to_date": effective_to_date.isoformat(),
+            }
+
         search_filters = opts.SearchFilters(
             from_date=from_date,
             to_date=effective_to_date,
@@ -102,6 +126,53 @@ class GetExpenseSummaryUseCase:
             "to_date": effective_to_date.isoformat(),
         }
 
+    def _summarize_rollup(
+        self,
+        from_date: date,
+        to_date: date,
+        group_by: GroupBy = GroupBy.CATEGORY,
+    ) -> list[ExpenseSummary]:
+        """Aggregate expenses from the monthly rollup table.
+
+        Args:
+            from_date: First day of the first month to include
+            to_date: First day of the first month to exclude
+            group_by: Field to group results by
+
+        Returns:
+            List of ExpenseSummary objects, keyed like `_aggregate_expenses`
+        """
+        group_columns: list[str]
+        if group_by == GroupBy.CATEGORY:
+            group_columns = ["category"]
+        elif group_by == GroupBy.SUBCATEGORY:
+            group_columns = ["category", "subcategory"]
+        else:  # GroupBy.MONTH
+            group_columns = ["month"]
+
+        rows = self.expenses_service.get_monthly_totals(
+            from_date, to_date, group_columns
+        )
+
+        result: list[ExpenseSummary] = []
+        for *keys, amount_ars, amount_usd, amount_cars in rows:
+            group_key: str
+            if group_by == GroupBy.MONTH:
+                group_key = f"{keys[0].year}-{keys[0].month:02d}-01"
+            else:
+                group_key = ".".join(keys)
+
+            result.append(
+                ExpenseSummary(
+                    group=group_key,
+                    amount_ars=amount_ars,
+                    amount_usd=amount_usd,
+                    amount_cars=amount_cars,
+                )
+            )
+
+        return result
+
     def _aggregate_expenses(
         self,
         expenses: ExpensesPublic,
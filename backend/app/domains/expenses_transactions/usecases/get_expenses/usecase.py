@@ -2,8 +2,12 @@
 
 from datetime import date, datetime
 
+from app.core.fields import parse_fields
 from app.domains.expenses_transactions.domain import options as opts
-from app.domains.expenses_transactions.domain.models import ExpensesPublic
+from app.domains.expenses_transactions.domain.models import (
+    PUBLIC_COLUMNS,
+    ExpensesPublic,
+)
 from app.domains.expenses_transactions.service import (
     ExpenseService,
     provide_expense_service,
@@ -46,6 +50,57 @@ class GetExpensesUseCase:
         Returns:
             ExpensesPublic: Paginated expenses data
         """
+        search_options = self._search_options(
+            from_date, to_date, category, subcategory, tags, skip, limit
+        )
+        return self.expense_service.search_expenses(search_options)
+
+    def execute_json(
+        self,
+        from_date: date,
+        to_date: date | None = None,
+        category: str | None = None,
+        subcategory: str | None = None,
+        tags: str | None = None,
+        skip: int = 0,
+        limit: int = 50,
+        fields: str | None = None,
+    ) -> bytes:
+        """
+        Execute the usecase, returning the `ExpensesPublic` response as JSON.
+
+        Takes the same arguments as `execute`, but serializes the rows
+        directly instead of building a model per expense.
+
+        Args:
+            fields: Comma-separated fields each item should have (defaults
+                to all of them)
+
+        Returns:
+            bytes: The JSON of the paginated expenses data
+
+        Raises:
+            ValueError: If a field is unknown
+        """
+        selected_fields = parse_fields(fields, PUBLIC_COLUMNS)
+        search_options = self._search_options(
+            from_date, to_date, category, subcategory, tags, skip, limit
+        )
+        return self.expense_service.search_expenses_json(
+            search_options, selected_fields
+        )
+
+    def _search_options(
+        self,
+        from_date: date,
+        to_date: date | None,
+        category: str | None,
+        subcategory: str | None,
+        tags: str | None,
+        skip: int,
+        limit: int,
+    ) -> opts.SearchOptions:
+        """Build the search options of a request, as documented in `execute`."""
         # Determine effective end date
         effective_to_date: date = to_date or datetime.now().date()
 
@@ -68,7 +123,7 @@ class GetExpensesUseCase:
             .with_pagination(search_pagination)
         )
 
-        return self.expense_service.search_expenses(search_options)
+        return search_options
 
 
 def provide() -> GetExpensesUseCase:
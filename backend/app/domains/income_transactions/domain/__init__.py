@@ -5,6 +5,8 @@ from .models import (
     Income,
     IncomeBase,
     IncomeCreate,
+    IncomeMonthlyRollup,
+    IncomePublic,
     Incomes,
     TransactionBase,
 )
@@ -12,6 +14,8 @@ from .models import (
 __all__ = [
     "IncomeBase",
     "IncomeCreate",
+    "IncomeMonthlyRollup",
+    "IncomePublic",
     "Income",
     "Incomes",
     "TransactionBase",
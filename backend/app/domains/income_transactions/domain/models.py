@@ -2,17 +2,22 @@
 
 import uuid
 from datetime import date as date_type
-from typing import TypedDict
+from typing import ClassVar, TypedDict
 
+from sqlalchemy import Column, Computed, Index, Text
 from sqlmodel import Field, SQLModel
 
+from app.core.account_paths import ACCOUNT_PATH_SQL
+
 
 # Base Transaction model
 class TransactionBase(SQLModel):
     """Base model for all financial transactions."""
 
-    date: date_type = Field(index=True)
-    account: str = Field(index=True)
+    # Indexed through the composite date indexes, see the table's __table_args__
+    date: date_type
+    # Indexed through the account path, see the table's __table_args__
+    account: str
     payee: str | None = None
     narration: str
     amount_ars: float
@@ -36,13 +41,70 @@ class IncomeCreate(IncomeBase):
 class Income(IncomeBase, table=True):
     """Database model for income transactions."""
 
+    __table_args__ = (
+        # Account-subtree filters (`LIKE 'path%'`) combined with a date range;
+        # text_pattern_ops keeps prefix matching indexable under any collation
+        Index(
+            "ix_income_account_path_date",
+            "account_path",
+            "date",
+            postgresql_ops={"account_path": "text_pattern_ops"},
+        ),
+        # Date-range filters narrowed by origin, with the amounts included for
+        # index-only scans, as on the expense table
+        Index(
+            "ix_income_date_origin",
+            "date",
+            "origin",
+            postgresql_include=["amount_ars", "amount_usd", "amount_cars"],
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
+    # Generated by Postgres from the account on every write, see app.core.account_paths
+    account_path: str | None = Field(
+        default=None,
+        sa_column=Column(
+            Text, Computed(ACCOUNT_PATH_SQL, persisted=True), nullable=False
+        ),
+    )
+
+
+class IncomeMonthlyRollup(SQLModel, table=True):
+    """Monthly income totals per account, maintained by the ledger sync."""
+
+    __tablename__ = "income_monthly_rollup"
+
+    # Columns copied from the incomes grouped into a cell
+    dimensions: ClassVar[tuple[str, ...]] = ("origin",)
+
+    month: date_type = Field(primary_key=True)
+    account: str = Field(primary_key=True)
+    origin: str = Field(index=True)
+    amount_ars: float
+    amount_usd: float
+    amount_cars: float
+    count: int
+
+
+class IncomePublic(IncomeBase):
+    """Public model for income transactions."""
+
+    id: uuid.UUID
+
+
+# Columns of an export, in order
+EXPORT_COLUMNS: tuple[str, ...] = ("id", *IncomeBase.model_fields)
+
+# Fields of each item of `Incomes`, in serialization order
+PUBLIC_COLUMNS: tuple[str, ...] = tuple(IncomePublic.model_fields)
+
 
 class Incomes(SQLModel):
     """Response model for paginated income transactions."""
 
-    data: list[Income]
+    data: list[IncomePublic]
     count: int
     pagination: dict[str, int] | None = None
 
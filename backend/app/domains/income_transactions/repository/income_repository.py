@@ -2,19 +2,25 @@
 
 import builtins
 import uuid
-from collections.abc import Generator
+from collections.abc import Generator, Iterator, Sequence
+from datetime import date
 from typing import Any
 
-from sqlmodel import Session, func, select
+from sqlalchemy import Row, String, cast, literal
+from sqlmodel import Session, col, func, select
 from sqlmodel.sql.expression import SelectOfScalar
 
+from app.core.account_paths import ancestor_at_depth
 from app.domains.income_transactions.domain.errors import IncomeNotFoundError
 from app.domains.income_transactions.domain.models import (
+    EXPORT_COLUMNS,
     Income,
     IncomeCreate,
+    IncomeMonthlyRollup,
 )
-from app.domains.income_transactions.domain.options import SearchOptions
+from app.domains.income_transactions.domain.options import SearchFilters, SearchOptions
 from app.domains.income_transactions.repository.builders.search import (
+    build_filtered_search,
     build_options,
 )
 
@@ -116,3 +122,134 @@ class IncomeRepository:
         incomes = list(result)
 
         return incomes, count
+
+    def search_rows(
+        self, options: SearchOptions, columns: Sequence[str]
+    ) -> tuple[builtins.list[Row[Any]], int]:
+        """Search like `search`, returning plain rows of the given columns.
+
+        No ORM object is built per row, for responses serialized straight
+        from the column values.
+
+        Returns:
+            The matching rows, with the `columns` values in order, and the
+            total count
+        """
+        selected = [getattr(Income, column) for column in columns]
+        query = build_options(select(*selected), options)
+        count = self.count(options)
+
+        return list(self.db_session.exec(query)), count
+
+    def monthly_totals(
+        self,
+        from_date: date,
+        to_date: date,
+        group_columns: builtins.list[str],
+    ) -> builtins.list[tuple[Any, ...]]:
+        """Sum the monthly rollup table over a range of whole months.
+
+        Args:
+            from_date: First month to include (first day of the month)
+            to_date: First month to exclude (first day of the month)
+            group_columns: Rollup columns to group by
+
+        Returns:
+            Rows with the group columns followed by the ARS, USD and CARS totals
+        """
+        columns = [getattr(IncomeMonthlyRollup, column) for column in group_columns]
+        query = (
+            select(  # type: ignore[call-overload]
+                *columns,
+                func.sum(IncomeMonthlyRollup.amount_ars),
+                func.sum(IncomeMonthlyRollup.amount_usd),
+                func.sum(IncomeMonthlyRollup.amount_cars),
+            )
+            .where(
+                IncomeMonthlyRollup.month >= from_date,
+                IncomeMonthlyRollup.month < to_date,
+            )
+            .group_by(*columns)
+        )
+
+        return list(self.db_session.exec(query))
+
+    def account_totals(
+        self, filters: SearchFilters, depth: int | None = None
+    ) -> builtins.list[tuple[Any, ...]]:
+        """Sum the income transactions matching the filters in a single query.
+
+        Args:
+            filters: Search filters; an account filter selects the whole subtree
+            depth: Group the totals by the ancestor account at this depth
+                instead of returning a single row
+
+        Returns:
+            Rows with the account (None when not grouped) followed by the ARS,
+            USD and CARS totals, the number of transactions and the date of
+            the last one
+        """
+        if depth:
+            return self._totals(filters, ancestor_at_depth(Income.account, depth))
+        return self._totals(filters, None)
+
+    def totals_by_account(
+        self, filters: SearchFilters
+    ) -> builtins.list[tuple[Any, ...]]:
+        """Sum the income transactions matching the filters per account.
+
+        Unlike `account_totals`, each account only includes its own
+        transactions, not those of its descendants.
+
+        Returns:
+            Rows shaped like those of `account_totals`
+        """
+        return self._totals(filters, Income.account)
+
+    def _totals(
+        self, filters: SearchFilters, group: Any | None
+    ) -> builtins.list[tuple[Any, ...]]:
+        """Sum the filtered transactions, grouped by `group` when given."""
+        account = (literal(None, String) if group is None else group).label("account")
+        query = build_filtered_search(
+            select(  # type: ignore[call-overload]
+                account,
+                func.coalesce(func.sum(Income.amount_ars), 0.0),
+                func.coalesce(func.sum(Income.amount_usd), 0.0),
+                func.coalesce(func.sum(Income.amount_cars), 0.0),
+                func.count(),
+                func.max(Income.date),
+            ),
+            filters,
+        )
+        if group is not None:
+            query = query.group_by(account).order_by(account)
+
+        return list(self.db_session.exec(query))
+
+    def stream(
+        self, filters: SearchFilters, batch_size: int
+    ) -> Iterator[Sequence[Row[Any]]]:
+        """Stream the income transactions matching the filters, oldest first.
+
+        Rows are fetched through a server-side cursor, `batch_size` at a time,
+        so memory use does not grow with the number of rows. The stream opens
+        a session of its own, since it is consumed after the request handler
+        has returned.
+
+        Returns:
+            Batches of rows with the `EXPORT_COLUMNS` values, in that order,
+            and the ID as text
+        """
+        # IDs are fetched as text, as every export format writes them
+        columns = [
+            cast(Income.id, String).label("id")
+            if column == "id"
+            else getattr(Income, column)
+            for column in EXPORT_COLUMNS
+        ]
+        query = build_filtered_search(select(*columns), filters)
+        query = query.order_by(col(Income.date), col(Income.id))
+        with Session(self.db_session.get_bind()) as session:
+            result = session.execute(query.execution_options(yield_per=batch_size))
+            yield from result.partitions()
@@ -1,12 +1,20 @@
 """Income transactions service implementation."""
 
 import uuid
+from collections.abc import Iterator, Sequence
+from datetime import date
+from typing import Any
+
+from pydantic_core import to_json
+from sqlalchemy import Row
 
 from app.domains.income_transactions.domain.models import (
+    PUBLIC_COLUMNS,
     Income,
+    IncomePublic,
     Incomes,
 )
-from app.domains.income_transactions.domain.options import SearchOptions
+from app.domains.income_transactions.domain.options import SearchFilters, SearchOptions
 from app.domains.income_transactions.repository import provide_income_repository
 from app.domains.income_transactions.repository.income_repository import (
     IncomeRepository,
@@ -37,7 +45,7 @@ class IncomeService:
         count = self.income_repository.count()
 
         return Incomes(
-            data=[Income.model_validate(income) for income in incomes],
+            data=[IncomePublic.model_validate(income) for income in incomes],
             count=count,
             pagination={"skip": skip, "limit": limit},
         )
@@ -56,7 +64,7 @@ class IncomeService:
 
         # Convert to domain models
         return Incomes(
-            data=[Income.model_validate(income) for income in incomes],
+            data=[IncomePublic.model_validate(income) for income in incomes],
             count=count,
             pagination={
                 "skip": options.pagination.skip,
@@ -64,6 +72,92 @@ class IncomeService:
             },
         )
 
+    def search_incomes_json(
+        self, options: SearchOptions, fields: Sequence[str] = PUBLIC_COLUMNS
+    ) -> bytes:
+        """Search income transactions and serialize them as `Incomes` JSON.
+
+        Lean path for large pages: the row values are written straight to
+        JSON, without validating an `IncomePublic` per row and the whole response
+        again.
+
+        Args:
+            options: Search options, as for `search_incomes`
+            fields: Fields of each item; only these columns are selected
+
+        Returns:
+            bytes: The JSON of the `Incomes` response
+        """
+        rows, count = self.income_repository.search_rows(options, fields)
+
+        return to_json(
+            {
+                "data": [dict(zip(fields, row, strict=True)) for row in rows],
+                "count": count,
+                "pagination": {
+                    "skip": options.pagination.skip,
+                    "limit": options.pagination.limit,
+                },
+            }
+        )
+
+    def get_monthly_totals(
+        self, from_date: date, to_date: date, group_columns: list[str]
+    ) -> list[tuple[Any, ...]]:
+        """Get income totals from the monthly rollup.
+
+        Args:
+            from_date: First month to include (first day of the month)
+            to_date: First month to exclude (first day of the month)
+            group_columns: Rollup columns to group by
+
+        Returns:
+            Rows with the group columns followed by the ARS, USD and CARS totals
+        """
+        return self.income_repository.monthly_totals(from_date, to_date, group_columns)
+
+    def get_account_totals(
+        self, filters: SearchFilters, depth: int | None = None
+    ) -> list[tuple[Any, ...]]:
+        """Get income totals for an account subtree, optionally per sub-account.
+
+        Args:
+            filters: Search filters; an account filter selects the whole subtree
+            depth: Group the totals by the ancestor account at this depth
+
+        Returns:
+            Rows with the account (None when not grouped) followed by the ARS,
+            USD and CARS totals, the number of transactions and the date of
+            the last one
+        """
+        return self.income_repository.account_totals(filters, depth)
+
+    def get_totals_by_account(self, filters: SearchFilters) -> list[tuple[Any, ...]]:
+        """Get income totals per account, each excluding its descendants.
+
+        Args:
+            filters: Search filters
+
+        Returns:
+            Rows shaped like those of `get_account_totals`
+        """
+        return self.income_repository.totals_by_account(filters)
+
+    def stream_incomes(
+        self, filters: SearchFilters, batch_size: int
+    ) -> Iterator[Sequence[Row[Any]]]:
+        """Stream the income transactions matching the filters, oldest first.
+
+        Args:
+            filters: Search filters
+            batch_size: Number of rows fetched from the database at a time
+
+        Returns:
+            Batches of rows with the `EXPORT_COLUMNS` values, in that order,
+            and the ID as text
+        """
+        return self.income_repository.stream(filters, batch_size)
+
 
 def provide() -> IncomeService:
     """Provide an instance of IncomeService.
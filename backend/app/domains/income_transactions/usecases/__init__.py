@@ -1,5 +1,8 @@
 """Usecases for income transactions."""
 
+from app.domains.income_transactions.usecases.export_incomes import (
+    provide_export_incomes_usecase,
+)
 from app.domains.income_transactions.usecases.get_income_summary import (
     provide_get_income_summary_use_case,
 )
@@ -8,6 +11,7 @@ from app.domains.income_transactions.usecases.get_incomes import (
 )
 
 __all__ = [
+    "provide_export_incomes_usecase",
     "provide_get_incomes_usecase",
     "provide_get_income_summary_use_case",
 ]
@@ -0,0 +1,10 @@
+"""Export incomes usecase."""
+
+from app.domains.income_transactions.usecases.export_incomes.usecase import (
+    ExportIncomesUseCase,
+)
+from app.domains.income_transactions.usecases.export_incomes.usecase import (
+    provide as provide_export_incomes_usecase,
+)
+
+__all__ = ["ExportIncomesUseCase", "provide_export_incomes_usecase"]
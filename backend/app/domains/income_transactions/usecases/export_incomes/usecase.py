@@ -0,0 +1,87 @@
+"""Usecase for exporting incomes as a stream of CSV, NDJSON, Arrow or Parquet."""
+
+from datetime import date, datetime
+
+from app.core.config import settings
+from app.domains.income_transactions.domain import options as opts
+from app.domains.income_transactions.domain.models import EXPORT_COLUMNS, Income
+from app.domains.income_transactions.service import (
+    IncomeService,
+    provide_income_service,
+)
+from app.pkgs.export import ExportFormat, ExportStream, parse_format, stream_export
+
+
+class ExportIncomesUseCase:
+    """Usecase for exporting every income matching a set of filters."""
+
+    def __init__(self, income_service: IncomeService) -> None:
+        """Initialize the usecase with an income service.
+
+        Args:
+            income_service: Service for handling income transactions
+        """
+        self.income_service = income_service
+
+    def execute(
+        self,
+        from_date: date,
+        to_date: date | None = None,
+        origin: str | None = None,
+        account: str | None = None,
+        export_format: str | ExportFormat = ExportFormat.CSV,
+    ) -> ExportStream:
+        """
+        Execute the usecase to stream the matching incomes, oldest first.
+
+        The rows are read from the database as the stream is consumed.
+
+        Args:
+            from_date: Start date for filtering
+            to_date: End date for filtering (defaults to current date if None)
+            origin: Optional origin filter
+            account: Optional account filter, including its sub-accounts
+            export_format: Format of the export ('csv', 'ndjson', 'arrow' for
+                an Arrow IPC stream, or 'parquet')
+
+        Returns:
+            ExportStream: The encoded chunks, their media type and a file name
+
+        Raises:
+            ValueError: If the export format is invalid
+        """
+        normalized_format = parse_format(export_format)
+
+        # Determine effective end date
+        effective_to_date: date = to_date or datetime.now().date()
+
+        search_filters = opts.SearchFilters(
+            from_date=from_date,
+            to_date=effective_to_date,
+            origin=origin,
+            account=account,
+        )
+
+        batches = self.income_service.stream_incomes(
+            search_filters,
+            settings.EXPORT_COLUMNAR_BATCH_SIZE
+            if normalized_format.is_columnar
+            else settings.EXPORT_BATCH_SIZE,
+        )
+        return ExportStream(
+            chunks=stream_export(batches, Income, EXPORT_COLUMNS, normalized_format),
+            media_type=normalized_format.media_type,
+            filename=(
+                f"income-{from_date.isoformat()}-{effective_to_date.isoformat()}"
+                f".{normalized_format.value}"
+            ),
+        )
+
+
+def provide() -> ExportIncomesUseCase:
+    """Provide an instance of ExportIncomesUseCase.
+
+    Returns:
+        ExportIncomesUseCase: A new instance with the income service
+    """
+    return ExportIncomesUseCase(provide_income_service())
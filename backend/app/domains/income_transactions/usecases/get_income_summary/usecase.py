@@ -4,6 +4,7 @@ from collections import defaultdict
 from datetime import date, datetime
 from enum import Enum
 
+from app.core.cache import cached
 from app.domains.income_transactions.domain import options as opts
 from app.domains.income_transactions.domain.models import (
     Incomes,
@@ -67,6 +68,29 @@ class GetIncomeSummaryUseCase:
         # Determine effective end date
         effective_to_date: date = to_date or datetime.now().date()
 
+        return self._summarize(from_date, effective_to_date, normalized_group_by)
+
+    @cached("income.summary")
+    def _summarize(
+        self,
+        from_date: date,
+        effective_to_date: date,
+        normalized_group_by: GroupBy,
+    ) -> IncomeSummaryResponse:
+        """Summarize the income of a normalized date range and grouping.
+
+        Results are cached per ledger version.
+        """
+        # Whole-month ranges are served from the monthly rollup
+        if from_date.day == 1 and effective_to_date.day == 1:
+            return {
+                "data": self._summarize_rollup(
+                    from_date, effective_to_date, normalized_group_by
+                ),
+                "from_date": from_date.isoformat(),
+                "to": effective_to_date.isoformat(),
+            }
+
         search_filters = opts.SearchFilters(
             from_date=from_date,
             to_date=effective_to_date,
@@ -98,6 +122,46 @@ class GetIncomeSummaryUseCase:
             "to": effective_to_date.isoformat(),
         }
 
+    def _summarize_rollup(
+        self,
+        from_date: date,
+        to_date: date,
+        group_by: GroupBy = GroupBy.ORIGIN,
+    ) -> list[IncomeSummary]:
+        """Aggregate income from the monthly rollup table.
+
+        Args:
+            from_date: First day of the first month to include
+            to_date: First day of the first month to exclude
+            group_by: Field to group results by (origin or month)
+
+        Returns:
+            List of IncomeSummary objects, keyed like `_aggregate_incomes`
+        """
+        group_column = "origin" if group_by == GroupBy.ORIGIN else "month"
+        rows = self.income_service.get_monthly_totals(
+            from_date, to_date, [group_column]
+        )
+
+        result: list[IncomeSummary] = []
+        for key, amount_ars, amount_usd, amount_cars in rows:
+            group_key: str
+            if group_by == GroupBy.ORIGIN:
+                group_key = key
+            else:  # GroupBy.MONTH
+                group_key = f"{key.year}-{key.month:02d}-01"
+
+            result.append(
+                IncomeSummary(
+                    group=group_key,
+                    amount_ars=amount_ars,
+                    amount_usd=amount_usd,
+                    amount_cars=amount_cars,
+                )
+            )
+
+        return result
+
     def _aggregate_incomes(
         self,
         incomes: Incomes,
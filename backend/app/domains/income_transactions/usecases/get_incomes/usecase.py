@@ -2,8 +2,9 @@
 
 from datetime import date, datetime
 
+from app.core.fields import parse_fields
 from app.domains.income_transactions.domain import options as opts
-from app.domains.income_transactions.domain.models import Incomes
+from app.domains.income_transactions.domain.models import PUBLIC_COLUMNS, Incomes
 from app.domains.income_transactions.service import (
     IncomeService,
     provide_income_service,
@@ -42,6 +43,47 @@ class GetIncomesUseCase:
         Returns:
             Incomes: Paginated incomes data
         """
+        search_options = self._search_options(from_date, to_date, origin, skip, limit)
+        return self.income_service.search_incomes(search_options)
+
+    def execute_json(
+        self,
+        from_date: date,
+        to_date: date | None = None,
+        origin: str | None = None,
+        skip: int = 0,
+        limit: int = 50,
+        fields: str | None = None,
+    ) -> bytes:
+        """
+        Execute the usecase, returning the `Incomes` response as JSON.
+
+        Takes the same arguments as `execute`, but serializes the rows
+        directly instead of building a model per income.
+
+        Args:
+            fields: Comma-separated fields each item should have (defaults
+                to all of them)
+
+        Returns:
+            bytes: The JSON of the paginated incomes data
+
+        Raises:
+            ValueError: If a field is unknown
+        """
+        selected_fields = parse_fields(fields, PUBLIC_COLUMNS)
+        search_options = self._search_options(from_date, to_date, origin, skip, limit)
+        return self.income_service.search_incomes_json(search_options, selected_fields)
+
+    def _search_options(
+        self,
+        from_date: date,
+        to_date: date | None,
+        origin: str | None,
+        skip: int,
+        limit: int,
+    ) -> opts.SearchOptions:
+        """Build the search options of a request, as documented in `execute`."""
         # Determine effective end date
         effective_to_date: date = to_date or datetime.now().date()
 
@@ -62,7 +104,7 @@ class GetIncomesUseCase:
             .with_pagination(search_pagination)
         )
 
-        return self.income_service.search_incomes(search_options)
+        return search_options
 
 
 def provide() -> GetIncomesUseCase:
@@ -2,10 +2,15 @@
 Load the ledger file and store the entries, errors, and options.
 """
 
+import hashlib
+from pathlib import Path
+
 from beancount.core.data import BeancountError, Directive
 from beancount.loader import load_file
 from beanquery.query import run_query
 
+from app.core.metrics import LEDGER_PARSE_DURATION
+
 
 class Ledger:
     """
@@ -15,17 +20,54 @@ class Ledger:
     entries: list[Directive]
     errors: list[BeancountError]
     options: dict[str, str]
+    # Files the ledger was parsed from, the ones `version` is a hash of
+    sources: list[str]
+    version: str
 
     def __init__(self, ledger_path: str) -> None:
         """
         Load the ledger file and store the entries, errors, and options.
         """
         self.path = ledger_path
-        entries, errors, options = load_file(self.path)
+        self.reload()
+
+    def reload(self) -> bool:
+        """
+        Load the ledger file again, e.g. after it changed on disk.
+
+        The source files are hashed before parsing, which is skipped when they
+        are unchanged, and again after: a file saved during the parse would
+        otherwise give entries older than the version. The ledger is then
+        parsed again. Files the parse newly includes are only hashed after it.
+        A source that can't be read anymore, e.g. removed along with its
+        include, counts as changed.
+
+        Returns True when the ledger's version changed.
+        """
+        previous = getattr(self, "version", None)
+        sources = getattr(self, "sources", [self.path])
+        before = _readable_version(sources)
+        if before is not None and before == previous:
+            return False
+
+        while True:
+            with LEDGER_PARSE_DURATION.time():
+                entries, errors, options = load_file(self.path)
+            after = _readable_version(sources)
+            if after == before:
+                break
+            before = after
 
         self.entries = entries
         self.errors = errors
         self.options = options
+        self.sources = options.get("include") or [self.path]
+        self.version = (
+            before
+            if before is not None and self.sources == sources
+            else source_version(self.sources)
+        )
+        return self.version != previous
 
     def run_query(
         self, query: str
@@ -47,3 +89,29 @@ def ledger_hash(ledger: Ledger) -> int:
     Return the hash of the ledger file.
     """
     return hash(frozenset(str(entr) for entr in ledger.entries))
+
+
+def source_version(paths: list[str]) -> str:
+    """
+    Return a version identifier for the contents of the ledger's source files.
+
+    The version is a SHA-256 over the files' paths and contents, so it only
+    changes when one of the files actually changes.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.encode())
+        digest.update(b"\0")
+        digest.update(Path(path).read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _readable_version(paths: list[str]) -> str | None:
+    """
+    Return the `source_version` of the files, None if one can't be read.
+    """
+    try:
+        return source_version(paths)
+    except OSError:
+        return None
@@ -1,3 +1,4 @@
+import tracemalloc
 from contextlib import asynccontextmanager
 
 import sentry_sdk
@@ -8,11 +9,22 @@ from sqlmodel import Session
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.api.middleware import (
+    CompressionMiddleware,
+    LedgerETagMiddleware,
+    ProfilingMiddleware,
+    RequestMetricsMiddleware,
+    ServerTimingMiddleware,
+)
+from app.api.routes import metrics
 from app.core.config import settings
 from app.core.db import engine, init_db
+from app.core.query_metrics import instrument_queries
 from app.ledger import Ledger
 from app.services.beancount.handlers import LedgerWatcher
+from app.services.beancount.notifications import VersionListener
 from app.services.beancount.sync import BeancountSyncService
+from app.services.beancount.worker import LedgerWorker, wait_for_version
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -29,20 +41,42 @@ async def lifespan(app: FastAPI):
     Handles FastAPI startup and shutdown events using the lifespan protocol.
     See: https://fastapi.tiangolo.com/advanced/events/#lifespan
     """
-    ledger = Ledger(settings.LEDGER_PATH + "/main.bean")
+    if settings.TRACEMALLOC_FRAMES:
+        # Before the ledger is loaded, so its allocations are traced too
+        tracemalloc.start(settings.TRACEMALLOC_FRAMES)
     # Use Session(engine) directly
     db = Session(engine)
     init_db(db)
-    sync_service = BeancountSyncService(ledger, db)
-    sync_service.sync_all()
-    watcher = LedgerWatcher(settings.LEDGER_PATH, sync_service)
-    watcher.start()
-    app.state.ledger_watcher = watcher
+    # Versions synced by the other processes
+    listener = VersionListener(
+        engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    )
+    listener.start()
+    app.state.version_listener = listener
+    app.state.ledger_watcher = None
+    app.state.ledger_worker = None
+
+    if settings.LEDGER_WORKER:
+        worker = LedgerWorker(settings.LEDGER_PATH)
+        worker.start()
+        app.state.ledger_worker = worker
+        await wait_for_version(settings.LEDGER_WORKER_STARTUP_TIMEOUT)
+    else:
+        ledger = Ledger(settings.LEDGER_PATH + "/main.bean")
+        sync_service = BeancountSyncService(ledger, db)
+        sync_service.sync_all()
+        app.state.sync_service = sync_service
+        watcher = LedgerWatcher(settings.LEDGER_PATH, sync_service)
+        watcher.start()
+        app.state.ledger_watcher = watcher
 
     yield
 
     if app.state.ledger_watcher:
         app.state.ledger_watcher.stop()
+    if app.state.ledger_worker:
+        app.state.ledger_worker.stop()
+    app.state.version_listener.stop()
 
 
 app = FastAPI(
@@ -52,6 +86,45 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Count and time every statement, and report them per request
+instrument_queries()
+if settings.SERVER_TIMING:
+    app.add_middleware(ServerTimingMiddleware)
+
+# Ledger-backed routes only change with the synced ledger version; added
+# before CORS so that 304 responses still get the CORS headers
+app.add_middleware(
+    LedgerETagMiddleware,
+    path_prefixes=[
+        f"{settings.API_V1_STR}/{prefix}/"
+        for prefix in ("expenses", "income", "accounts", "analytics")
+    ],
+)
+
+# Wraps the ETag middleware, so profiled requests always run the route
+# instead of getting a 304, and profiles get no ETag
+if settings.REQUEST_PROFILING:
+    app.add_middleware(
+        ProfilingMiddleware, interval=settings.REQUEST_PROFILING_INTERVAL_MS / 1000
+    )
+
+# Wraps the ETag middleware, so the ETags of compressed responses are
+# made weak
+app.add_middleware(
+    CompressionMiddleware,
+    encodings=settings.COMPRESSION_ENCODINGS,
+    levels=settings.COMPRESSION_LEVELS,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    # Exports are large and streamed while they're read; favour speed there
+    route_levels={
+        f"{settings.API_V1_STR}/{prefix}/export": {"gzip": 1, "br": 1, "zstd": 1}
+        for prefix in ("expenses", "income")
+    },
+)
+
+# Outside compression, so the latency covers the whole response
+app.add_middleware(RequestMetricsMiddleware)
+
 # Set all CORS enabled origins
 if settings.all_cors_origins:
     app.add_middleware(
@@ -63,6 +136,10 @@ if settings.all_cors_origins:
     )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
+app.include_router(metrics.router)
 
-mcp = FastApiMCP(app, name=settings.PROJECT_NAME)
+# Event streams never end, so they can't be called as tools
+mcp = FastApiMCP(
+    app, name=settings.PROJECT_NAME, exclude_operations=["sync-sync_events"]
+)
 mcp.mount()
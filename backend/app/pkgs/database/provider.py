@@ -9,7 +9,12 @@ from app.core.config import settings
 # Create SQLAlchemy engine
 # Convert MultiHostUrl to string properly
 database_url = settings.SQLALCHEMY_DATABASE_URI
-engine = create_engine(database_url.unicode_string(), pool_pre_ping=True)
+engine = create_engine(
+    database_url.unicode_string(),
+    pool_pre_ping=True,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+)
 
 
 def get_db() -> Generator[Session, None, None]:
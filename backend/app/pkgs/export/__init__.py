@@ -0,0 +1,13 @@
+"""Export package."""
+
+from .formats import ExportFormat, ExportStream, parse_format
+from .stream import stream_export
+from .text import stream_rows
+
+__all__ = [
+    "ExportFormat",
+    "ExportStream",
+    "parse_format",
+    "stream_export",
+    "stream_rows",
+]
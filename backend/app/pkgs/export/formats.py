@@ -0,0 +1,66 @@
+"""Export formats."""
+
+from collections.abc import Iterator
+from enum import Enum
+from importlib.util import find_spec
+from typing import NamedTuple
+
+
+class ExportFormat(Enum):
+    """Formats rows can be exported as."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+    # Columnar formats, available when pyarrow is installed
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+    @property
+    def media_type(self) -> str:
+        """Content type of the format."""
+        return _MEDIA_TYPES[self]
+
+    @property
+    def is_columnar(self) -> bool:
+        """Whether rows are encoded column by column, through pyarrow."""
+        return self in (ExportFormat.ARROW, ExportFormat.PARQUET)
+
+
+_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+class ExportStream(NamedTuple):
+    """An export ready to be sent as a streaming response."""
+
+    chunks: Iterator[bytes]
+    media_type: str
+    filename: str
+
+
+def parse_format(export_format: str | ExportFormat) -> ExportFormat:
+    """Normalize an export format name.
+
+    Raises:
+        ValueError: If the format is not supported, or needs pyarrow and it
+            is not installed
+    """
+    normalized: ExportFormat
+    if isinstance(export_format, str):
+        format_str = export_format.upper()
+        if format_str not in ExportFormat.__members__:
+            raise ValueError(f"Invalid export format: {export_format}")
+        normalized = ExportFormat[format_str]
+    else:
+        normalized = export_format
+
+    if normalized.is_columnar and find_spec("pyarrow") is None:
+        raise ValueError(
+            f"The {normalized.value} export format requires pyarrow "
+            "(install the 'arrow' extra)"
+        )
+    return normalized
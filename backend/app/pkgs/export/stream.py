@@ -0,0 +1,30 @@
+"""Stream database row batches in any export format."""
+
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.pkgs.export.columnar import stream_columnar
+from app.pkgs.export.formats import ExportFormat
+from app.pkgs.export.text import stream_rows
+
+
+def stream_export(
+    batches: Iterable[Sequence[Sequence[Any]]],
+    model: type[BaseModel],
+    columns: Sequence[str],
+    export_format: ExportFormat,
+) -> Iterator[bytes]:
+    """Encode batches of rows, with values in `columns` order, as byte chunks.
+
+    Args:
+        batches: Rows as fetched from the database, a batch at a time
+        model: Model whose fields describe the columns' types
+        columns: Names of the row values, in order
+        export_format: Format to encode the rows in
+    """
+    if export_format.is_columnar:
+        return stream_columnar(batches, model, columns, export_format)
+    return stream_rows(itertools.chain.from_iterable(batches), columns, export_format)
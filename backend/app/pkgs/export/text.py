@@ -0,0 +1,79 @@
+"""Encode rows as a stream of CSV or NDJSON chunks."""
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from app.pkgs.export.formats import ExportFormat
+
+# Rows are buffered into chunks of about this size before being sent, so a
+# response isn't split into one write per row
+CHUNK_SIZE = 64 * 1024
+
+
+def _csv_value(value: Any) -> Any:
+    """Format a value for a CSV cell; dates use ISO format and None is empty."""
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def encode_csv(rows: Iterable[Sequence[Any]], columns: Sequence[str]) -> Iterator[str]:
+    """Encode rows as CSV lines, starting with a header of the columns."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    writer.writerow(columns)
+    yield flush()
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        yield flush()
+
+
+def encode_ndjson(
+    rows: Iterable[Sequence[Any]], columns: Sequence[str]
+) -> Iterator[str]:
+    """Encode rows as one JSON object per line."""
+    for row in rows:
+        record = dict(zip(columns, row, strict=True))
+        yield json.dumps(record, default=str) + "\n"
+
+
+def stream_rows(
+    rows: Iterable[Sequence[Any]],
+    columns: Sequence[str],
+    export_format: ExportFormat,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Encode rows, with values in `columns` order, as a stream of byte chunks.
+
+    The CSV header is sent as soon as iteration starts; the rows follow in
+    chunks of about `chunk_size` bytes. Only the current chunk is held in
+    memory.
+    """
+    if export_format == ExportFormat.CSV:
+        lines = encode_csv(rows, columns)
+        yield next(lines).encode()
+    else:
+        lines = encode_ndjson(rows, columns)
+
+    chunk: list[str] = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield "".join(chunk).encode()
+            chunk, size = [], 0
+    if chunk:
+        yield "".join(chunk).encode()
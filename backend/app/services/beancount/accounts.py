@@ -0,0 +1,83 @@
+"""Build the account tree from the ledger's Open and Close directives."""
+
+import uuid
+from collections.abc import Iterable
+
+from beancount.core.data import Close, Directive, Open
+
+from app.core.account_paths import ACCOUNT_SEPARATOR
+from app.domains.accounts.domain.models import Account, AccountClosure
+
+# Account IDs are derived from the account name, so they stay the same across
+# syncs and can be used in URLs
+ACCOUNT_ID_NAMESPACE = uuid.UUID("8f0d7a51-3c7e-4d35-9d1b-6a4f2c1e9b07")
+
+
+def account_id(name: str) -> uuid.UUID:
+    """Return the stable ID of an account."""
+    return uuid.uuid5(ACCOUNT_ID_NAMESPACE, name)
+
+
+def _ancestors(name: str) -> list[str]:
+    """Return the names of an account's ancestors, root first."""
+    segments = name.split(ACCOUNT_SEPARATOR)
+    return [ACCOUNT_SEPARATOR.join(segments[:end]) for end in range(1, len(segments))]
+
+
+def build_account_tree(
+    entries: Iterable[Directive],
+) -> tuple[list[Account], list[AccountClosure]]:
+    """Build the accounts and their closure rows from the ledger directives.
+
+    Parents that are never opened explicitly (`Expenses` for
+    `Expenses:Food:Groceries`) are created too. An implicit parent is active
+    while any of its descendants is.
+
+    Returns:
+        The accounts, parents before children, and the closure rows pairing
+        each account with itself and every ancestor
+    """
+    opened: dict[str, Open] = {}
+    closed: set[str] = set()
+    for entry in entries:
+        if isinstance(entry, Open):
+            opened[entry.account] = entry
+        elif isinstance(entry, Close):
+            closed.add(entry.account)
+
+    names = set(opened)
+    for name in opened:
+        names.update(_ancestors(name))
+
+    active = {name for name in opened if name not in closed}
+    for name in list(active):
+        active.update(
+            ancestor for ancestor in _ancestors(name) if ancestor not in opened
+        )
+
+    accounts = []
+    closure: list[AccountClosure] = []
+    # Sorting by name puts every parent before its children
+    for name in sorted(names):
+        ancestors = _ancestors(name)
+        open_entry = opened.get(name)
+        accounts.append(
+            Account(
+                id=account_id(name),
+                name=name,
+                type=name.split(ACCOUNT_SEPARATOR)[0],
+                currency=",".join(open_entry.currencies or []) if open_entry else "",
+                is_active=name in active,
+                parent_id=account_id(ancestors[-1]) if ancestors else None,
+            )
+        )
+        closure.extend(
+            AccountClosure(
+                ancestor_id=account_id(ancestor),
+                descendant_id=account_id(name),
+                depth=depth,
+            )
+            for depth, ancestor in enumerate(reversed([*ancestors, name]))
+        )
+
+    return accounts, closure
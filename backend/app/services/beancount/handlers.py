@@ -4,6 +4,7 @@ from pathlib import Path
 from watchdog.events import DirModifiedEvent, FileModifiedEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from app.core.metrics import WATCHER_EVENTS, WATCHER_LAST_EVENT
 from app.services.beancount.sync import BeancountSyncService
 
 logger = logging.getLogger(__name__)
@@ -20,7 +21,6 @@ class LedgerChangeHandler(FileSystemEventHandler):
     ):
         self.sync_service = sync_service
         self.file_patterns: set[str] = FILE_PATTERNS
-        self._last_sync_path = None
 
     def on_modified(self, event: FileModifiedEvent | DirModifiedEvent) -> None:
         """Handle file modification events."""
@@ -29,16 +29,15 @@ class LedgerChangeHandler(FileSystemEventHandler):
             and isinstance(event.src_path, str)
             and Path(event.src_path).suffix in self.file_patterns
         ):
-            # Avoid duplicate syncs for the same file
-            if event.src_path == self._last_sync_path:
-                return
-
-            self._last_sync_path = event.src_path
             logger.info(f"Detected changes in {event.src_path}, syncing data...")
+            WATCHER_EVENTS.inc()
+            WATCHER_LAST_EVENT.set_to_current_time()
 
+            # Editors emit several events per save; syncs of an unchanged
+            # ledger are skipped by comparing versions
             try:
-                self.sync_service.sync_all()
-                logger.info("Data sync completed successfully")
+                if self.sync_service.sync_changes():
+                    logger.info("Data sync completed successfully")
             except Exception as e:
                 logger.error(f"Error syncing data: {str(e)}")
 
@@ -0,0 +1,35 @@
+"""Tables of the ledger sync itself, rather than of the synced data."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Text
+from sqlmodel import Field, SQLModel
+
+
+class LedgerSync(SQLModel, table=True):
+    """Synced ledger version and sync progress, in a single row.
+
+    Written by whichever process syncs, so that every process can read the
+    state of the sync, see app/services/beancount/status.py.
+    """
+
+    __tablename__ = "ledger_sync"
+
+    id: int = Field(default=1, primary_key=True)
+    version: str | None = None
+    published_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
+    phase: str = "idle"
+    started_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
+    rows_processed: int = 0
+    last_duration_seconds: float | None = None
+    last_finished_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
+    last_error: str | None = Field(default=None, sa_column=Column(Text))
+    last_error_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
@@ -0,0 +1,107 @@
+"""Ledger versions synced by one process, published in all of them.
+
+Every worker process has its own in-memory state keyed on the synced version
+(see app/core/ledger_state.py), but only the process that ran a sync
+publishes it. That process sends the version with Postgres `NOTIFY` once it
+is committed, and each process runs a `VersionListener` that publishes the
+versions it hears about with `apply_version`, which reach their event
+streams too.
+
+A process already holding the version ignores it, so the syncing process
+receiving its own notification is harmless. Notifications sent while a
+listener is reconnecting are lost; the process catches up on the next sync.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+
+import psycopg
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.ledger_state import ledger_state
+from app.services.beancount.precompute import precompute_results
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "ledger_version"
+
+
+def notify_version(db: Session, version: str) -> None:
+    """Tell every listening process that `version` is synced."""
+    db.execute(
+        text("SELECT pg_notify(:channel, :version)"),
+        {"channel": CHANNEL, "version": version},
+    )
+    # Notifications are delivered when the transaction commits
+    db.commit()
+
+
+def apply_version(version: str) -> None:
+    """Publish a version synced by another process, like the sync would.
+
+    The common queries are precomputed first, in this process's cache.
+    """
+    if version == ledger_state.version:
+        return
+    precompute_results(version, settings.PRECOMPUTE_QUERIES)
+    ledger_state.publish(version)
+
+
+class VersionListener:
+    """Publishes the versions notified by syncing processes in this one."""
+
+    def __init__(
+        self,
+        url: str,
+        publish: Callable[[str], None] = apply_version,
+        reconnect_seconds: float = 5.0,
+    ):
+        self.url = url
+        self.publish = publish
+        self.reconnect_seconds = reconnect_seconds
+        self._stop = threading.Event()
+        self._listening = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start listening in a background thread."""
+        if self._thread:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ledger-version-listener", daemon=True
+        )
+        self._thread.start()
+
+    def wait_listening(self, timeout: float | None = None) -> bool:
+        """Wait until the listener is connected; returns False on timeout."""
+        return self._listening.wait(timeout)
+
+    def stop(self) -> None:
+        """Stop listening and wait for the thread to end."""
+        if not self._thread:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        logger.info("Stopped listening for ledger versions")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self.url, autocommit=True) as connection:
+                    connection.execute(f"LISTEN {CHANNEL}")
+                    self._listening.set()
+                    logger.info("Listening for ledger versions of other processes")
+                    while not self._stop.is_set():
+                        # Returns after the timeout, to check for a stop
+                        for notify in connection.notifies(timeout=1.0):
+                            self.publish(notify.payload)
+            except psycopg.Error as e:
+                logger.error(f"Ledger version listener failed: {str(e)}")
+                self._stop.wait(self.reconnect_seconds)
+            finally:
+                self._listening.clear()
@@ -0,0 +1,97 @@
+"""Precompute the results of common queries after a sync.
+
+Runs once the synced data is committed but before its version is published,
+so the results land in the result cache under the new version and the first
+requests after a ledger edit are served from it. The queries are called with
+the same arguments the API passes for default requests (no `to_date`, meaning
+today), so they share cache keys.
+"""
+
+import logging
+from collections.abc import Callable
+from datetime import date
+
+from app.core.ledger_state import ledger_state
+from app.domains.accounts.service import provide_account_tree_service
+from app.domains.accounts.usecases import provide_account_balance_usecase
+from app.domains.analytics.usecases import (
+    provide_combined_metrics_usecase,
+    provide_timeseries_usecase,
+)
+from app.domains.expenses_transactions.usecases import (
+    provide_expense_summary_usecase,
+)
+from app.domains.income_transactions.usecases import (
+    provide_get_income_summary_use_case,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _months_back(today: date, months: int) -> date:
+    """Return the first day of the month `months` months before `today`'s."""
+    index = today.year * 12 + today.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _current_month(today: date) -> None:
+    """Expense and income summaries and metrics of the current month."""
+    start = _months_back(today, 0)
+    provide_expense_summary_usecase().execute(start, group_by="category")
+    provide_get_income_summary_use_case().execute(start, group_by="origin")
+    provide_combined_metrics_usecase().execute(start)
+
+
+def _last_12_months(today: date) -> None:
+    """Expenses by category and the monthly series of the last 12 months."""
+    start = _months_back(today, 11)
+    provide_expense_summary_usecase().execute(start, group_by="category")
+    provide_timeseries_usecase().execute(start, bucket="month")
+
+
+def _year_to_date(today: date) -> None:
+    """Metrics and the monthly series since the start of the year."""
+    start = date(today.year, 1, 1)
+    provide_combined_metrics_usecase().execute(start)
+    provide_timeseries_usecase().execute(start, bucket="month")
+
+
+def _top_level_balances(today: date) -> None:  # noqa: ARG001
+    """Balances of the root accounts (`Expenses`, `Income`, ...)."""
+    usecase = provide_account_balance_usecase()
+    for root in provide_account_tree_service().get_index().roots:
+        usecase.execute(root.name)
+
+
+PRECOMPUTE_QUERIES: dict[str, Callable[[date], None]] = {
+    "current_month": _current_month,
+    "last_12_months": _last_12_months,
+    "year_to_date": _year_to_date,
+    "top_level_balances": _top_level_balances,
+}
+
+
+def precompute_results(
+    version: str, names: list[str], today: date | None = None
+) -> None:
+    """Run the named queries for a committed, not yet published, version.
+
+    A failing query is logged and skipped; it is computed on demand instead.
+
+    Args:
+        version: Ledger version whose data is committed
+        names: Keys of `PRECOMPUTE_QUERIES` to run
+        today: Date the periods are relative to (defaults to the current date)
+    """
+    effective_today = today or date.today()
+    with ledger_state.staged(version):
+        for name in names:
+            query = PRECOMPUTE_QUERIES.get(name)
+            if query is None:
+                logger.warning(f"Unknown precompute query: {name}")
+                continue
+            try:
+                query(effective_today)
+            except Exception as e:
+                logger.error(f"Precomputing {name} failed: {str(e)}")
+    logger.info(f"Precomputed {len(names)} queries for version {version[:12]}")
@@ -0,0 +1,97 @@
+"""Incremental maintenance of the monthly rollup tables."""
+
+import logging
+import math
+from collections.abc import Iterable
+from datetime import date
+from typing import Any
+
+from sqlmodel import Session, select
+
+logger = logging.getLogger(__name__)
+
+AMOUNT_COLUMNS = ("amount_ars", "amount_usd", "amount_cars")
+
+
+def aggregate_monthly(
+    rows: Iterable[Any], rollup_cls: Any
+) -> dict[tuple[date, str], dict[str, Any]]:
+    """Group transaction rows into (month, account) rollup cells.
+
+    Args:
+        rows: Expense or income rows, as mapped by the sync
+        rollup_cls: Rollup model, whose `dimensions` are copied to each cell
+
+    Returns:
+        The column values of every cell, keyed by (month, account)
+    """
+    cells: dict[tuple[date, str], dict[str, Any]] = {}
+    for row in rows:
+        month = row.date.replace(day=1)
+        key = (month, row.account)
+        cell = cells.get(key)
+        if cell is None:
+            cell = {"month": month, "account": row.account, "count": 0}
+            cell.update({dim: getattr(row, dim) for dim in rollup_cls.dimensions})
+            cell.update(dict.fromkeys(AMOUNT_COLUMNS, 0.0))
+            cells[key] = cell
+
+        for column in AMOUNT_COLUMNS:
+            cell[column] += float(getattr(row, column) or 0)
+        cell["count"] += 1
+    return cells
+
+
+def refresh_monthly_rollup(
+    session: Session, rows: Iterable[Any], rollup_cls: Any
+) -> int:
+    """Bring a rollup table in line with the given transaction rows.
+
+    The cells are recomputed in memory and diffed against the stored ones, so
+    only months that actually changed are written. The caller owns the
+    transaction: nothing is committed here.
+
+    Args:
+        session: Session used for reading and writing the rollup table
+        rows: Every transaction row of the source table
+        rollup_cls: Rollup model to refresh
+
+    Returns:
+        The number of inserted, updated or deleted cells
+    """
+    fresh = aggregate_monthly(rows, rollup_cls)
+    stored = {
+        (cell.month, cell.account): cell for cell in session.exec(select(rollup_cls))
+    }
+
+    changed = 0
+    for key, values in fresh.items():
+        cell = stored.pop(key, None)
+        if cell is None:
+            session.add(rollup_cls(**values))
+            changed += 1
+        elif not _same_cell(cell, values):
+            for column, value in values.items():
+                setattr(cell, column, value)
+            changed += 1
+
+    for cell in stored.values():
+        session.delete(cell)
+        changed += 1
+
+    logger.info(
+        f"Refreshed {rollup_cls.__tablename__}: {changed} of {len(fresh)} cells changed."
+    )
+    return changed
+
+
+def _same_cell(cell: Any, values: dict[str, Any]) -> bool:
+    """Compare a stored cell with freshly aggregated values."""
+    if cell.count != values["count"]:
+        return False
+    if any(getattr(cell, dim) != values[dim] for dim in type(cell).dimensions):
+        return False
+    return all(
+        math.isclose(getattr(cell, column), values[column], abs_tol=1e-9)
+        for column in AMOUNT_COLUMNS
+    )
@@ -0,0 +1,204 @@
+"""Progress of the ledger sync, for clients to tell how fresh their data is.
+
+The process running the sync tracks it in `sync_status`, which stores every
+change in the `ledger_sync` row. Other processes, like API workers when a
+dedicated ledger worker syncs, read the row with `stored_status`.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from enum import Enum
+from typing import TypedDict
+
+from sqlmodel import Session
+
+from app.core.db import engine
+from app.core.ledger_state import ledger_state
+from app.services.beancount.models import LedgerSync
+
+logger = logging.getLogger(__name__)
+
+
+class SyncPhase(str, Enum):
+    """Phases a sync goes through, in order."""
+
+    IDLE = "idle"
+    # Loading the ledger files
+    PARSE = "parse"
+    # Querying the ledger and building the rows
+    EXTRACT = "extract"
+    # Writing the rows, in a transaction readers don't see yet
+    LOAD = "load"
+    # Committing the tables and publishing the new version
+    SWAP = "swap"
+
+
+class SyncStatusSnapshot(TypedDict):
+    """State of the sync at a point in time."""
+
+    version: str | None
+    published_at: datetime | None
+    phase: SyncPhase
+    started_at: datetime | None
+    rows_processed: int
+    last_duration_seconds: float | None
+    last_finished_at: datetime | None
+    last_error: str | None
+    last_error_at: datetime | None
+
+
+def _datetime(timestamp: float | None) -> datetime | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+class SyncStatus:
+    """Phase and progress of the running sync, and outcome of the last one.
+
+    While idle, `rows_processed` is the row count of the last sync. Every
+    change of phase is passed to `on_change`.
+    """
+
+    def __init__(
+        self, on_change: Callable[[SyncStatusSnapshot], None] | None = None
+    ) -> None:
+        self.on_change = on_change
+        self._lock = threading.Lock()
+        self._phase = SyncPhase.IDLE
+        self._started_at: float | None = None
+        self._started: float = 0.0
+        self._rows_processed = 0
+        self._last_duration: float | None = None
+        self._last_finished_at: float | None = None
+        self._last_error: str | None = None
+        self._last_error_at: float | None = None
+
+    @property
+    def phase(self) -> SyncPhase:
+        return self._phase
+
+    def start(self, phase: SyncPhase) -> None:
+        """Start a sync in the given phase, or move on to it if one is running."""
+        with self._lock:
+            if self._phase == SyncPhase.IDLE:
+                self._started_at = time.time()
+                self._started = time.perf_counter()
+                self._rows_processed = 0
+            self._phase = phase
+        self._changed()
+
+    def enter(self, phase: SyncPhase) -> None:
+        """Move the running sync on to a phase.
+
+        Ignored while idle, so tables synced on their own aren't reported.
+        """
+        with self._lock:
+            if self._phase in (SyncPhase.IDLE, phase):
+                return
+            self._phase = phase
+        self._changed()
+
+    def add_rows(self, count: int) -> None:
+        """Count rows written by the running sync."""
+        with self._lock:
+            if self._phase != SyncPhase.IDLE:
+                self._rows_processed += count
+
+    def finish(self) -> None:
+        """Record the running sync as completed."""
+        with self._lock:
+            self._last_duration = time.perf_counter() - self._started
+            self._last_finished_at = time.time()
+            self._phase = SyncPhase.IDLE
+            self._started_at = None
+        self._changed()
+
+    def fail(self, error: Exception) -> None:
+        """Record the running sync as failed."""
+        with self._lock:
+            self._last_error = f"{type(error).__name__}: {error}"
+            self._last_error_at = time.time()
+            self._phase = SyncPhase.IDLE
+            self._started_at = None
+        self._changed()
+
+    def cancel(self) -> None:
+        """Stop the running sync without recording it, e.g. when nothing changed."""
+        with self._lock:
+            self._phase = SyncPhase.IDLE
+            self._started_at = None
+        self._changed()
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change(self.snapshot())
+
+    def snapshot(self) -> SyncStatusSnapshot:
+        """Return the current state, with the published ledger version."""
+        with self._lock:
+            return SyncStatusSnapshot(
+                version=ledger_state.version,
+                published_at=_datetime(ledger_state.published_at),
+                phase=self._phase,
+                started_at=_datetime(self._started_at),
+                rows_processed=self._rows_processed,
+                last_duration_seconds=self._last_duration,
+                last_finished_at=_datetime(self._last_finished_at),
+                last_error=self._last_error,
+                last_error_at=_datetime(self._last_error_at),
+            )
+
+
+# Unset only in a process that hasn't published or finished a sync yet, like
+# one just restarted, so the values stored before still hold
+_KEPT_WHILE_UNSET = (
+    "version",
+    "published_at",
+    "last_duration_seconds",
+    "last_finished_at",
+    "last_error",
+    "last_error_at",
+)
+
+
+def store_status(snapshot: SyncStatusSnapshot) -> None:
+    """Write the snapshot to the `ledger_sync` row; failures are only logged.
+
+    Unset outcome fields, like the version, keep their stored values.
+    """
+    try:
+        with Session(engine) as session:
+            row = session.get(LedgerSync, 1) or LedgerSync(id=1)
+            for name, value in {**snapshot, "phase": snapshot["phase"].value}.items():
+                if value is None and name in _KEPT_WHILE_UNSET:
+                    continue
+                setattr(row, name, value)
+            session.add(row)
+            session.commit()
+    except Exception as e:
+        logger.error(f"Storing the sync status failed: {str(e)}")
+
+
+def stored_status(session: Session) -> SyncStatusSnapshot | None:
+    """Read the status last stored by a syncing process, None before any."""
+    row = session.get(LedgerSync, 1)
+    if row is None:
+        return None
+    return SyncStatusSnapshot(
+        version=row.version,
+        published_at=row.published_at,
+        phase=SyncPhase(row.phase),
+        started_at=row.started_at,
+        rows_processed=row.rows_processed,
+        last_duration_seconds=row.last_duration_seconds,
+        last_finished_at=row.last_finished_at,
+        last_error=row.last_error,
+        last_error_at=row.last_error_at,
+    )
+
+
+sync_status = SyncStatus(on_change=store_status)
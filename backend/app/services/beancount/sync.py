@@ -1,25 +1,118 @@
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
-from sqlmodel import Session
+from sqlalchemy import text
+from sqlmodel import Session, delete
 
+from app.core.config import settings
+from app.core.ledger_state import ledger_state
+from app.core.metrics import (
+    SYNC_DURATION,
+    SYNC_ERRORS,
+    SYNC_ROWS,
+    SYNC_TABLE_DURATION,
+    SYNCS,
+)
+from app.domains.accounts.domain.models import Account, AccountClosure
+from app.domains.expenses_transactions.domain.models import (
+    Expense,
+    ExpenseMonthlyRollup,
+)
+from app.domains.income_transactions.domain.models import (
+    Income,
+    IncomeMonthlyRollup,
+)
 from app.ledger import Ledger
-from app.domains.expenses_transactions.domain.models import Expense
-from app.domains.income_transactions.domain.models import Income
+from app.services.beancount.accounts import build_account_tree
+from app.services.beancount.notifications import notify_version
+from app.services.beancount.precompute import precompute_results
+from app.services.beancount.rollup import refresh_monthly_rollup
+from app.services.beancount.status import SyncPhase, SyncStatus, sync_status
 
 logger = logging.getLogger(__name__)
 
+# Key of the Postgres advisory lock held while syncing, see `sync_lock`
+SYNC_LOCK_KEY = 7_315_601_024
+
+EXPENSES_QUERY = """
+SELECT
+    date AS date,
+    account AS account,
+    LEAF(ROOT(account, 2)) as category,
+    LEAF(ROOT(account, 3)) as subcategory,
+    payee AS payee,
+    narration AS narration,
+    NUMBER(CONVERT(POSITION, 'ARS', DATE)) AS amount_ars,
+    NUMBER(CONVERT(POSITION, 'USD', DATE)) AS amount_usd,
+    NUMBER(CONVERT(POSITION, 'CARS', DATE)) AS amount_cars,
+    tags
+WHERE account ~ '^Expenses'
+ORDER BY date DESC
+"""
+
+INCOME_QUERY = """
+SELECT
+    date AS date,
+    account AS account,
+    LEAF(ROOT(account, 3)) AS origin,
+    payee AS payee,
+    narration AS narration,
+    NUMBER(CONVERT(ABS(POSITION), 'ARS', DATE)) AS amount_ars,
+    NUMBER(CONVERT(ABS(POSITION), 'USD', DATE)) AS amount_usd,
+    NUMBER(CONVERT(ABS(POSITION), 'CARS', DATE)) AS amount_cars
+WHERE account ~ '^Income'
+ORDER BY date DESC
+"""
+
+
+@contextmanager
+def sync_lock(db: Session) -> Iterator[None]:
+    """Hold the sync's advisory lock, waiting for other processes to release it.
+
+    Every worker process syncs the ledger when it starts, and the tables are
+    replaced statement by statement, so concurrent syncs would trip over each
+    other's rows. The lock is held on its own connection, across the
+    commits of every table.
+    """
+    # A new connection of the engine, even when the session is bound to one
+    with db.get_bind().engine.connect() as connection:
+        connection.execute(
+            text("SELECT pg_advisory_lock(:key)"), {"key": SYNC_LOCK_KEY}
+        )
+        try:
+            yield
+        finally:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": SYNC_LOCK_KEY}
+            )
+
 
 class BeancountSyncService:
-    def __init__(self, ledger: Ledger, db_session: Session):
+    def __init__(
+        self,
+        ledger: Ledger,
+        db_session: Session,
+        status: SyncStatus = sync_status,
+        precompute: bool = True,
+    ):
         self.ledger = ledger
         self.db = db_session
+        self.status = status
+        # Off where nothing reads this process's result cache
+        self.precompute = precompute
 
     def _run_query_and_map(self, query: str, model_cls: type) -> list[Any]:
         """Execute Beancount query and map results to SQLModel instances."""
         res: tuple[list[tuple[str, type]], list[tuple]] = self.ledger.run_query(query)  # type: ignore
-        types, rows = res
+        return self._map_rows(*res, model_cls)
 
+    @staticmethod
+    def _map_rows(
+        types: list[tuple[str, type]], rows: list[tuple[Any, ...]], model_cls: type
+    ) -> list[Any]:
+        """Map the rows of a Beancount query to SQLModel instances."""
         col_names = [col[0] for col in types]
         logger.info(f"Loaded {len(rows)} rows. Columns: {col_names}")
 
@@ -36,51 +129,109 @@ class BeancountSyncService:
         logger.info(f"Mapped {len(mapped)} rows.")
         return mapped
 
-    def sync_table(self, query: str, model_cls: type) -> None:
-        """Sync a table by truncating existing data and loading fresh data."""
-        self.db.query(model_cls).delete()
-        self.db.commit()
-        objects = self._run_query_and_map(query, model_cls)
-        self.db.bulk_save_objects(objects)
-        self.db.commit()
+    def sync_table(
+        self, query: str, model_cls: type, rollup_cls: type | None = None
+    ) -> None:
+        """Sync a table by truncating existing data and loading fresh data.
+
+        The table and its monthly rollup are replaced in a single transaction,
+        so readers never see them empty or out of step with each other.
+        """
+        table = model_cls.__tablename__  # type: ignore[attr-defined]
+        with SYNC_TABLE_DURATION.labels(table=table).time():
+            self.status.enter(SyncPhase.EXTRACT)
+            objects = self._run_query_and_map(query, model_cls)
+            try:
+                self.status.enter(SyncPhase.LOAD)
+                self.db.exec(delete(model_cls))  # type: ignore[call-overload]
+                self.db.bulk_save_objects(objects)
+                if rollup_cls is not None:
+                    refresh_monthly_rollup(self.db, objects, rollup_cls)
+                self.status.enter(SyncPhase.SWAP)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+        SYNC_ROWS.labels(table=table).inc(len(objects))
+        self.status.add_rows(len(objects))
+
+    def sync_accounts(self) -> None:
+        """Sync the account tree and its closure table from Open/Close directives."""
+        with SYNC_TABLE_DURATION.labels(table=Account.__tablename__).time():
+            self.status.enter(SyncPhase.EXTRACT)
+            accounts, closure = build_account_tree(self.ledger.entries)
+            logger.info(f"Loaded {len(accounts)} accounts.")
+            try:
+                self.status.enter(SyncPhase.LOAD)
+                self.db.exec(delete(AccountClosure))  # type: ignore[call-overload]
+                self.db.exec(delete(Account))  # type: ignore[call-overload]
+                # Parents come first, so the parent_id references always resolve
+                self.db.bulk_save_objects(accounts)
+                self.db.bulk_save_objects(closure)
+                self.status.enter(SyncPhase.SWAP)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+        SYNC_ROWS.labels(table=Account.__tablename__).inc(len(accounts))
+        SYNC_ROWS.labels(table=AccountClosure.__tablename__).inc(len(closure))
+        self.status.add_rows(len(accounts) + len(closure))
 
     def sync_expenses(self) -> None:
         """Sync expenses from Beancount to database."""
-        query = """
-        SELECT
-            date AS date,
-            account AS account,
-            LEAF(ROOT(account, 2)) as category,
-            LEAF(ROOT(account, 3)) as subcategory,
-            payee AS payee,
-            narration AS narration,
-            NUMBER(CONVERT(POSITION, 'ARS', DATE)) AS amount_ars,
-            NUMBER(CONVERT(POSITION, 'USD', DATE)) AS amount_usd,
-            NUMBER(CONVERT(POSITION, 'CARS', DATE)) AS amount_cars,
-            tags
-        WHERE account ~ '^Expenses'
-        ORDER BY date DESC
-        """
-        self.sync_table(query, Expense)
+        self.sync_table(EXPENSES_QUERY, Expense, ExpenseMonthlyRollup)
 
     def sync_income(self) -> None:
         """Sync income from Beancount to database."""
-        query = """
-        SELECT
-            date AS date,
-            account AS account,
-            LEAF(ROOT(account, 3)) AS origin,
-            payee AS payee,
-            narration AS narration,
-            NUMBER(CONVERT(ABS(POSITION), 'ARS', DATE)) AS amount_ars,
-            NUMBER(CONVERT(ABS(POSITION), 'USD', DATE)) AS amount_usd,
-            NUMBER(CONVERT(ABS(POSITION), 'CARS', DATE)) AS amount_cars
-        WHERE account ~ '^Income'
-        ORDER BY date DESC
-        """
-        self.sync_table(query, Income)
+        self.sync_table(INCOME_QUERY, Income, IncomeMonthlyRollup)
 
     def sync_all(self) -> None:
-        """Sync all tables from Beancount to database."""
-        self.sync_expenses()
-        self.sync_income()
+        """Sync all tables from Beancount to database.
+
+        The ledger's version is published once every table is committed and
+        the common queries are precomputed for it. Syncs of other processes
+        wait for this one to finish. Its progress and outcome are recorded in
+        `status`.
+        """
+        SYNCS.inc()
+        self.status.start(SyncPhase.EXTRACT)
+        try:
+            with SYNC_ERRORS.count_exceptions(), SYNC_DURATION.time():
+                with sync_lock(self.db):
+                    self.sync_accounts()
+                    self.sync_expenses()
+                    self.sync_income()
+                self.status.enter(SyncPhase.SWAP)
+                if self.precompute:
+                    precompute_results(self.ledger.version, settings.PRECOMPUTE_QUERIES)
+            ledger_state.publish(self.ledger.version)
+        except Exception as e:
+            self.status.fail(e)
+            raise
+        self.status.finish()
+
+        # Other processes publish the version when notified
+        try:
+            notify_version(self.db, self.ledger.version)
+        except Exception as e:
+            logger.error(f"Notifying the synced ledger version failed: {str(e)}")
+
+    def sync_changes(self) -> bool:
+        """Reload the ledger from disk and sync it if its contents changed.
+
+        Returns:
+            True when a sync ran
+        """
+        self.status.start(SyncPhase.PARSE)
+        try:
+            reloaded = self.ledger.reload()
+        except Exception as e:
+            self.status.fail(e)
+            raise
+        if not reloaded and ledger_state.version == self.ledger.version:
+            logger.info("Ledger unchanged, skipping sync.")
+            self.status.cancel()
+            return False
+
+        self.sync_all()
+        return True
@@ -0,0 +1,144 @@
+"""Ledger parsing, syncing and watching in a dedicated process.
+
+With `LEDGER_WORKER`, API workers don't load the ledger: each starts a
+`LedgerWorker` process instead, and only one of those owns the ledger at a
+time, holding an advisory lock. The others wait on the lock and take over if
+the owner dies. The owner syncs the ledger, watches it for changes and
+notifies every process of the versions it syncs (see `notifications`).
+
+API workers then hold no beancount state, and start as soon as a version is
+stored in the database, whatever the ledger's size. The sync metrics are the
+owner's; it serves them on `LEDGER_WORKER_METRICS_PORT` when set.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from multiprocessing.process import BaseProcess
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.db import engine
+
+logger = logging.getLogger(__name__)
+
+# Key of the advisory lock held by the process owning the ledger
+WORKER_LOCK_KEY = 7_315_601_025
+
+
+def run(ledger_path: str, metrics_port: int | None = None) -> None:
+    """Entry point of the worker process: own the ledger until terminated.
+
+    The ledger is only loaded once the lock is taken, so waiting processes
+    stay small.
+    """
+    logging.basicConfig(level=logging.INFO)
+    with engine.connect() as connection:
+        logger.info("Waiting to own the ledger")
+        connection.execute(
+            text("SELECT pg_advisory_lock(:key)"), {"key": WORKER_LOCK_KEY}
+        )
+        connection.commit()
+
+        from prometheus_client import start_http_server
+
+        from app.ledger import Ledger
+        from app.services.beancount.handlers import LedgerWatcher
+        from app.services.beancount.sync import BeancountSyncService
+
+        if metrics_port:
+            start_http_server(metrics_port)
+        ledger = Ledger(ledger_path + "/main.bean")
+        sync_service = BeancountSyncService(ledger, Session(engine), precompute=False)
+        try:
+            sync_service.sync_all()
+        except Exception as e:
+            # Recorded in the sync status; the next change is synced again
+            logger.error(f"Error syncing data: {str(e)}")
+        LedgerWatcher(ledger_path, sync_service).start()
+        # The watcher's thread does the rest, until the process is terminated
+        threading.Event().wait()
+
+
+class LedgerWorker:
+    """The ledger worker process of an API worker, restarted if it dies."""
+
+    def __init__(self, ledger_path: str, restart_seconds: float = 5.0):
+        self.ledger_path = ledger_path
+        self.restart_seconds = restart_seconds
+        self.process: BaseProcess | None = None
+        self._stop = threading.Event()
+        self._monitor: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the process and a thread restarting it when it exits."""
+        if self._monitor:
+            return
+        self._stop.clear()
+        self._spawn()
+        self._monitor = threading.Thread(
+            target=self._watch, name="ledger-worker-monitor", daemon=True
+        )
+        self._monitor.start()
+
+    def stop(self) -> None:
+        """Terminate the process, releasing the ledger to another one."""
+        if not self._monitor:
+            return
+        self._stop.set()
+        self._monitor.join()
+        self._monitor = None
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join(timeout=30)
+            self.process = None
+        logger.info("Stopped the ledger worker")
+
+    def _spawn(self) -> None:
+        # Spawned rather than forked: the API worker's threads and
+        # connections must not be copied into it
+        context = multiprocessing.get_context("spawn")
+        self.process = context.Process(
+            target=run,
+            args=(self.ledger_path, settings.LEDGER_WORKER_METRICS_PORT),
+            name="ledger-worker",
+            daemon=True,
+        )
+        self.process.start()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.restart_seconds):
+            if self.process is not None and not self.process.is_alive():
+                logger.error(
+                    f"Ledger worker exited with code {self.process.exitcode}, "
+                    "restarting it"
+                )
+                self._spawn()
+
+
+async def wait_for_version(timeout: float, poll_seconds: float = 0.5) -> None:
+    """Wait until a synced version is stored, and publish it in this process.
+
+    A version stored by an earlier run is used right away, while the worker
+    syncs again; the listener publishes the new one if it changed.
+
+    Raises:
+        RuntimeError: If no version is stored within `timeout` seconds
+    """
+    from app.services.beancount.notifications import apply_version
+    from app.services.beancount.status import stored_status
+
+    deadline = time.monotonic() + timeout
+    while True:
+        with Session(engine) as session:
+            status = stored_status(session)
+        if status is not None and status["version"] is not None:
+            apply_version(status["version"])
+            return
+        if time.monotonic() > deadline:
+            raise RuntimeError("The ledger worker synced no version in time")
+        await asyncio.sleep(poll_seconds)
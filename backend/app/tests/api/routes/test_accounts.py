@@ -0,0 +1,283 @@
+import uuid
+from collections.abc import Generator
+from datetime import date
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, col, delete
+
+from app.core.config import settings
+from app.core.ledger_state import ledger_state
+from app.domains.expenses_transactions.domain.models import Expense
+from app.ledger import Ledger
+from app.services.beancount.accounts import account_id
+from app.services.beancount.sync import BeancountSyncService
+from app.tests.utils.transactions import create_expense
+
+LEDGER = """
+2020-01-01 open Assets:Bank:Checking USD,ARS
+2020-01-01 open Expenses:Food:Groceries
+2020-01-01 open Expenses:Food:Out:Pizza
+2020-01-01 open Expenses:Food-Delivery
+2020-01-01 open Expenses:FoodTruck
+2020-01-01 open Expenses:Home:Rent
+2021-06-01 close Expenses:Home:Rent
+"""
+
+
+@pytest.fixture
+def account_tree(
+    synced_db: Session,
+    tmp_path: Path,
+) -> Generator[None, None, None]:
+    ledger_file = tmp_path / "main.bean"
+    ledger_file.write_text(LEDGER)
+    BeancountSyncService(Ledger(str(ledger_file)), synced_db).sync_accounts()
+    ledger_state.publish(uuid.uuid4().hex)
+    yield
+    BeancountSyncService(
+        Ledger(settings.LEDGER_PATH + "/main.bean"), synced_db
+    ).sync_accounts()
+    ledger_state.publish(uuid.uuid4().hex)
+
+
+@pytest.fixture
+def expenses(
+    synced_db: Session,
+) -> Generator[None, None, None]:
+    create_expense(
+        synced_db, on=date(2098, 5, 3), amount_usd=2, account="Expenses:Zzfood"
+    )
+    create_expense(
+        synced_db,
+        on=date(2098, 5, 3),
+        amount_usd=10,
+        account="Expenses:Zzfood:Groceries",
+    )
+    create_expense(
+        synced_db,
+        on=date(2098, 5, 4),
+        amount_usd=5,
+        account="Expenses:Zzfood:Out:Pizza",
+    )
+    # Shares the "Expenses:Zzfood" prefix but is not part of its subtree
+    create_expense(
+        synced_db, on=date(2098, 5, 5), amount_usd=100, account="Expenses:ZzfoodTruck"
+    )
+    # Stand in for a sync, which publishes a new version once data changes
+    ledger_state.publish(uuid.uuid4().hex)
+    yield
+    synced_db.execute(
+        delete(Expense).where(col(Expense.account).like("Expenses:Zzfood%"))
+    )
+    synced_db.commit()
+    ledger_state.publish(uuid.uuid4().hex)
+
+
+@pytest.mark.usefixtures("expenses")
+def test_account_balance_matches_exact_subtree(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/Expenses:Zzfood/balance",
+        params={"as_of_date": "2099-01-01"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["balance"]["amount_usd"] == -17
+    assert content["totals"]["expenses"]["count"] == 3
+    assert content["breakdown"] is None
+
+
+@pytest.mark.usefixtures("expenses")
+def test_account_balance_breakdown(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/Expenses:Zzfood/balance",
+        params={"as_of_date": "2099-01-01", "depth": 1},
+    )
+    assert response.status_code == 200
+    breakdown = {
+        row["account_name"]: row["balance"]["amount_usd"]
+        for row in response.json()["breakdown"]
+    }
+    assert breakdown == {
+        "Expenses:Zzfood": -2,
+        "Expenses:Zzfood:Groceries": -10,
+        "Expenses:Zzfood:Out": -5,
+    }
+
+
+@pytest.mark.usefixtures("expenses")
+def test_account_balance_before_last_transaction(client: TestClient) -> None:
+    # Not covered by the in-memory tree, summed in the database instead
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/Expenses:Zzfood/balance",
+        params={"as_of_date": "2098-05-04", "depth": 1},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["balance"]["amount_usd"] == -12
+    breakdown = {
+        row["account_name"]: row["balance"]["amount_usd"]
+        for row in content["breakdown"]
+    }
+    assert breakdown == {"Expenses:Zzfood": -2, "Expenses:Zzfood:Groceries": -10}
+
+
+@pytest.mark.usefixtures("expenses")
+def test_account_transactions_match_exact_subtree(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/Expenses:Zzfood/transactions",
+        params={"from_date": "2098-01-01", "to_date": "2099-01-01"},
+    )
+    assert response.status_code == 200
+    accounts = {expense["account"] for expense in response.json()["expenses"]}
+    assert accounts == {
+        "Expenses:Zzfood",
+        "Expenses:Zzfood:Groceries",
+        "Expenses:Zzfood:Out:Pizza",
+    }
+
+
+def _names(content: dict) -> list[tuple[str, int]]:  # type: ignore[type-arg]
+    return [(node["name"], node["depth"]) for node in content["data"]]
+
+
+@pytest.mark.usefixtures("account_tree")
+def test_account_descendants(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/{account_id('Expenses')}/descendants"
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["account"]["name"] == "Expenses"
+    assert _names(content) == [
+        ("Expenses:Food", 1),
+        ("Expenses:Food:Groceries", 2),
+        ("Expenses:Food:Out", 2),
+        ("Expenses:Food:Out:Pizza", 3),
+        # After the whole Expenses:Food subtree, although "-" sorts before ":"
+        ("Expenses:Food-Delivery", 1),
+        ("Expenses:FoodTruck", 1),
+        ("Expenses:Home", 1),
+        ("Expenses:Home:Rent", 2),
+    ]
+    assert content["count"] == 8
+
+
+@pytest.mark.usefixtures("account_tree")
+def test_account_descendants_max_depth(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/{account_id('Expenses:Food')}/descendants",
+        params={"max_depth": 1},
+    )
+    assert response.status_code == 200
+    assert _names(response.json()) == [
+        ("Expenses:Food:Groceries", 1),
+        ("Expenses:Food:Out", 1),
+    ]
+
+
+@pytest.mark.usefixtures("account_tree")
+def test_account_ancestors(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/{account_id('Expenses:Food:Out:Pizza')}/ancestors"
+    )
+    assert response.status_code == 200
+    assert _names(response.json()) == [
+        ("Expenses", 3),
+        ("Expenses:Food", 2),
+        ("Expenses:Food:Out", 1),
+    ]
+
+
+@pytest.mark.usefixtures("account_tree")
+def test_accounts_follow_open_and_close(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/{account_id('Expenses:Home')}/children"
+    )
+    assert response.status_code == 200
+    [rent] = response.json()["data"]
+    assert rent["name"] == "Expenses:Home:Rent"
+    assert rent["is_active"] is False
+
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/{account_id('Assets:Bank:Checking')}/parent"
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "Assets:Bank"
+    assert response.json()["is_active"] is True
+
+
+def test_account_descendants_not_found(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/{account_id('Nope')}/descendants"
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.usefixtures("account_tree")
+def test_list_accounts(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/",
+        params={"name": "Expenses:Food", "sort_order": "desc"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert [account["name"] for account in content["data"]] == [
+        "Expenses:FoodTruck",
+        "Expenses:Food:Out:Pizza",
+        "Expenses:Food:Out",
+        "Expenses:Food:Groceries",
+        "Expenses:Food-Delivery",
+        "Expenses:Food",
+    ]
+    assert content["count"] == 6
+
+
+def _shape(node: dict) -> tuple:  # type: ignore[type-arg]
+    return (node["name"], [_shape(child) for child in node["children"]])
+
+
+@pytest.mark.usefixtures("account_tree")
+def test_account_tree(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/tree",
+        params={"root": "Expenses", "max_depth": 2},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    [expenses] = content["data"]
+    assert expenses["account"]["id"] == str(account_id("Expenses"))
+    assert expenses["balance"] is None
+    assert _shape(expenses) == (
+        "Expenses",
+        [
+            ("Expenses:Food", []),
+            ("Expenses:Food-Delivery", []),
+            ("Expenses:FoodTruck", []),
+            ("Expenses:Home", []),
+        ],
+    )
+    assert content["count"] == 5
+
+
+@pytest.mark.usefixtures("expenses")
+def test_account_tree_with_balances(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/tree",
+        params={"root": "Expenses:Zzfood", "with_balances": True},
+    )
+    assert response.status_code == 200
+    [food] = response.json()["data"]
+    assert food["balance"]["amount_usd"] == -17
+    assert food["totals"]["expenses"]["count"] == 3
+    assert [
+        (child["name"], child["balance"]["amount_usd"]) for child in food["children"]
+    ] == [("Expenses:Zzfood:Groceries", -10), ("Expenses:Zzfood:Out", -5)]
+
+
+def test_account_tree_unknown_root(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/accounts/tree", params={"root": "Nope:Nothing"}
+    )
+    assert response.status_code == 404
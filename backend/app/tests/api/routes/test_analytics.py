@@ -0,0 +1,137 @@
+from collections.abc import Generator
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+
+from app.core.config import settings
+from app.domains.expenses_transactions.domain.models import Expense
+from app.domains.income_transactions.domain.models import Income
+from app.tests.utils.transactions import (
+    create_expense,
+    create_income,
+    refresh_rollups,
+)
+
+
+@pytest.fixture
+def transactions(
+    synced_db: Session,
+) -> Generator[None, None, None]:
+    create_income(synced_db, on=date(2099, 1, 10), amount_usd=1000)
+    create_expense(synced_db, on=date(2099, 1, 15), amount_usd=200)
+    create_expense(synced_db, on=date(2099, 1, 20), amount_usd=50)
+    create_expense(synced_db, on=date(2099, 3, 2), amount_usd=30)
+    refresh_rollups(synced_db)
+    yield
+    synced_db.execute(delete(Expense).where(Expense.date >= date(2099, 1, 1)))  # type: ignore[arg-type]
+    synced_db.execute(delete(Income).where(Income.date >= date(2099, 1, 1)))  # type: ignore[arg-type]
+    synced_db.commit()
+    refresh_rollups(synced_db)
+
+
+@pytest.mark.usefixtures("transactions")
+def test_timeseries_monthly_fills_gaps(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/analytics/timeseries",
+        params={"from_date": "2099-01-01", "to_date": "2099-04-01"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["bucket"] == "month"
+    assert [point["bucket"] for point in content["data"]] == [
+        "2099-01-01",
+        "2099-02-01",
+        "2099-03-01",
+    ]
+    january, february, march = (point["metrics"] for point in content["data"])
+    assert january["income_usd"] == 1000
+    assert january["expenses_usd"] == 250
+    assert january["balance_usd"] == 750
+    assert january["ratio"] == 0.25
+    assert february == {
+        "income_usd": 0,
+        "expenses_usd": 0,
+        "balance_usd": 0,
+        "ratio": 0,
+    }
+    assert march["balance_usd"] == -30
+
+
+@pytest.mark.usefixtures("transactions")
+def test_timeseries_quarterly_multiple_currencies(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/analytics/timeseries",
+        params={
+            "from_date": "2099-01-01",
+            "to_date": "2099-07-01",
+            "bucket": "quarter",
+            "currencies": ["ARS", "USD"],
+        },
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert [point["bucket"] for point in content["data"]] == [
+        "2099-01-01",
+        "2099-04-01",
+    ]
+    first_quarter = content["data"][0]["metrics"]
+    assert first_quarter["expenses_ars"] == 280000
+    assert first_quarter["expenses_usd"] == 280
+
+
+@pytest.mark.usefixtures("transactions")
+def test_timeseries_weekly_starts_on_monday(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/analytics/timeseries",
+        params={"from_date": "2099-01-14", "to_date": "2099-01-21", "bucket": "week"},
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    # 2099-01-14 is a Wednesday
+    assert [point["bucket"] for point in data] == ["2099-01-12", "2099-01-19"]
+    assert data[0]["metrics"]["expenses_usd"] == 200
+    assert data[1]["metrics"]["expenses_usd"] == 50
+
+
+@pytest.mark.usefixtures("transactions")
+def test_timeseries_monthly_matches_raw_rows(client: TestClient) -> None:
+    # Whole months are read from the rollup, a partial month from raw rows
+    rollup = client.get(
+        f"{settings.API_V1_STR}/analytics/timeseries",
+        params={"from_date": "2099-01-01", "to_date": "2099-02-01"},
+    )
+    raw = client.get(
+        f"{settings.API_V1_STR}/analytics/timeseries",
+        params={"from_date": "2099-01-01", "to_date": "2099-01-31"},
+    )
+    assert rollup.status_code == raw.status_code == 200
+    assert rollup.json()["data"] == raw.json()["data"]
+
+
+@pytest.mark.usefixtures("transactions")
+def test_combined_metrics(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/analytics/combined",
+        params={"from_date": "2099-01-01", "to_date": "2099-04-01"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "metrics": {
+            "income_usd": 1000,
+            "expenses_usd": 280,
+            "balance_usd": 720,
+            "ratio": 0.28,
+        },
+        "period": {"from": "2099-01-01", "to": "2099-04-01"},
+    }
+
+
+def test_timeseries_invalid_currency(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/analytics/timeseries",
+        params={"from_date": "2099-01-01", "currencies": ["EUR"]},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid currency: EUR"
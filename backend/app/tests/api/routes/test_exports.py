@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+from collections.abc import Generator
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+
+from app.core.config import settings
+from app.domains.expenses_transactions.domain.models import Expense
+from app.domains.income_transactions.domain.models import Income
+from app.pkgs.export import ExportFormat, stream_rows
+from app.tests.utils.transactions import create_expense, create_income
+
+
+@pytest.fixture
+def transactions(
+    synced_db: Session,
+) -> Generator[None, None, None]:
+    create_expense(synced_db, on=date(2097, 3, 2), amount_usd=10)
+    create_expense(synced_db, on=date(2097, 3, 1), amount_usd=15)
+    create_expense(
+        synced_db, on=date(2097, 4, 1), amount_usd=7, account="Expenses:Home:Rent"
+    )
+    create_income(synced_db, on=date(2097, 3, 1), amount_usd=500)
+    yield
+    synced_db.execute(delete(Expense).where(Expense.date >= date(2097, 1, 1)))  # type: ignore[arg-type]
+    synced_db.execute(delete(Income).where(Income.date >= date(2097, 1, 1)))  # type: ignore[arg-type]
+    synced_db.commit()
+
+
+PARAMS = {"from_date": "2097-01-01", "to_date": "2098-01-01"}
+
+
+@pytest.mark.usefixtures("transactions")
+def test_export_expenses_as_csv(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/expenses/export", params=PARAMS)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+    assert "content-length" not in response.headers
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["date"] for row in rows] == ["2097-03-01", "2097-03-02", "2097-04-01"]
+    assert float(rows[0]["amount_usd"]) == 15
+    assert rows[0]["tags"] == ""
+
+
+@pytest.mark.usefixtures("transactions")
+def test_export_expenses_as_ndjson_filtered_by_account(client: TestClient) -> None:
+    params = {**PARAMS, "format": "ndjson", "account": "Expenses:Home"}
+    response = client.get(f"{settings.API_V1_STR}/expenses/export", params=params)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["account"] for row in rows] == ["Expenses:Home:Rent"]
+    assert rows[0]["date"] == "2097-04-01"
+
+
+@pytest.mark.usefixtures("transactions")
+def test_export_income(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/income/export", params=PARAMS)
+    assert response.status_code == 200
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [float(row["amount_usd"]) for row in rows] == [500]
+
+
+@pytest.mark.usefixtures("transactions")
+@pytest.mark.parametrize("export_format", ["arrow", "parquet"])
+def test_export_expenses_as_columnar(client: TestClient, export_format: str) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    params = {**PARAMS, "format": export_format}
+    response = client.get(f"{settings.API_V1_STR}/expenses/export", params=params)
+    assert response.status_code == 200
+
+    if export_format == "arrow":
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(response.content).read_all()
+    else:
+        table = pq.read_table(pa.BufferReader(response.content))
+
+    assert table.num_rows == 3
+    assert table.schema.field("date").type == pa.date32()
+    assert table.schema.field("tags").nullable
+    assert table.column("amount_usd").to_pylist() == [15, 10, 7]
+    assert all(isinstance(value, str) for value in table.column("id").to_pylist())
+
+
+def test_export_rejects_unknown_format(client: TestClient) -> None:
+    params = {**PARAMS, "format": "xml"}
+    response = client.get(f"{settings.API_V1_STR}/expenses/export", params=params)
+    assert response.status_code == 400
+
+
+def test_stream_rows_sends_header_first_and_chunks_rows() -> None:
+    rows = ((i, f"row {i}") for i in range(100))
+    chunks = list(stream_rows(rows, ["id", "name"], ExportFormat.CSV, chunk_size=256))
+
+    assert chunks[0] == b"id,name\r\n"
+    assert len(chunks) > 2
+    assert all(len(chunk) < 256 + 32 for chunk in chunks)
+    assert b"".join(chunks).count(b"\r\n") == 101
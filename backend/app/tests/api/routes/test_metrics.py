@@ -0,0 +1,48 @@
+from unittest.mock import Mock
+
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from watchdog.events import FileModifiedEvent
+
+from app.core.config import settings
+from app.services.beancount.handlers import LedgerChangeHandler
+
+
+def test_metrics_expose_request_and_sync_metrics(client: TestClient) -> None:
+    client.get(f"{settings.API_V1_STR}/accounts/Expenses/balance")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'findash_http_request_duration_seconds_count{method="GET",'
+        'route="/api/v1/accounts/{account_name}/balance",status="200"}'
+    ) in response.text
+    for name in (
+        "findash_ledger_parse_duration_seconds_count",
+        'findash_sync_table_duration_seconds_count{table="expense"}',
+        'findash_sync_rows_total{table="income"}',
+        "findash_result_cache_hit_ratio",
+        'findash_db_pool_connections{state="checked_out"}',
+        "findash_ledger_version_info{version=",
+        "findash_ledger_age_seconds",
+    ):
+        assert name in response.text
+
+
+def test_metrics_are_not_in_the_api_schema(client: TestClient) -> None:
+    schema = client.get(f"{settings.API_V1_STR}/openapi.json").json()
+    assert "/metrics" not in schema["paths"]
+
+
+def test_watcher_events_are_counted() -> None:
+    before = REGISTRY.get_sample_value("findash_watcher_events_total") or 0
+    sync_service = Mock()
+    sync_service.sync_changes.return_value = False
+    handler = LedgerChangeHandler(sync_service)
+
+    handler.on_modified(FileModifiedEvent("/ledger/main.bean"))
+    handler.on_modified(FileModifiedEvent("/ledger/notes.txt"))
+
+    assert REGISTRY.get_sample_value("findash_watcher_events_total") == before + 1
+    assert REGISTRY.get_sample_value("findash_watcher_last_event_timestamp_seconds")
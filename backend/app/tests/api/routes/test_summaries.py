@@ -0,0 +1,86 @@
+from collections.abc import Generator
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+
+from app.core.config import settings
+from app.domains.expenses_transactions.domain.models import Expense
+from app.domains.income_transactions.domain.models import Income
+from app.tests.utils.transactions import (
+    create_expense,
+    create_income,
+    refresh_rollups,
+)
+
+
+@pytest.fixture
+def transactions(
+    synced_db: Session,
+) -> Generator[None, None, None]:
+    create_expense(synced_db, on=date(2098, 5, 3), amount_usd=10)
+    create_expense(synced_db, on=date(2098, 5, 28), amount_usd=15)
+    create_expense(
+        synced_db, on=date(2098, 6, 1), amount_usd=7, account="Expenses:Home:Rent"
+    )
+    create_income(synced_db, on=date(2098, 5, 1), amount_usd=500)
+    create_income(
+        synced_db, on=date(2098, 6, 1), amount_usd=300, account="Income:Freelance:Foo"
+    )
+    refresh_rollups(synced_db)
+    yield
+    synced_db.execute(delete(Expense).where(Expense.date >= date(2098, 1, 1)))  # type: ignore[arg-type]
+    synced_db.execute(delete(Income).where(Income.date >= date(2098, 1, 1)))  # type: ignore[arg-type]
+    synced_db.commit()
+    refresh_rollups(synced_db)
+
+
+def _by_group(content: dict) -> dict[str, float]:  # type: ignore[type-arg]
+    return {row["group"]: row["amount_usd"] for row in content["data"]}
+
+
+@pytest.mark.usefixtures("transactions")
+@pytest.mark.parametrize(
+    "group_by, expected",
+    [
+        ("category", {"Food": 25, "Home": 7}),
+        ("subcategory", {"Food.Groceries": 25, "Home.Rent": 7}),
+        ("month", {"2098-05-01": 25, "2098-06-01": 7}),
+    ],
+)
+def test_expense_summary_from_rollup(
+    client: TestClient, group_by: str, expected: dict[str, float]
+) -> None:
+    params = {"from_date": "2098-05-01", "to_date": "2098-07-01", "group_by": group_by}
+    response = client.get(f"{settings.API_V1_STR}/expenses/summary", params=params)
+    assert response.status_code == 200
+    assert _by_group(response.json()) == expected
+
+    # A range not aligned to months falls back to the raw rows
+    params["to_date"] = "2098-06-30"
+    response = client.get(f"{settings.API_V1_STR}/expenses/summary", params=params)
+    assert response.status_code == 200
+    assert _by_group(response.json()) == expected
+
+
+@pytest.mark.usefixtures("transactions")
+@pytest.mark.parametrize(
+    "group_by, expected",
+    [
+        ("origin", {"Acme": 500, "Foo": 300}),
+        ("month", {"2098-05-01": 500, "2098-06-01": 300}),
+    ],
+)
+def test_income_summary_from_rollup(
+    client: TestClient, group_by: str, expected: dict[str, float]
+) -> None:
+    params = {"from_date": "2098-05-01", "to_date": "2098-07-01", "group_by": group_by}
+    response = client.get(f"{settings.API_V1_STR}/income/summary", params=params)
+    assert response.status_code == 200
+    assert _by_group(response.json()) == expected
+
+    params["to_date"] = "2098-06-30"
+    response = client.get(f"{settings.API_V1_STR}/income/summary", params=params)
+    assert response.status_code == 200
+    assert _by_group(response.json()) == expected
@@ -0,0 +1,86 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes.sync import version_events
+from app.core.config import settings
+from app.core.ledger_events import ledger_events
+from app.core.ledger_state import ledger_state
+from app.services.beancount.status import SyncPhase, SyncStatus
+from app.services.beancount.sync import BeancountSyncService
+
+
+def test_sync_status_reports_the_startup_sync(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/sync/status")
+    assert response.status_code == 200
+    status = response.json()
+    assert status["version"] == ledger_state.version
+    assert status["published_at"] is not None
+    assert status["phase"] == "idle"
+    assert status["started_at"] is None
+    assert status["rows_processed"] > 0
+    assert status["last_duration_seconds"] > 0
+    assert status["last_finished_at"] is not None
+
+
+def test_sync_status_tracks_phases_and_rows() -> None:
+    status = SyncStatus()
+    status.enter(SyncPhase.LOAD)
+    status.add_rows(5)
+    assert status.phase == SyncPhase.IDLE
+    assert status.snapshot()["rows_processed"] == 0
+
+    status.start(SyncPhase.PARSE)
+    status.enter(SyncPhase.LOAD)
+    status.add_rows(5)
+    snapshot = status.snapshot()
+    assert snapshot["phase"] == SyncPhase.LOAD
+    assert snapshot["started_at"] is not None
+    assert snapshot["rows_processed"] == 5
+
+    status.finish()
+    snapshot = status.snapshot()
+    assert snapshot["phase"] == SyncPhase.IDLE
+    assert snapshot["rows_processed"] == 5
+    assert snapshot["last_duration_seconds"] is not None
+
+
+def test_failed_sync_is_recorded() -> None:
+    status = SyncStatus()
+    ledger = Mock()
+    ledger.reload.side_effect = RuntimeError("unreadable ledger")
+    service = BeancountSyncService(ledger, Mock(), status=status)
+
+    with pytest.raises(RuntimeError):
+        service.sync_changes()
+
+    snapshot = status.snapshot()
+    assert snapshot["phase"] == SyncPhase.IDLE
+    assert snapshot["last_error"] == "RuntimeError: unreadable ledger"
+    assert snapshot["last_error_at"] is not None
+    assert snapshot["last_finished_at"] is None
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("client")
+async def test_version_events_stream_every_published_version() -> None:
+    events = version_events(None, heartbeat=0.05)
+    first = await events.__anext__()
+    assert first.startswith(f"id: {ledger_state.version}\nevent: version\n")
+
+    ledger_events.publish("next-version")
+    assert (await events.__anext__()).startswith("id: next-version\n")
+    assert await events.__anext__() == ": heartbeat\n\n"
+    assert ledger_events.subscribers == 1
+
+    await events.aclose()
+    assert ledger_events.subscribers == 0
+
+
+@pytest.mark.anyio
+@pytest.mark.usefixtures("client")
+async def test_version_events_skip_the_version_the_client_has() -> None:
+    events = version_events(ledger_state.version, heartbeat=0.05)
+    assert await events.__anext__() == ": heartbeat\n\n"
+    await events.aclose()
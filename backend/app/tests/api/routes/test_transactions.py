@@ -0,0 +1,81 @@
+from collections.abc import Generator
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+
+from app.core.config import settings
+from app.domains.expenses_transactions.domain.models import Expense
+from app.domains.expenses_transactions.usecases import provide_get_expenses_usecase
+from app.domains.income_transactions.domain.models import Income
+from app.domains.income_transactions.usecases import provide_get_incomes_usecase
+from app.tests.utils.transactions import create_expense, create_income
+
+
+@pytest.fixture
+def transactions(
+    synced_db: Session,
+) -> Generator[None, None, None]:
+    create_expense(synced_db, on=date(2096, 3, 2), amount_usd=10.5)
+    create_expense(
+        synced_db, on=date(2096, 4, 1), amount_usd=7, account="Expenses:Home:Rent"
+    )
+    create_income(synced_db, on=date(2096, 3, 1), amount_usd=500)
+    yield
+    synced_db.execute(delete(Expense).where(Expense.date >= date(2096, 1, 1)))  # type: ignore[arg-type]
+    synced_db.execute(delete(Income).where(Income.date >= date(2096, 1, 1)))  # type: ignore[arg-type]
+    synced_db.commit()
+
+
+PARAMS: dict[str, str | int] = {
+    "from_date": "2096-01-01",
+    "to_date": "2097-01-01",
+    "skip": 0,
+    "limit": 10,
+}
+
+
+@pytest.mark.usefixtures("transactions")
+def test_expense_list_matches_the_model_response(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/expenses/", params=PARAMS)
+    assert response.status_code == 200
+
+    expected = provide_get_expenses_usecase().execute(
+        from_date=date(2096, 1, 1), to_date=date(2097, 1, 1), skip=0, limit=10
+    )
+    assert response.json() == expected.model_dump(mode="json")
+    assert response.json()["count"] == 2
+
+
+@pytest.mark.usefixtures("transactions")
+def test_income_list_matches_the_model_response(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/income/", params=PARAMS)
+    assert response.status_code == 200
+
+    expected = provide_get_incomes_usecase().execute(
+        from_date=date(2096, 1, 1), to_date=date(2097, 1, 1), skip=0, limit=10
+    )
+    assert response.json() == expected.model_dump(mode="json")
+    assert "account_path" not in response.json()["data"][0]
+
+
+@pytest.mark.usefixtures("transactions")
+def test_expense_list_returns_requested_fields(client: TestClient) -> None:
+    params = {**PARAMS, "fields": "amount_usd, date,amount_usd"}
+    response = client.get(f"{settings.API_V1_STR}/expenses/", params=params)
+    assert response.status_code == 200
+
+    content = response.json()
+    assert content["count"] == 2
+    assert sorted(content["data"], key=lambda item: item["date"]) == [
+        {"date": "2096-03-02", "amount_usd": 10.5},
+        {"date": "2096-04-01", "amount_usd": 7},
+    ]
+
+
+def test_list_rejects_unknown_fields(client: TestClient) -> None:
+    params = {**PARAMS, "fields": "date,secret"}
+    response = client.get(f"{settings.API_V1_STR}/income/", params=params)
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
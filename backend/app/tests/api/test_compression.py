@@ -0,0 +1,166 @@
+import gzip
+import zlib
+from collections.abc import Iterator
+
+import anyio
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+from starlette.types import Message
+
+from app.api.middleware import CompressionMiddleware
+from app.api.middleware.compression import (
+    available_encodings,
+    is_compressible,
+    negotiate_encoding,
+)
+from app.core.config import settings
+
+LARGE = {"rows": [{"date": "2024-01-01", "amount_usd": i} for i in range(200)]}
+
+
+def _stream() -> Iterator[bytes]:
+    for i in range(50):
+        yield f"{i},2024-01-01,{i * 10}\n".encode()
+
+
+@pytest.fixture
+def small_app() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/large")
+    def large() -> JSONResponse:
+        return JSONResponse(LARGE, headers={"etag": '"abc"'})
+
+    @app.get("/small")
+    def small() -> JSONResponse:
+        return JSONResponse({"ok": True})
+
+    @app.get("/export")
+    def export() -> StreamingResponse:
+        return StreamingResponse(_stream(), media_type="text/csv")
+
+    @app.get("/parquet")
+    def parquet() -> Response:
+        return Response(b"PAR1" * 1000, media_type="application/vnd.apache.parquet")
+
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=["gzip"],
+        minimum_size=500,
+        route_levels={"/export": {"gzip": 1}},
+    )
+    return TestClient(app)
+
+
+def test_negotiate_encoding() -> None:
+    encodings = ("zstd", "br", "gzip")
+    assert negotiate_encoding("gzip, deflate, br", encodings) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", encodings) == "gzip"
+    assert negotiate_encoding("*;q=0.1, gzip;q=0", encodings) == "zstd"
+    assert negotiate_encoding("identity", encodings) is None
+    assert negotiate_encoding("", encodings) is None
+
+
+def test_available_encodings() -> None:
+    assert available_encodings(["gzip"]) == ("gzip",)
+    with pytest.raises(ValueError):
+        available_encodings(["deflate"])
+
+
+def test_is_compressible() -> None:
+    assert is_compressible("application/json")
+    assert is_compressible("text/csv; charset=utf-8")
+    assert is_compressible("application/problem+json")
+    assert not is_compressible("application/vnd.apache.parquet")
+    assert not is_compressible("text/event-stream")
+    assert not is_compressible("")
+
+
+def test_large_response_is_compressed(small_app: TestClient) -> None:
+    response = small_app.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == LARGE
+
+
+def test_small_or_unaccepted_responses_are_not_compressed(
+    small_app: TestClient,
+) -> None:
+    response = small_app.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+    response = small_app.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"abc"'
+
+
+def test_already_compressed_formats_are_not_compressed(
+    small_app: TestClient,
+) -> None:
+    response = small_app.get("/parquet", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert len(response.content) == 4000
+
+
+@pytest.mark.anyio
+async def test_streaming_response_is_compressed_chunk_by_chunk() -> None:
+    middleware = CompressionMiddleware(
+        StreamingResponse(_stream(), media_type="text/csv"), encodings=["gzip"]
+    )
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/export",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        await anyio.sleep_forever()
+        raise AssertionError("unreachable")
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+
+    headers = Headers(raw=messages[0]["headers"])
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    chunks = [message["body"] for message in messages[1:]]
+    assert len(chunks) > 1
+
+    # Every chunk is flushed, so it can be decompressed as soon as it arrives
+    decompressor = zlib.decompressobj(31)
+    assert decompressor.decompress(chunks[0]) == b"0,2024-01-01,0\n"
+    assert gzip.decompress(b"".join(chunks)) == b"".join(_stream())
+
+
+def test_route_levels_override_the_default_level() -> None:
+    middleware = CompressionMiddleware(
+        FastAPI(),
+        encodings=["gzip"],
+        levels={"gzip": 6},
+        route_levels={"/api/export": {"gzip": 1}, "/api/export/big": {"gzip": 9}},
+    )
+    assert middleware.level_for("/api/items", "gzip") == 6
+    assert middleware.level_for("/api/export", "gzip") == 1
+    assert middleware.level_for("/api/export/big", "gzip") == 9
+
+
+def test_app_compresses_exports(client: TestClient) -> None:
+    params = {"from_date": "2023-01-01", "to_date": "2024-01-01"}
+    response = client.get(
+        f"{settings.API_V1_STR}/expenses/export",
+        params=params,
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text.startswith("id,")
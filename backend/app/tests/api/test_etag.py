@@ -0,0 +1,91 @@
+import uuid
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.middleware import etag as etag_middleware
+from app.api.routes import analytics
+from app.core.config import settings
+from app.core.ledger_state import ledger_state
+
+URL = f"{settings.API_V1_STR}/analytics/timeseries"
+PARAMS = {"from_date": "2098-01-01", "to_date": "2098-03-01", "bucket": "month"}
+
+
+@pytest.fixture
+def version() -> str:
+    version = uuid.uuid4().hex
+    ledger_state.publish(version)
+    return version
+
+
+# The app first, so its startup sync doesn't publish over the version
+pytestmark = pytest.mark.usefixtures("client", "version")
+
+
+def test_response_has_etag(client: TestClient) -> None:
+    response = client.get(URL, params=PARAMS)
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_matching_etag_skips_the_route(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    etag = client.get(URL, params=PARAMS).headers["etag"]
+
+    def fail() -> None:
+        raise AssertionError("the route should not run")
+
+    monkeypatch.setattr(analytics, "provide_timeseries_usecase", fail)
+    response = client.get(URL, params=PARAMS, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    response = client.get(
+        URL, params=PARAMS, headers={"If-None-Match": f'"other", W/{etag}'}
+    )
+    assert response.status_code == 304
+
+
+def test_etag_ignores_query_parameter_order(client: TestClient) -> None:
+    etag = client.get(URL, params=PARAMS).headers["etag"]
+    reordered = dict(reversed(list(PARAMS.items())))
+    assert client.get(URL, params=reordered).headers["etag"] == etag
+    other = {**PARAMS, "bucket": "quarter"}
+    assert client.get(URL, params=other).headers["etag"] != etag
+
+
+def test_new_ledger_version_changes_etag(client: TestClient) -> None:
+    etag = client.get(URL, params=PARAMS).headers["etag"]
+
+    ledger_state.publish(uuid.uuid4().hex)
+    response = client.get(URL, params=PARAMS, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_new_day_changes_etag(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    etag = client.get(URL, params=PARAMS).headers["etag"]
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls) -> "Tomorrow":
+            return cls(2099, 1, 1)
+
+    # Routes defaulting their end date to today answer differently
+    monkeypatch.setattr(etag_middleware, "date", Tomorrow)
+    response = client.get(URL, params=PARAMS, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_other_routes_have_no_etag(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/utils/health-check/")
+    assert response.status_code == 200
+    assert "etag" not in response.headers
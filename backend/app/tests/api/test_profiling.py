@@ -0,0 +1,102 @@
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.types import Scope
+
+from app.api.middleware import ProfilingMiddleware
+from app.api.middleware.profiling import requested_format
+from app.core.config import settings
+
+BALANCE = f"{settings.API_V1_STR}/accounts/Expenses/balance"
+
+
+def busy_route_body() -> None:
+    deadline = time.perf_counter() + 0.1
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.fixture
+def small_app() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/busy")
+    def busy() -> dict[str, bool]:
+        busy_route_body()
+        return {"ok": True}
+
+    app.add_middleware(ProfilingMiddleware, interval=0.001, authorize=lambda _: None)
+    return TestClient(app)
+
+
+def _scope(
+    query_string: bytes = b"", headers: list[tuple[bytes, bytes]] | None = None
+) -> Scope:
+    return {"type": "http", "query_string": query_string, "headers": headers or []}
+
+
+def test_requested_format() -> None:
+    assert requested_format(_scope()) is None
+    assert requested_format(_scope(b"profiled=1")) is None
+    assert requested_format(_scope(b"profile")) == "speedscope"
+    assert requested_format(_scope(b"a=1&profile=folded")) == "folded"
+    assert requested_format(_scope(headers=[(b"x-profile", b"1")])) == "speedscope"
+    with pytest.raises(ValueError):
+        requested_format(_scope(b"profile=callgrind"))
+
+
+def test_sync_route_is_sampled_in_its_worker_thread(small_app: TestClient) -> None:
+    response = small_app.get("/busy", params={"profile": "folded"})
+    assert response.status_code == 200
+    assert response.headers["x-profiled-status"] == "200"
+    assert response.headers["cache-control"] == "no-store"
+    assert "busy_route_body (test_profiling.py:" in response.text
+
+
+def test_speedscope_profile(small_app: TestClient) -> None:
+    response = small_app.get("/busy", headers={"X-Profile": "speedscope"})
+    profile = response.json()
+    frames = {frame["name"] for frame in profile["shared"]["frames"]}
+    assert "busy_route_body" in frames
+    assert profile["profiles"][0]["name"] == "GET /busy"
+    assert profile["profiles"][0]["samples"]
+
+
+def test_unprofiled_request_is_untouched(small_app: TestClient) -> None:
+    response = small_app.get("/busy")
+    assert response.json() == {"ok": True}
+    assert "x-profiled-status" not in response.headers
+
+
+def test_profiling_requires_a_superuser(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers: dict[str, str],
+) -> None:
+    assert client.get(BALANCE, params={"profile": 1}).status_code == 401
+    response = client.get(
+        BALANCE, params={"profile": 1}, headers=normal_user_token_headers
+    )
+    assert response.status_code == 403
+
+    response = client.get(
+        BALANCE, params={"profile": 1}, headers=superuser_token_headers
+    )
+    assert response.status_code == 200
+    assert response.headers["x-profiled-status"] == "200"
+    assert "profiles" in response.json()
+
+
+def test_profiling_skips_the_etag(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    etag = client.get(BALANCE, headers=superuser_token_headers).headers["etag"]
+    response = client.get(
+        BALANCE,
+        headers={**superuser_token_headers, "X-Profile": "1", "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["x-profiled-status"] == "200"
+    assert "etag" not in response.headers
@@ -0,0 +1,51 @@
+from datetime import date
+
+import pytest
+
+from app.benchmarks.api import (
+    Endpoint,
+    _free_port,
+    count_statements,
+    drive,
+    hot_endpoints,
+    percentile,
+)
+from app.benchmarks.ledger_generator import LedgerSpec
+
+
+def test_percentile() -> None:
+    latencies = [i / 1000 for i in range(1, 101)]
+    assert round(percentile(latencies, 50), 2) == 50.5
+    assert round(percentile(latencies, 99), 2) == 99.01
+    assert percentile([0.002], 95) == 2
+    assert percentile([], 95) == 0
+
+
+def test_hot_endpoints_span_the_ledger() -> None:
+    endpoints = hot_endpoints(LedgerSpec(start=date(2023, 1, 1), years=1))
+    assert len(endpoints) == 5
+    expenses = endpoints[0]
+    assert len(expenses.params) == 12
+    assert expenses.params[1]["from_date"] == "2023-02-01"
+    assert expenses.params[1]["to_date"] == "2023-02-28"
+
+
+@pytest.mark.usefixtures("client")
+def test_count_statements() -> None:
+    endpoints = hot_endpoints(LedgerSpec(start=date(2023, 1, 1), years=1))
+    statements = count_statements(endpoints)
+    assert set(statements) == {endpoint.name for endpoint in endpoints}
+    # The list page counts its rows and fetches them
+    assert statements["expenses"] == 2
+
+
+@pytest.mark.anyio
+async def test_drive_counts_failed_requests_as_errors() -> None:
+    # Nothing listens on the port, so every request fails to connect
+    base_url = f"http://127.0.0.1:{_free_port()}"
+    endpoint = Endpoint("expenses", "/api/v1/expenses/", [{}])
+    latencies, errors, _elapsed = await drive(
+        base_url, endpoint, concurrency=2, duration=0.2
+    )
+    assert errors > 0
+    assert len(latencies) == errors
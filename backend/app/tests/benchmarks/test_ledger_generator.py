@@ -0,0 +1,57 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+from beancount.core.data import Price, Transaction
+
+from app.benchmarks.ledger_generator import LedgerSpec, generate_ledger
+from app.ledger import Ledger
+
+SPEC = LedgerSpec(postings=2000, years=2, start=date(2022, 1, 1), seed=7)
+
+
+def test_generated_ledger_loads_without_errors(tmp_path: Path) -> None:
+    generated = generate_ledger(tmp_path, SPEC)
+    assert [path.name for path in generated.files] == [
+        "main.bean",
+        "accounts.bean",
+        "prices.bean",
+        "transactions-2022.bean",
+        "transactions-2023.bean",
+    ]
+
+    ledger = Ledger(str(generated.main))
+    assert ledger.errors == []
+    transactions = [e for e in ledger.entries if isinstance(e, Transaction)]
+    assert len(transactions) == generated.transactions
+    assert sum(len(t.postings) for t in transactions) == generated.postings
+    assert generated.postings >= SPEC.postings
+
+    currencies = {
+        (p.currency, p.amount.currency) for p in ledger.entries if isinstance(p, Price)
+    }
+    assert currencies == {
+        ("USD", "ARS"),
+        ("USD", "CARS"),
+        ("ARS", "USD"),
+        ("ARS", "CARS"),
+    }
+    assert any(t.tags for t in transactions)
+    # Expense accounts are `depth` levels below Expenses
+    accounts = {p.account for t in transactions for p in t.postings}
+    assert {a.count(":") for a in accounts if a.startswith("Expenses:")} == {SPEC.depth}
+
+
+def test_same_seed_writes_the_same_ledger(tmp_path: Path) -> None:
+    first = generate_ledger(tmp_path / "first", SPEC)
+    second = generate_ledger(tmp_path / "second", SPEC)
+    other = generate_ledger(tmp_path / "other", LedgerSpec(postings=2000, seed=8))
+
+    contents = [path.read_bytes() for path in first.files]
+    assert [path.read_bytes() for path in second.files] == contents
+    assert [path.read_bytes() for path in other.files] != contents
+
+
+def test_rejects_a_too_shallow_tree(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        generate_ledger(tmp_path, LedgerSpec(depth=1))
@@ -0,0 +1,22 @@
+import pytest
+from sqlmodel import Session, func, select
+
+from app.benchmarks.sync import benchmark_size, compare
+from app.domains.expenses_transactions.domain.models import Expense
+
+
+def test_benchmark_size_reports_every_stage_and_leaves_the_data(
+    db: Session, capsys: pytest.CaptureFixture[str]
+) -> None:
+    count = select(func.count()).select_from(Expense)
+    before = db.exec(count).one()
+
+    results = benchmark_size(postings=300, seed=0, repeat=1)
+
+    assert [r["stage"] for r in results] == ["load", "query", "map", "sync_table"]
+    assert all(r["seconds"] > 0 and r["peak_rss_mb"] > 0 for r in results)
+    assert results[0]["rows"] >= 300
+    assert db.exec(count).one() == before
+
+    compare(results, results)
+    assert "+0.0%" in capsys.readouterr().out
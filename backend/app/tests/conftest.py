@@ -12,6 +12,12 @@ from app.tests.utils.user import authentication_token_from_email
 from app.tests.utils.utils import get_superuser_token_headers
 
 
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run the anyio tests on asyncio only, the loop uvicorn serves the app on."""
+    return "asyncio"
+
+
 @pytest.fixture(scope="session", autouse=True)
 def db() -> Generator[Session, None, None]:
     with Session(engine) as session:
@@ -30,6 +36,16 @@ def client() -> Generator[TestClient, None, None]:
         yield c
 
 
+@pytest.fixture(scope="module")
+def synced_db(request: pytest.FixtureRequest, db: Session) -> Session:
+    """The database session, once the app has started and synced the ledger.
+
+    For fixtures adding rows, which the startup sync would otherwise replace.
+    """
+    request.getfixturevalue("client")
+    return db
+
+
 @pytest.fixture(scope="module")
 def superuser_token_headers(client: TestClient) -> dict[str, str]:
     return get_superuser_token_headers(client)
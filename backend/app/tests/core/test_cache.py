@@ -0,0 +1,102 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cache import ResultCache, result_cache
+from app.core.config import settings
+from app.core.ledger_state import ledger_state
+from app.domains.analytics.service import AnalyticsService
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def version() -> str:
+    version = uuid.uuid4().hex
+    ledger_state.publish(version)
+    return version
+
+
+def test_hit_reuses_the_result() -> None:
+    cache = ResultCache(max_entries=4, ttl_seconds=60)
+    calls = []
+
+    def compute() -> list[int]:
+        calls.append(1)
+        return [1, 2, 3]
+
+    assert cache.get_or_compute("ns", ("a",), compute) == [1, 2, 3]
+    assert cache.get_or_compute("ns", ("a",), compute) == [1, 2, 3]
+    cache.get_or_compute("other", ("a",), compute)
+    assert len(calls) == 2
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+    assert stats["hit_ratio"] == pytest.approx(1 / 3)
+    assert stats["approx_bytes"] > 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = ResultCache(max_entries=2, ttl_seconds=60)
+    cache.get_or_compute("ns", "a", lambda: "a")
+    cache.get_or_compute("ns", "b", lambda: "b")
+    cache.get_or_compute("ns", "a", lambda: "stale")  # "a" is now most recent
+    cache.get_or_compute("ns", "c", lambda: "c")
+
+    assert cache.get_or_compute("ns", "a", lambda: "new") == "a"
+    assert cache.get_or_compute("ns", "b", lambda: "new") == "new"
+    assert cache.stats()["evictions"] == 2
+
+
+def test_entries_expire() -> None:
+    clock = FakeClock()
+    cache = ResultCache(max_entries=4, ttl_seconds=10, clock=clock)
+    cache.get_or_compute("ns", "a", lambda: "old")
+
+    clock.now = 11
+    assert cache.get_or_compute("ns", "a", lambda: "new") == "new"
+    assert cache.stats()["entries"] == 1
+
+
+def test_new_version_clears_the_cache() -> None:
+    result_cache.get_or_compute("ns", "a", lambda: "old")
+    ledger_state.publish(uuid.uuid4().hex)
+
+    assert result_cache.get_or_compute("ns", "a", lambda: "new") == "new"
+
+
+def test_repeated_request_is_served_from_the_cache(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    url = f"{settings.API_V1_STR}/analytics/combined"
+    params = {"from_date": "2097-01-01", "to_date": "2097-02-01"}
+    first = client.get(url, params=params)
+    assert first.status_code == 200
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("the totals should come from the cache")
+
+    monkeypatch.setattr(AnalyticsService, "get_totals", fail)
+    second = client.get(url, params=params)
+    assert second.json() == first.json()
+
+
+def test_cache_stats_requires_superuser(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers: dict[str, str],
+) -> None:
+    url = f"{settings.API_V1_STR}/utils/cache-stats/"
+    response = client.get(url, headers=normal_user_token_headers)
+    assert response.status_code == 403
+
+    response = client.get(url, headers=superuser_token_headers)
+    assert response.status_code == 200
+    assert response.json()["max_entries"] == settings.RESULT_CACHE_MAX_ENTRIES
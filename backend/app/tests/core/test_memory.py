@@ -0,0 +1,60 @@
+import sys
+import tracemalloc
+from collections import namedtuple
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.memory import deep_sizeof, tracemalloc_snapshots
+
+Pair = namedtuple("Pair", ["left", "right"])
+
+
+def test_deep_sizeof_counts_shared_objects_once() -> None:
+    shared = "x" * 1000
+    pair = Pair([shared], {"key": shared})
+    alone = deep_sizeof(shared)
+    assert deep_sizeof(pair) < 2 * alone
+    assert deep_sizeof(pair) > alone + sys.getsizeof(pair)
+
+    seen: set[int] = set()
+    deep_sizeof(shared, seen)
+    assert deep_sizeof(pair, seen) < alone
+
+
+def test_tracemalloc_report_lists_growth_since_the_previous_one() -> None:
+    assert tracemalloc_snapshots.report(5) is None
+    tracemalloc.start()
+    try:
+        first = tracemalloc_snapshots.report(5)
+        assert first is not None and first["growth"] == []
+        kept = [bytearray(1024) for _ in range(1000)]
+        second = tracemalloc_snapshots.report(5)
+    finally:
+        tracemalloc.stop()
+    assert second is not None
+    assert "test_memory.py" in second["growth"][0]["location"]
+    assert second["growth"][0]["bytes"] >= 1024 * 1000
+    del kept
+
+
+def test_memory_report_requires_superuser(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers: dict[str, str],
+) -> None:
+    url = f"{settings.API_V1_STR}/utils/memory/"
+    response = client.get(url, headers=normal_user_token_headers)
+    assert response.status_code == 403
+
+    response = client.get(url, headers=superuser_token_headers)
+    assert response.status_code == 200
+    report = response.json()
+    assert report["rss_bytes"] > 0
+    ledger = report["ledger"]
+    assert ledger["entries"]["count"] > 0
+    assert "Transaction" in ledger["entries_by_type"]
+    assert ledger["entries"]["bytes"] >= sum(
+        size["bytes"] for size in ledger["entries_by_type"].values()
+    )
+    assert report["tracemalloc"] is None
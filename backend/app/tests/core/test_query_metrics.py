@@ -0,0 +1,93 @@
+import logging
+import re
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session, func, select
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.query_metrics import track_queries
+from app.models import User
+
+SLEEP = text("SELECT pg_sleep(:seconds)")
+
+
+def test_track_queries_counts_statements(db: Session) -> None:
+    db.execute(text("SELECT 1"))
+    with track_queries() as stats:
+        db.execute(text("SELECT 1"))
+        db.execute(SLEEP, {"seconds": 0.01})
+    assert stats.statements == 2
+    assert stats.seconds >= 0.01
+
+
+def test_response_has_server_timing(client: TestClient) -> None:
+    params = {"from_date": "2023-01-01", "to_date": "2024-01-01"}
+    response = client.get(f"{settings.API_V1_STR}/expenses/", params=params)
+    assert response.status_code == 200
+    match = re.fullmatch(
+        r'db;dur=[\d.]+;desc="(\d+) statements", app;dur=[\d.]+',
+        response.headers["server-timing"],
+    )
+    assert match
+    # The page and its count
+    assert int(match.group(1)) == 2
+
+
+@pytest.fixture
+def explain_slow_queries(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> pytest.LogCaptureFixture:
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 10)
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN", True)
+    caplog.set_level(logging.WARNING, logger="app.core.query_metrics")
+    return caplog
+
+
+def test_slow_selects_are_logged_with_their_analyzed_plan(
+    db: Session, explain_slow_queries: pytest.LogCaptureFixture
+) -> None:
+    db.execute(text("SELECT 1"))
+    slow_select = select(User.id).where(func.pg_sleep(0.02).is_not(None)).limit(1)
+    db.exec(slow_select).all()
+
+    slow, plan = (record.getMessage() for record in explain_slow_queries.records)
+    assert "pg_sleep" in slow
+    assert "actual time" in plan
+    # The transaction is still usable after the EXPLAIN
+    assert db.execute(text("SELECT 2")).scalar() == 2
+
+
+def test_slow_text_statements_are_only_planned(
+    db: Session, explain_slow_queries: pytest.LogCaptureFixture
+) -> None:
+    db.execute(SLEEP, {"seconds": 0.02})
+
+    slow, plan = (record.getMessage() for record in explain_slow_queries.records)
+    assert "'seconds': 0.02" in slow
+    assert "Result" in plan
+    assert "actual time" not in plan
+
+
+def test_explaining_a_slow_advisory_lock_does_not_take_it_again(
+    explain_slow_queries: pytest.LogCaptureFixture,
+) -> None:
+    lock = text("SELECT pg_advisory_lock(:key)")
+    unlock = text("SELECT pg_advisory_unlock(:key)")
+    params = {"key": 7_315_601_099}
+    with engine.connect() as holder, engine.connect() as waiter:
+        holder.execute(lock, params)
+        # Released while the waiter waits for it, making its lock slow
+        timer = threading.Timer(0.05, lambda: holder.execute(unlock, params))
+        timer.start()
+        waiter.execute(lock, params)
+        timer.join()
+        waiter.commit()
+
+        assert len(explain_slow_queries.records) == 2
+        assert waiter.execute(unlock, params).scalar()
+        # Held once only
+        assert not waiter.execute(unlock, params).scalar()
@@ -0,0 +1,77 @@
+from datetime import date
+
+from app.domains.accounts.domain.models import Account
+from app.domains.accounts.domain.tree import AccountTreeIndex
+
+
+def _row(account: str, amount_usd: float, count: int, last: date) -> tuple:  # type: ignore[type-arg]
+    return (account, amount_usd * 1000, amount_usd, amount_usd * 1000, count, last)
+
+
+def _index() -> AccountTreeIndex:
+    accounts = [
+        Account(name=name, type=name.split(":")[0], currency="USD")
+        for name in ("Expenses:Food", "Expenses:Food:Groceries", "Income:Salary")
+    ]
+    expense_rows = [
+        _row("Expenses:Food", 2, 1, date(2024, 1, 1)),
+        _row("Expenses:Food:Groceries", 10, 3, date(2024, 2, 1)),
+        # Only known from its transactions
+        _row("Expenses:Food:Out:Pizza", 5, 1, date(2024, 3, 1)),
+    ]
+    income_rows = [_row("Income:Salary", 100, 2, date(2024, 1, 15))]
+    return AccountTreeIndex.build(
+        "v1", date(2023, 1, 1), accounts, income_rows, expense_rows
+    )
+
+
+def test_subtree_totals_are_summed_bottom_up() -> None:
+    index = _index()
+
+    assert [root.name for root in index.roots] == ["Expenses", "Income"]
+    food = index.get("Expenses:Food")
+    assert food is not None
+    assert food.expenses.amount_usd == 17
+    assert food.expenses.count == 5
+    assert food.own_expenses.amount_usd == 2
+    assert index.roots[0].expenses.amount_usd == 17
+    assert index.roots[1].income.amount_usd == 100
+    assert [node.name for node in food.walk()] == [
+        "Expenses:Food",
+        "Expenses:Food:Groceries",
+        "Expenses:Food:Out",
+        "Expenses:Food:Out:Pizza",
+    ]
+
+
+def test_nodes_without_account_rows_are_created() -> None:
+    index = _index()
+
+    pizza = index.get("Expenses:Food:Out:Pizza")
+    assert pizza is not None
+    assert pizza.account is None
+    food = index.get("Expenses:Food")
+    assert food is not None and food.account is not None
+    assert index.get_by_id(food.account.id) is food
+
+
+def test_breakdown_matches_group_by_ancestor() -> None:
+    index = _index()
+    food = index.get("Expenses:Food")
+    assert food is not None
+
+    parts = index.breakdown(food, 1)
+
+    assert [(name, expenses.amount_usd) for name, _, expenses in parts] == [
+        ("Expenses:Food", 2),
+        ("Expenses:Food:Groceries", 10),
+        ("Expenses:Food:Out", 5),
+    ]
+
+
+def test_covers_only_ranges_including_every_transaction() -> None:
+    index = _index()
+
+    assert index.covers(date(2023, 1, 1), date(2024, 3, 2))
+    assert not index.covers(date(2023, 1, 1), date(2024, 3, 1))
+    assert not index.covers(date(2022, 1, 1), date(2030, 1, 1))
@@ -0,0 +1,139 @@
+"""Check that the hot transaction queries are served by the composite indexes."""
+
+from datetime import date
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.domains.expenses_transactions.domain import options as expense_opts
+from app.domains.expenses_transactions.domain.models import Expense
+from app.domains.expenses_transactions.repository.builders import (
+    search as expense_search,
+)
+from app.domains.income_transactions.domain import options as income_opts
+from app.domains.income_transactions.domain.models import Income
+from app.domains.income_transactions.repository.builders import (
+    search as income_search,
+)
+
+SEED_ROWS = {
+    "expense": """
+        INSERT INTO expense (id, date, account, category, subcategory,
+                             narration, amount_ars, amount_usd, amount_cars)
+        SELECT md5(random()::text || i)::uuid,
+               date '2015-01-01' + i % 3650,
+               'Expenses:' || category || ':' || subcategory,
+               category, subcategory, 'seed', 1, 1, 1
+        FROM generate_series(1, 20000) AS i,
+             LATERAL (SELECT (CASE i % 40 WHEN 0 THEN 'Food' WHEN 1 THEN 'FoodTruck'
+                                     ELSE 'Category' || i % 40 END) AS category,
+                             (ARRAY['Groceries', 'Rent', 'Fuel'])[1 + i % 3] AS subcategory) AS names
+    """,
+    "income": """
+        INSERT INTO income (id, date, account, origin,
+                            narration, amount_ars, amount_usd, amount_cars)
+        SELECT md5(random()::text || i)::uuid,
+               date '2015-01-01' + i % 3650,
+               'Income:' || kind || ':' || origin,
+               origin, 'seed', 1, 1, 1
+        FROM generate_series(1, 20000) AS i,
+             LATERAL (SELECT (CASE i % 40 WHEN 0 THEN 'Salary' WHEN 1 THEN 'SalaryBonus'
+                                     ELSE 'Kind' || i % 40 END) AS kind,
+                             (ARRAY['Acme', 'Initech', 'Globex', 'Umbrella'])[1 + i % 4] AS origin) AS names
+    """,
+}
+
+
+def explain(db: Session, table: str, query: Any) -> str:
+    """Return the plan of `query` over a realistically sized table.
+
+    The table is seeded and analyzed inside a transaction that is rolled back,
+    so the planner sees production-like statistics without leaving data behind.
+    """
+    compiled = query.compile(dialect=db.get_bind().dialect)
+    try:
+        db.execute(text(SEED_ROWS[table]))
+        db.execute(text(f"ANALYZE {table}"))
+        connection = db.connection()
+        rows = connection.exec_driver_sql(f"EXPLAIN {compiled}", compiled.params)
+        return "\n".join(row[0] for row in rows)
+    finally:
+        db.rollback()
+
+
+@pytest.mark.parametrize(
+    "filters, index",
+    [
+        (
+            # Account balances and listings: a subtree over several years
+            expense_opts.SearchFilters(
+                from_date=date(2018, 1, 1),
+                to_date=date(2024, 1, 1),
+                account="Expenses:Food",
+            ),
+            "ix_expense_account_path_date",
+        ),
+        (
+            # Dashboard widgets: a category over a single month
+            expense_opts.SearchFilters(
+                from_date=date(2023, 3, 1),
+                to_date=date(2023, 4, 1),
+                category="Food",
+                subcategory="Groceries",
+            ),
+            "ix_expense_date_category_subcategory",
+        ),
+    ],
+)
+def test_expense_filters_use_composite_indexes(
+    db: Session, filters: expense_opts.SearchFilters, index: str
+) -> None:
+    query = expense_search.build_filtered_search(select(Expense), filters)
+    assert index in explain(db, "expense", query)
+
+
+@pytest.mark.parametrize(
+    "filters, index",
+    [
+        (
+            income_opts.SearchFilters(
+                from_date=date(2018, 1, 1),
+                to_date=date(2024, 1, 1),
+                account="Income:Salary",
+            ),
+            "ix_income_account_path_date",
+        ),
+        (
+            income_opts.SearchFilters(
+                from_date=date(2023, 3, 1),
+                to_date=date(2023, 4, 1),
+                origin="Acme",
+            ),
+            "ix_income_date_origin",
+        ),
+    ],
+)
+def test_income_filters_use_composite_indexes(
+    db: Session, filters: income_opts.SearchFilters, index: str
+) -> None:
+    query = income_search.build_filtered_search(select(Income), filters)
+    assert index in explain(db, "income", query)
+
+
+def test_projected_expense_list_uses_an_index_only_scan(db: Session) -> None:
+    # A chart widget asking for `fields=date,amount_usd` over a month
+    filters = expense_opts.SearchFilters(
+        from_date=date(2023, 3, 1), to_date=date(2023, 4, 1)
+    )
+    # Selected the way the repository projects the requested fields
+    columns = [getattr(Expense, column) for column in ("date", "amount_usd")]
+    query = expense_search.build_filtered_search(select(*columns), filters)
+    # Freshly seeded rows aren't marked all-visible until a VACUUM, which
+    # can't run in the rolled-back transaction; rule out the heap-based plans
+    # to check that the covering index can answer the query on its own
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    db.execute(text("SET LOCAL enable_bitmapscan = off"))
+    plan = explain(db, "expense", query)
+    assert "Index Only Scan using ix_expense_date_category_subcategory" in plan
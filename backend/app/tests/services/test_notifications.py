@@ -0,0 +1,29 @@
+import threading
+
+from sqlmodel import Session
+
+from app.core.db import engine
+from app.services.beancount.notifications import VersionListener, notify_version
+
+
+def test_listener_publishes_notified_versions(db: Session) -> None:
+    received: list[str] = []
+    published = threading.Event()
+
+    def publish(version: str) -> None:
+        received.append(version)
+        published.set()
+
+    listener = VersionListener(
+        engine.url.set(drivername="postgresql").render_as_string(hide_password=False),
+        publish=publish,
+    )
+    listener.start()
+    try:
+        assert listener.wait_listening(timeout=10)
+        notify_version(db, "synced-elsewhere")
+        assert published.wait(timeout=10)
+    finally:
+        listener.stop()
+
+    assert received == ["synced-elsewhere"]
@@ -0,0 +1,69 @@
+import uuid
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.ledger_state import ledger_state
+from app.domains.accounts.service import provide_account_tree_service
+from app.domains.analytics.service import AnalyticsService
+from app.services.beancount.precompute import _months_back, precompute_results
+
+
+def test_months_back() -> None:
+    assert _months_back(date(2024, 3, 15), 0) == date(2024, 3, 1)
+    assert _months_back(date(2024, 3, 15), 11) == date(2023, 4, 1)
+    assert _months_back(date(2024, 1, 31), 1) == date(2023, 12, 1)
+
+
+def test_staged_version_is_local_to_the_context() -> None:
+    published = uuid.uuid4().hex
+    ledger_state.publish(published)
+
+    staged = uuid.uuid4().hex
+    with ledger_state.staged(staged):
+        assert ledger_state.version == staged
+    assert ledger_state.version == published
+
+
+def test_precomputed_results_serve_the_first_request(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ledger_state.publish(uuid.uuid4().hex)
+    version = uuid.uuid4().hex
+    precompute_results(
+        version, ["year_to_date", "top_level_balances", "unknown"], date.today()
+    )
+    with ledger_state.staged(version):
+        index = provide_account_tree_service().get_index()
+    ledger_state.publish(version)
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("the totals should have been precomputed")
+
+    monkeypatch.setattr(AnalyticsService, "get_totals", fail)
+    params = {"from_date": date(date.today().year, 1, 1).isoformat()}
+    response = client.get(f"{settings.API_V1_STR}/analytics/combined", params=params)
+    assert response.status_code == 200
+
+    # The tree built while precomputing is kept once the version is published
+    assert index.version == version
+    assert provide_account_tree_service().get_index() is index
+
+
+@pytest.mark.usefixtures("client")
+def test_staged_tree_does_not_replace_the_published_one() -> None:
+    service = provide_account_tree_service()
+    ledger_state.publish(uuid.uuid4().hex)
+    published = service.get_index()
+
+    version = uuid.uuid4().hex
+    with ledger_state.staged(version):
+        staged = service.get_index()
+        assert service.get_index() is staged
+    # Requests still reading the published version keep its tree
+    assert service.get_index() is published
+
+    ledger_state.publish(version)
+    assert service.get_index() is staged
@@ -0,0 +1,23 @@
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.db import engine
+from app.services.beancount.sync import SYNC_LOCK_KEY, sync_lock
+
+TRY_LOCK = text("SELECT pg_try_advisory_lock(:key)")
+UNLOCK = text("SELECT pg_advisory_unlock(:key)")
+
+
+def test_sync_lock_excludes_other_processes(db: Session) -> None:
+    with sync_lock(db), engine.connect() as other:
+        assert not other.execute(TRY_LOCK, {"key": SYNC_LOCK_KEY}).scalar()
+
+    with engine.connect() as other:
+        assert other.execute(TRY_LOCK, {"key": SYNC_LOCK_KEY}).scalar()
+        other.execute(UNLOCK, {"key": SYNC_LOCK_KEY})
+
+
+def test_sync_lock_with_a_session_bound_to_a_connection() -> None:
+    with engine.connect() as connection, Session(connection) as session:
+        with sync_lock(session), engine.connect() as other:
+            assert not other.execute(TRY_LOCK, {"key": SYNC_LOCK_KEY}).scalar()
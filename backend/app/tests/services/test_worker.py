@@ -0,0 +1,93 @@
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.ledger_state import ledger_state
+from app.services.beancount import status
+from app.services.beancount.models import LedgerSync
+from app.services.beancount.worker import (
+    WORKER_LOCK_KEY,
+    LedgerWorker,
+    wait_for_version,
+)
+
+
+def _last_finished_at() -> datetime | None:
+    with Session(engine) as session:
+        stored = status.stored_status(session)
+    return stored["last_finished_at"] if stored else None
+
+
+def test_restarted_process_keeps_the_stored_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with Session(engine) as session:
+        original = session.get(LedgerSync, 1)
+        if original is not None:
+            session.expunge(original)
+    monkeypatch.setattr(ledger_state, "_version", "before-restart")
+    monkeypatch.setattr(ledger_state, "_published_at", time.time())
+    status.store_status(status.SyncStatus().snapshot())
+    with Session(engine) as session:
+        stored = status.stored_status(session)
+    assert stored is not None and stored["version"] == "before-restart"
+
+    # A fresh process starting its first sync hasn't published a version
+    monkeypatch.setattr(ledger_state, "_version", None)
+    monkeypatch.setattr(ledger_state, "_published_at", None)
+    restarted = status.SyncStatus(on_change=status.store_status)
+    restarted.start(status.SyncPhase.PARSE)
+    try:
+        with Session(engine) as session:
+            after = status.stored_status(session)
+        assert after is not None
+        assert after["phase"] == status.SyncPhase.PARSE
+        assert after["version"] == stored["version"]
+        assert after["published_at"] == stored["published_at"]
+        assert after["last_finished_at"] == stored["last_finished_at"]
+    finally:
+        with Session(engine) as session:
+            if original is None:
+                session.delete(session.get(LedgerSync, 1))
+            else:
+                session.merge(original)
+            session.commit()
+
+
+def test_worker_syncs_once_it_owns_the_ledger() -> None:
+    before = _last_finished_at()
+    worker = LedgerWorker(settings.LEDGER_PATH)
+    with engine.connect() as owner:
+        owner.execute(text("SELECT pg_advisory_lock(:key)"), {"key": WORKER_LOCK_KEY})
+        worker.start()
+        try:
+            time.sleep(3)
+            assert worker.process is not None and worker.process.is_alive()
+            assert _last_finished_at() == before
+        finally:
+            owner.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": WORKER_LOCK_KEY}
+            )
+
+    try:
+        deadline = time.monotonic() + 60
+        while _last_finished_at() == before and time.monotonic() < deadline:
+            time.sleep(0.5)
+        assert _last_finished_at() != before
+    finally:
+        worker.stop()
+    assert worker.process is None
+
+
+@pytest.mark.anyio
+async def test_wait_for_version_times_out_without_a_stored_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(status, "stored_status", lambda _session: None)
+    with pytest.raises(RuntimeError):
+        await wait_for_version(timeout=0.1, poll_seconds=0.05)
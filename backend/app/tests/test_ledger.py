@@ -0,0 +1,79 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from beancount.loader import load_file
+
+from app import ledger as ledger_module
+from app.ledger import Ledger, source_version
+
+OPEN = "2024-01-01 open Assets:Cash\n"
+
+
+@pytest.fixture
+def ledger_file(tmp_path: Path) -> Path:
+    main = tmp_path / "main.bean"
+    main.write_text(OPEN)
+    return main
+
+
+@pytest.fixture
+def parses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Paths passed to `load_file`, one per parse."""
+    paths: list[str] = []
+
+    def counting_load_file(path: str) -> Any:
+        paths.append(path)
+        return load_file(path)
+
+    monkeypatch.setattr(ledger_module, "load_file", counting_load_file)
+    return paths
+
+
+def test_reload_skips_unchanged_sources(ledger_file: Path, parses: list[str]) -> None:
+    ledger = Ledger(str(ledger_file))
+    version = ledger.version
+
+    assert not ledger.reload()
+    assert ledger.version == version
+    assert len(parses) == 1
+
+    ledger_file.write_text(OPEN + "2024-01-01 open Assets:Bank\n")
+    assert ledger.reload()
+    assert len(parses) == 2
+    assert len(ledger.entries) == 2
+
+
+def test_reload_parses_again_when_saved_during_the_parse(
+    ledger_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ledger = Ledger(str(ledger_file))
+    ledger_file.write_text(OPEN + "2024-01-01 open Assets:Bank\n")
+    saved = OPEN + "2024-01-01 open Assets:Bank\n2024-01-01 open Assets:Card\n"
+
+    def load_file_then_save(path: str) -> Any:
+        result = load_file(path)
+        if ledger_file.read_text() != saved:
+            ledger_file.write_text(saved)
+        return result
+
+    monkeypatch.setattr(ledger_module, "load_file", load_file_then_save)
+    assert ledger.reload()
+    # The entries match the version: the saved file's
+    assert len(ledger.entries) == 3
+    assert ledger.version == source_version(ledger.sources)
+
+
+def test_reload_after_an_included_file_is_removed(ledger_file: Path) -> None:
+    included = ledger_file.parent / "a.bean"
+    included.write_text("2024-01-01 open Assets:Bank\n")
+    ledger_file.write_text(OPEN + 'include "a.bean"\n')
+    ledger = Ledger(str(ledger_file))
+    assert len(ledger.entries) == 2
+
+    included.unlink()
+    ledger_file.write_text(OPEN)
+    assert ledger.reload()
+    assert len(ledger.entries) == 1
+    assert ledger.sources == [str(ledger_file)]
+    assert not ledger.reload()
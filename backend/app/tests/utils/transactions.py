@@ -0,0 +1,73 @@
+import uuid
+from datetime import date
+
+from sqlmodel import Session, select
+
+from app.core.ledger_state import ledger_state
+from app.domains.expenses_transactions.domain.models import (
+    Expense,
+    ExpenseMonthlyRollup,
+)
+from app.domains.income_transactions.domain.models import (
+    Income,
+    IncomeMonthlyRollup,
+)
+from app.services.beancount.rollup import refresh_monthly_rollup
+
+
+def create_expense(
+    db: Session,
+    *,
+    on: date,
+    amount_usd: float,
+    account: str = "Expenses:Food:Groceries",
+) -> Expense:
+    _, category, subcategory = (account.split(":") + ["", ""])[:3]
+    expense = Expense(
+        date=on,
+        account=account,
+        category=category,
+        subcategory=subcategory,
+        narration="test expense",
+        amount_ars=amount_usd * 1000,
+        amount_usd=amount_usd,
+        amount_cars=amount_usd * 1000,
+    )
+    db.add(expense)
+    db.commit()
+    db.refresh(expense)
+    return expense
+
+
+def create_income(
+    db: Session,
+    *,
+    on: date,
+    amount_usd: float,
+    account: str = "Income:Salary:Acme",
+) -> Income:
+    income = Income(
+        date=on,
+        account=account,
+        origin=account.split(":")[-1],
+        narration="test income",
+        amount_ars=amount_usd * 1000,
+        amount_usd=amount_usd,
+        amount_cars=amount_usd * 1000,
+    )
+    db.add(income)
+    db.commit()
+    db.refresh(income)
+    return income
+
+
+def refresh_rollups(db: Session) -> None:
+    """Rebuild the monthly rollups from the rows currently in the database.
+
+    A new ledger version is published afterwards, as the sync does, so cached
+    results and the account tree pick up the rows.
+    """
+    refresh_monthly_rollup(db, db.exec(select(Expense)).all(), ExpenseMonthlyRollup)
+    refresh_monthly_rollup(db, db.exec(select(Income)).all(), IncomeMonthlyRollup)
+    db.commit()
+    ledger_state.publish(uuid.uuid4().hex)